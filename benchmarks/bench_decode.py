@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+PARA_TEXT 디코딩 처리량 벤치마크
+
+텍스트 위주 합성 섹션에서 문단 디코더와 섹션 본문 추출의 처리량(MB/s)을
+측정합니다.
+
+    python benchmarks/bench_decode.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from hwp_hwpx_parser import ExtractOptions, HWP5Reader  # noqa: E402
+from hwp_hwpx_parser.hwp5 import HWPTAG_PARA_TEXT  # noqa: E402
+from synthetic import text_dense_section  # noqa: E402
+
+
+def best_of(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    data = text_dense_section(2000)
+    reader = HWP5Reader("synthetic.hwp")
+    options = ExtractOptions()
+    records = reader._parse_records(data)
+    paragraphs = [
+        records.data(i)
+        for i, tag_id in enumerate(records.tags)
+        if tag_id == HWPTAG_PARA_TEXT
+    ]
+    text_bytes = sum(len(para) for para in paragraphs)
+
+    def decode_plain():
+        for para in paragraphs:
+            reader._decode_paragraph_plain(para)
+
+    def extract_section():
+        reader._reset_counters()
+        reader._extract_section_text(records, options)
+
+    print(f"{len(paragraphs)} paragraphs, {text_bytes / 1e6:.1f} MB of PARA_TEXT")
+    print(f"{'case':>16} {'seconds':>10} {'MB/s':>8}")
+    for name, func in (
+        ("decode_plain", decode_plain),
+        ("extract_text", extract_section),
+    ):
+        seconds = best_of(func)
+        print(f"{name:>16} {seconds:>10.4f} {text_bytes / seconds / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+추출 처리량/메모리 벤치마크
+
+합성 HWP 5.0/HWPX 문서(문단, 중첩 표, 각주, 메모, 그림)를 만들어 형식별로
+``extract_text``, ``get_tables``, ``get_images``, ``extract_text_with_notes``의
+처리량(파일 크기 기준 MB/s)과 최대 RSS를 측정합니다. 측정마다 새 프로세스를
+띄우므로 최대 RSS는 그 작업 하나의 값입니다. ``--output``으로 결과를 JSON으로
+남기고 ``--compare``로 이전 결과와 비교해 릴리스 사이 회귀를 추적합니다.
+
+    python benchmarks/bench_extract.py --preset medium --output bench.json
+    python benchmarks/bench_extract.py --compare bench.json --tables 50 --depth 3
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "..", "src"))
+sys.path.insert(0, BENCH_DIR)
+
+from synthetic import DocumentSpec, write_hwp5, write_hwpx  # noqa: E402
+
+OPERATIONS = ("extract_text", "get_tables", "get_images", "extract_text_with_notes")
+WRITERS = {"hwp": write_hwp5, "hwpx": write_hwpx}
+
+PRESETS = {
+    "small": DocumentSpec(
+        paragraphs=200, tables=10, footnotes=20, memos=5, images=3, image_bytes=16384
+    ),
+    "medium": DocumentSpec(),
+    "large": DocumentSpec(
+        paragraphs=10000,
+        tables=200,
+        table_depth=2,
+        footnotes=500,
+        memos=100,
+        images=40,
+        image_bytes=256 * 1024,
+        sections=4,
+    ),
+}
+
+
+def _peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _in_new_process(func, *args):
+    # 최대 RSS는 fork/exec로 물려받으므로 부모는 작게 두고 문서 생성과 측정을
+    # 모두 새(spawn) 프로세스에서 한다
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(1, mp_context=context) as executor:
+        return executor.submit(func, *args).result()
+
+
+def _run(path: str, operation: str, repeat: int) -> Dict[str, object]:
+    """새 프로세스에서 ``operation``을 ``repeat``번 실행해 최소 시간을 잰다"""
+    from hwp_hwpx_parser import Reader
+
+    baseline = _peak_rss_kb()
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with Reader(path) as reader:
+            result = getattr(reader, operation)()
+        best = min(best, time.perf_counter() - start)
+        count = _count(operation, result)
+        del result
+    return {
+        "seconds": best,
+        "items": count,
+        "peak_rss_kb": _peak_rss_kb(),
+        "baseline_rss_kb": baseline,
+    }
+
+
+def _count(operation: str, result) -> int:
+    if operation == "extract_text":
+        return len(result)
+    if operation == "extract_text_with_notes":
+        return len(result.footnotes) + len(result.memos)
+    return len(result)
+
+
+def _expected(spec: DocumentSpec, operation: str) -> Optional[int]:
+    if operation == "get_tables":
+        return spec.tables_with_nested
+    if operation == "get_images":
+        return spec.images
+    if operation == "extract_text_with_notes":
+        return spec.footnotes + spec.memos
+    return None
+
+
+def run_benchmarks(
+    spec: DocumentSpec, formats: List[str], repeat: int, workdir: str
+) -> List[Dict[str, object]]:
+    results = []
+    for fmt in formats:
+        path = os.path.join(workdir, f"synthetic.{fmt}")
+        _in_new_process(WRITERS[fmt], path, spec)
+        size = os.path.getsize(path)
+        for operation in OPERATIONS:
+            measured = _in_new_process(_run, path, operation, repeat)
+            expected = _expected(spec, operation)
+            if expected is not None and measured["items"] != expected:
+                raise AssertionError(
+                    f"{fmt} {operation}: expected {expected} items, "
+                    f"got {measured['items']}"
+                )
+            seconds = measured["seconds"]
+            results.append(
+                {
+                    "format": fmt,
+                    "operation": operation,
+                    "file_bytes": size,
+                    "mb_per_s": size / 1e6 / seconds if seconds else None,
+                    **measured,
+                }
+            )
+    return results
+
+
+def print_results(results, previous: Optional[Dict[tuple, dict]] = None) -> None:
+    header = f"{'format':<6} {'operation':<24} {'MB':>7} {'seconds':>9} {'MB/s':>8}"
+    header += f" {'peak MB':>8}"
+    if previous is not None:
+        header += f" {'vs prev':>8}"
+    print(header)
+    for row in results:
+        peak = row["peak_rss_kb"]
+        line = (
+            f"{row['format']:<6} {row['operation']:<24} "
+            f"{row['file_bytes'] / 1e6:>7.2f} {row['seconds']:>9.4f} "
+            f"{row['mb_per_s']:>8.2f} "
+            f"{peak / 1024 if peak is not None else float('nan'):>8.1f}"
+        )
+        if previous is not None:
+            old = previous.get((row["format"], row["operation"]))
+            ratio = old["seconds"] / row["seconds"] if old else float("nan")
+            line += f" {ratio:>7.2f}x"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="medium")
+    parser.add_argument("--paragraphs", type=int)
+    parser.add_argument("--tables", type=int)
+    parser.add_argument("--depth", type=int, dest="table_depth")
+    parser.add_argument("--table-size", type=int)
+    parser.add_argument("--footnotes", type=int)
+    parser.add_argument("--memos", type=int)
+    parser.add_argument("--images", type=int)
+    parser.add_argument("--image-bytes", type=int)
+    parser.add_argument("--sections", type=int)
+    parser.add_argument("--format", choices=sorted(WRITERS), action="append")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--compare", help="previous JSON results to compare with")
+    args = parser.parse_args(argv)
+
+    spec = asdict(PRESETS[args.preset])
+    for key in spec:
+        value = getattr(args, key, None)
+        if value is not None:
+            spec[key] = value
+    spec = DocumentSpec(**spec)
+
+    from hwp_hwpx_parser import __version__
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = run_benchmarks(
+            spec, args.format or sorted(WRITERS), args.repeat, workdir
+        )
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = {
+                (row["format"], row["operation"]): row
+                for row in json.load(f)["results"]
+            }
+    print_results(results, previous)
+
+    if args.output:
+        report = {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "spec": asdict(spec),
+            "repeat": args.repeat,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
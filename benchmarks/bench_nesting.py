@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+깊은 중첩 HWPX 벤치마크
+
+표 -> 글상자 -> 표 ... 가 D단계 중첩된 서식 문서(HWPX)를 만들어 작업별
+시간을 잽니다. 측정마다 새 프로세스(워커)를 띄우므로 ``RecursionError``
+같은 실패는 그 칸에만 표시됩니다. ``--baseline``에 이전 버전의 ``src``
+디렉터리(예: ``git worktree add /tmp/base <커밋>``)를 주면 같은 문서로
+함께 측정해 속도 비를 보여 줍니다.
+
+    python benchmarks/bench_nesting.py
+    python benchmarks/bench_nesting.py --baseline /tmp/base/src --depth 50 --depth 500
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BENCH_DIR, "..", "src")
+sys.path.insert(0, BENCH_DIR)
+
+from synthetic import write_nested_hwpx  # noqa: E402
+
+OPERATIONS = ("extract_text", "extract_text_with_notes", "get_memos", "get_tables")
+DEPTHS = (10, 50, 100, 1000, 5000)
+
+
+def _in_new_process(func, *args):
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(1, mp_context=context) as executor:
+        return executor.submit(func, *args).result()
+
+
+def _run(src: str, path: str, operation: str, repeat: int) -> float:
+    """새 프로세스에서 ``src``의 패키지로 ``operation``을 실행해 최소 시간을 잰다"""
+    sys.path.insert(0, src)
+    from hwp_hwpx_parser import HWPXReader
+
+    best = float("inf")
+    for _ in range(repeat):
+        with HWPXReader(path) as reader:
+            start = time.perf_counter()
+            getattr(reader, operation)()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(src: str, path: str, operation: str, repeat: int) -> object:
+    """걸린 시간(초), 또는 워커에서 난 예외의 이름"""
+    try:
+        return _in_new_process(_run, src, path, operation, repeat)
+    except Exception as e:
+        return type(e).__name__
+
+
+def _cell(value: object) -> str:
+    return f"{value:>14.4f}" if isinstance(value, float) else f"{value:>14}"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--depth", type=int, action="append")
+    parser.add_argument("--operation", choices=OPERATIONS, action="append")
+    parser.add_argument("--baseline", help="src directory of the version to compare")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    header = f"{'depth':>6} {'operation':<24} {'seconds':>14}"
+    if args.baseline:
+        header += f" {'baseline':>14} {'speedup':>8}"
+    print(header)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for depth in args.depth or DEPTHS:
+            path = os.path.join(workdir, f"nested{depth}.hwpx")
+            write_nested_hwpx(path, depth)
+            for operation in args.operation or OPERATIONS:
+                current = measure(SRC_DIR, path, operation, args.repeat)
+                line = f"{depth:>6} {operation:<24} {_cell(current)}"
+                if args.baseline:
+                    base = measure(args.baseline, path, operation, args.repeat)
+                    line += f" {_cell(base)}"
+                    if isinstance(base, float) and isinstance(current, float):
+                        line += f" {base / current:>7.2f}x"
+                print(line, flush=True)
+
+
+if __name__ == "__main__":
+    main()
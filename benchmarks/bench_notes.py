@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+각주/미주 해석 확장성 벤치마크
+
+각주 수를 두 배씩 늘리며 섹션 추출 시간을 측정합니다. 각주 조회가 O(1)이면
+각주당 시간은 거의 일정하고, 이전 구현(매번 레코드 전체 재탐색)처럼
+O(레코드 × 각주)이면 각주 수에 비례해 증가합니다.
+
+    python benchmarks/bench_notes.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from hwp_hwpx_parser import ExtractOptions, HWP5Reader  # noqa: E402
+from synthetic import note_heavy_section  # noqa: E402
+
+
+def measure(notes: int, repeat: int = 3) -> float:
+    data = note_heavy_section(notes)
+    reader = HWP5Reader("synthetic.hwp")
+    options = ExtractOptions()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        reader._reset_counters()
+        records = reader._parse_records(data)
+        reader._extract_section_text(records, options)
+        best = min(best, time.perf_counter() - start)
+    assert len(reader._footnotes) == notes
+    return best
+
+
+def main() -> None:
+    print(f"{'notes':>8} {'seconds':>10} {'us/note':>10}")
+    for notes in (250, 500, 1000, 2000, 4000):
+        seconds = measure(notes)
+        print(f"{notes:>8} {seconds:>10.4f} {seconds / notes * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
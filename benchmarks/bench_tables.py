@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+중첩 표 확장성 벤치마크
+
+표 안에 표가 D단계 중첩된 양식 문서(HWP 5.0)를 만들어 ``extract_text``와
+그 뒤의 ``get_tables`` 시간을 잽니다. 표 구조를 섹션마다 한 번 만들어
+공유하면 표 하나당 시간이 깊이와 상관없이 거의 일정하고, 중첩 표를 바깥
+표마다 다시 해석하면(이전 구현) 깊이에 비례해 늘어납니다.
+
+    python benchmarks/bench_tables.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from hwp_hwpx_parser import HWP5Reader  # noqa: E402
+from synthetic import DocumentSpec, write_hwp5  # noqa: E402
+
+TABLES = 20
+
+
+def measure(path: str, repeat: int = 3):
+    best_text = best_tables = float("inf")
+    for _ in range(repeat):
+        with HWP5Reader(path) as reader:
+            reader.parse()
+            start = time.perf_counter()
+            reader.extract_text()
+            middle = time.perf_counter()
+            tables = reader.get_tables()
+            end = time.perf_counter()
+        best_text = min(best_text, middle - start)
+        best_tables = min(best_tables, end - middle)
+    return best_text, best_tables, len(tables)
+
+
+def main() -> None:
+    print(
+        f"{'depth':>6} {'tables':>7} {'extract_text':>13} {'get_tables':>11}"
+        f" {'us/table':>9}"
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        for depth in (1, 2, 4, 8, 16, 32, 64):
+            spec = DocumentSpec(
+                paragraphs=TABLES,
+                tables=TABLES,
+                table_depth=depth,
+                footnotes=0,
+                memos=0,
+                images=0,
+            )
+            path = os.path.join(workdir, f"nested{depth}.hwp")
+            write_hwp5(path, spec)
+            text_seconds, tables_seconds, count = measure(path)
+            per_table = (text_seconds + tables_seconds) / spec.tables_with_nested
+            print(
+                f"{depth:>6} {count:>7} {text_seconds:>13.4f} {tables_seconds:>11.4f}"
+                f" {per_table * 1e6:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
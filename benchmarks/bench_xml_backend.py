@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+HWPX XML 백엔드 비교 벤치마크 (ElementTree / lxml)
+
+합성 HWPX 문서(와 인자로 준 HWPX 파일)마다 섹션 XML을 읽기만 하는 시간
+(``parse``)과 추출 작업별 시간을 두 백엔드로 재고, ElementTree 대비 lxml의
+속도 비를 보여 줍니다. 결과가 같은지도 함께 확인합니다.
+
+    python benchmarks/bench_xml_backend.py
+    python benchmarks/bench_xml_backend.py --preset large document.hwpx
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from hwp_hwpx_parser import HWPXReader  # noqa: E402
+from hwp_hwpx_parser.xmlbackend import (  # noqa: E402
+    ETREE,
+    LXML,
+    LXML_AVAILABLE,
+    iterparse,
+)
+from synthetic import DocumentSpec, write_hwpx  # noqa: E402
+
+OPERATIONS = ("extract_text", "get_tables", "get_memos", "extract_text_with_notes")
+
+PRESETS = {
+    "small": DocumentSpec(
+        paragraphs=200, tables=10, footnotes=20, memos=5, images=0, image_bytes=0
+    ),
+    "medium": DocumentSpec(images=0),
+    "large": DocumentSpec(
+        paragraphs=20000,
+        tables=400,
+        table_depth=3,
+        footnotes=1000,
+        memos=200,
+        images=0,
+        sections=2,
+    ),
+}
+
+
+def _best(func: Callable[[], object], repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _parse_only(path: str, backend: str) -> int:
+    count = 0
+    with HWPXReader(path, xml_backend=backend) as reader:
+        for section_file in reader._get_section_files():
+            with reader._open().open(section_file) as source:
+                for _ in iterparse(source, ("start", "end"), backend):
+                    count += 1
+    return count
+
+
+def _operation(path: str, backend: str, operation: str):
+    with HWPXReader(path, xml_backend=backend) as reader:
+        return getattr(reader, operation)()
+
+
+def compare(path: str, repeat: int) -> None:
+    name = os.path.basename(path)
+    size = os.path.getsize(path) / 1e6
+    print(f"{name} ({size:.2f} MB)")
+    rows = [("parse", lambda backend: _parse_only(path, backend))]
+    rows += [
+        (operation, lambda backend, op=operation: _operation(path, backend, op))
+        for operation in OPERATIONS
+    ]
+    for label, run in rows:
+        etree_seconds, expected = _best(lambda: run(ETREE), repeat)
+        lxml_seconds, actual = _best(lambda: run(LXML), repeat)
+        if actual != expected:
+            raise AssertionError(f"{name} {label}: lxml result differs from etree")
+        print(
+            f"  {label:<26} {etree_seconds:>9.4f} {lxml_seconds:>9.4f}"
+            f" {etree_seconds / lxml_seconds:>8.2f}x"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("files", nargs="*", help="HWPX files to measure as well")
+    parser.add_argument("--preset", choices=sorted(PRESETS), action="append")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if not LXML_AVAILABLE:
+        sys.exit("lxml is not installed (pip install lxml)")
+
+    print(f"  {'':<26} {'etree s':>9} {'lxml s':>9} {'lxml vs':>9}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for preset in args.preset or ["medium", "large"]:
+            path = os.path.join(workdir, f"{preset}.hwpx")
+            write_hwpx(path, PRESETS[preset])
+            compare(path, args.repeat)
+    for path in args.files:
+        compare(path, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
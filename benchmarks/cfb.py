@@ -0,0 +1,221 @@
+"""
+최소 OLE 복합 파일(CFB v3) 작성기 (벤치마크용)
+
+합성 HWP 5.0 문서를 만들기 위해 스트림 경로와 내용만 받아 복합 파일을
+씁니다. 4096바이트 미만 스트림은 미니 스트림에, 나머지는 일반 섹터에 두며
+FAT이 헤더의 DIFAT 칸(109개)을 넘으면 DIFAT 섹터를 추가합니다.
+"""
+
+import struct
+from typing import Dict, List, Tuple
+
+SECTOR_SIZE = 512
+MINI_SECTOR_SIZE = 64
+MINI_STREAM_CUTOFF = 4096
+DIR_ENTRY_SIZE = 128
+
+FREESECT = 0xFFFFFFFF
+ENDOFCHAIN = 0xFFFFFFFE
+FATSECT = 0xFFFFFFFD
+DIFSECT = 0xFFFFFFFC
+NOSTREAM = 0xFFFFFFFF
+
+_ENTRIES_PER_SECTOR = SECTOR_SIZE // 4
+_HEADER_DIFAT_SLOTS = 109
+
+STORAGE = 1
+STREAM = 2
+ROOT = 5
+
+
+class _Entry:
+    def __init__(self, name: str, kind: int, data: bytes = b""):
+        self.name = name
+        self.kind = kind
+        self.data = data
+        self.children: Dict[str, "_Entry"] = {}
+        self.sid = 0
+        self.left = self.right = self.child = NOSTREAM
+        # 스토리지의 시작 섹터는 0, 빈 스트림은 ENDOFCHAIN
+        self.start = 0 if kind == STORAGE else ENDOFCHAIN
+        self.size = 0
+
+
+def _sort_key(name: str) -> Tuple[int, str]:
+    # 규격의 디렉터리 항목 비교 순서: 이름 길이, 대문자 이름
+    return len(name), name.upper()
+
+
+def _chain(fat: List[int], start: int, count: int) -> None:
+    for i in range(count - 1):
+        fat[start + i] = start + i + 1
+    fat[start + count - 1] = ENDOFCHAIN
+
+
+def _sectors(size: int, sector_size: int) -> int:
+    return (size + sector_size - 1) // sector_size
+
+
+def write_compound_file(path: str, streams: Dict[str, bytes]) -> None:
+    """``{"BodyText/Section0": data, ...}``를 복합 파일로 쓴다"""
+    root = _Entry("Root Entry", ROOT)
+    for stream_path, data in streams.items():
+        parent = root
+        *storages, name = stream_path.split("/")
+        for storage in storages:
+            parent = parent.children.setdefault(storage, _Entry(storage, STORAGE))
+        parent.children[name] = _Entry(name, STREAM, data)
+
+    # 디렉터리: 형제는 오른쪽 포인터로만 잇는다 (검은 노드만 있는 트리)
+    entries: List[_Entry] = []
+
+    def visit(entry: _Entry) -> None:
+        entry.sid = len(entries)
+        entries.append(entry)
+        children = sorted(entry.children.values(), key=lambda e: _sort_key(e.name))
+        for child in children:
+            visit(child)
+        for child, sibling in zip(children, children[1:]):
+            child.right = sibling.sid
+        if children:
+            entry.child = children[0].sid
+
+    visit(root)
+
+    # 미니 스트림
+    mini_stream = bytearray()
+    mini_fat: List[int] = []
+    big_streams: List[_Entry] = []
+    for entry in entries:
+        if entry.kind != STREAM:
+            continue
+        entry.size = len(entry.data)
+        if entry.size == 0:
+            continue
+        if entry.size < MINI_STREAM_CUTOFF:
+            count = _sectors(entry.size, MINI_SECTOR_SIZE)
+            entry.start = len(mini_fat)
+            mini_fat.extend([FREESECT] * count)
+            _chain(mini_fat, entry.start, count)
+            mini_stream += entry.data.ljust(count * MINI_SECTOR_SIZE, b"\x00")
+        else:
+            big_streams.append(entry)
+
+    dir_sectors = _sectors(len(entries) * DIR_ENTRY_SIZE, SECTOR_SIZE)
+    mini_fat_sectors = _sectors(len(mini_fat) * 4, SECTOR_SIZE)
+    mini_stream_sectors = _sectors(len(mini_stream), SECTOR_SIZE)
+    data_sectors = (
+        dir_sectors
+        + mini_fat_sectors
+        + mini_stream_sectors
+        + sum(_sectors(entry.size, SECTOR_SIZE) for entry in big_streams)
+    )
+
+    # FAT/DIFAT 섹터 수는 서로와 전체 섹터 수에 의존하므로 고정점까지 반복
+    fat_sectors = difat_sectors = 0
+    while True:
+        total = data_sectors + fat_sectors + difat_sectors
+        need_fat = _sectors(total, _ENTRIES_PER_SECTOR)
+        need_difat = _sectors(
+            max(0, need_fat - _HEADER_DIFAT_SLOTS), _ENTRIES_PER_SECTOR - 1
+        )
+        if (need_fat, need_difat) == (fat_sectors, difat_sectors):
+            break
+        fat_sectors, difat_sectors = need_fat, need_difat
+
+    total = data_sectors + fat_sectors + difat_sectors
+    fat = [FREESECT] * (fat_sectors * _ENTRIES_PER_SECTOR)
+    body: List[bytes] = []
+    next_sector = 0
+
+    def allocate(data: bytes, count: int) -> int:
+        nonlocal next_sector
+        start = next_sector
+        if count:
+            _chain(fat, start, count)
+            body.append(data.ljust(count * SECTOR_SIZE, b"\x00"))
+            next_sector += count
+        return start if count else ENDOFCHAIN
+
+    fat_start = next_sector
+    for i in range(fat_sectors):
+        fat[fat_start + i] = FATSECT
+    next_sector += fat_sectors
+    difat_start = next_sector
+    for i in range(difat_sectors):
+        fat[difat_start + i] = DIFSECT
+    next_sector += difat_sectors
+
+    for entry in big_streams:
+        entry.start = allocate(entry.data, _sectors(entry.size, SECTOR_SIZE))
+    root.start = allocate(bytes(mini_stream), mini_stream_sectors)
+    root.size = len(mini_stream)
+    mini_fat_start = allocate(
+        struct.pack(f"<{len(mini_fat)}I", *mini_fat), mini_fat_sectors
+    )
+
+    directory = b"".join(_dir_entry(entry) for entry in entries)
+    dir_start = allocate(directory, dir_sectors)
+    assert next_sector == total
+
+    fat_ids = list(range(fat_start, fat_start + fat_sectors))
+    header_difat = fat_ids[:_HEADER_DIFAT_SLOTS]
+    header_difat += [FREESECT] * (_HEADER_DIFAT_SLOTS - len(header_difat))
+
+    difat_blocks = []
+    rest = fat_ids[_HEADER_DIFAT_SLOTS:]
+    per_block = _ENTRIES_PER_SECTOR - 1
+    for i in range(difat_sectors):
+        ids = rest[i * per_block : (i + 1) * per_block]
+        ids += [FREESECT] * (per_block - len(ids))
+        next_difat = difat_start + i + 1 if i + 1 < difat_sectors else ENDOFCHAIN
+        difat_blocks.append(struct.pack(f"<{per_block + 1}I", *ids, next_difat))
+
+    header = struct.pack(
+        "<8s16sHHHHH6sIIIIIIIII",
+        b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",
+        b"\x00" * 16,
+        0x3E,  # minor version
+        3,  # major version (512바이트 섹터)
+        0xFFFE,  # byte order
+        9,  # sector shift
+        6,  # mini sector shift
+        b"\x00" * 6,
+        0,  # 디렉터리 섹터 수 (v3에서는 0)
+        fat_sectors,
+        dir_start,
+        0,  # transaction signature
+        MINI_STREAM_CUTOFF,
+        mini_fat_start,
+        mini_fat_sectors,
+        difat_start if difat_sectors else ENDOFCHAIN,
+        difat_sectors,
+    ) + struct.pack(f"<{_HEADER_DIFAT_SLOTS}I", *header_difat)
+
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(struct.pack(f"<{len(fat)}I", *fat))
+        for block in difat_blocks:
+            f.write(block)
+        for chunk in body:
+            f.write(chunk)
+
+
+def _dir_entry(entry: _Entry) -> bytes:
+    name = entry.name.encode("utf-16-le")[:62]
+    return struct.pack(
+        "<64sHBBIII16sIQQIQ",
+        name,
+        len(name) + 2,
+        entry.kind,
+        1,  # black
+        entry.left,
+        entry.right,
+        entry.child,
+        b"\x00" * 16,
+        0,
+        0,
+        0,
+        entry.start,
+        entry.size,
+    )
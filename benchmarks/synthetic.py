@@ -0,0 +1,423 @@
+"""
+합성 HWP5/HWPX 문서 생성기 (벤치마크용)
+
+실제 한글 파일과 같은 레코드 배치(문단 → 컨트롤 → 리스트 헤더 → 문단)로
+BodyText 섹션 바이트열을 만듭니다. ``write_hwp5()``/``write_hwpx()``는
+``DocumentSpec``에 따라 문단, 중첩 표, 각주, 메모, 그림을 가진 완전한
+문서 파일을 씁니다. ``write_nested_hwpx()``는 표와 글상자가 깊게 중첩된
+서식 문서를 만듭니다.
+"""
+
+import random
+import struct
+import zipfile
+import zlib
+from dataclasses import dataclass
+from typing import List, Tuple
+from xml.sax.saxutils import escape
+
+from cfb import write_compound_file
+
+HWPTAG_BEGIN = 0x10
+HWPTAG_BIN_DATA = HWPTAG_BEGIN + 2
+HWPTAG_PARA_HEADER = HWPTAG_BEGIN + 50
+HWPTAG_PARA_TEXT = HWPTAG_BEGIN + 51
+HWPTAG_CTRL_HEADER = HWPTAG_BEGIN + 55
+HWPTAG_LIST_HEADER = HWPTAG_BEGIN + 56
+HWPTAG_TABLE = HWPTAG_BEGIN + 61
+HWPTAG_SHAPE_COMPONENT_PICTURE = HWPTAG_BEGIN + 69
+HWPTAG_MEMO_LIST = HWPTAG_BEGIN + 77
+
+CTRL_CHAR_FIELD_BEGIN = 3
+CTRL_CHAR_FIELD_END = 4
+CTRL_CHAR_OBJECT = 11
+CTRL_CHAR_FIELD = 17
+FOOTNOTE_CTRL_ID = b"  nf"
+ENDNOTE_CTRL_ID = b"  ne"
+MEMO_CTRL_ID = b"em%%"
+TABLE_CTRL_ID = b" lbt"
+GSO_CTRL_ID = b" osg"
+
+
+def make_record(tag_id: int, level: int, payload: bytes) -> bytes:
+    """레코드 헤더(4바이트, 필요 시 확장 크기 4바이트) + 페이로드"""
+    size = len(payload)
+    if size >= 0xFFF:
+        header = struct.pack("<II", tag_id | (level << 10) | (0xFFF << 20), size)
+    else:
+        header = struct.pack("<I", tag_id | (level << 10) | (size << 20))
+    return header + payload
+
+
+def extended_ctrl(ctrl_id: bytes, code: int = CTRL_CHAR_FIELD) -> bytes:
+    """확장 제어 문자 (코드 + ctrl_id + 8바이트 + 코드)"""
+    return struct.pack("<H", code) + ctrl_id + b"\x00" * 8 + struct.pack("<H", code)
+
+
+def text(value: str) -> bytes:
+    return value.encode("utf-16-le")
+
+
+def paragraph(level: int, *parts: bytes) -> bytes:
+    body = b"".join(parts) + struct.pack("<H", 13)
+    return make_record(HWPTAG_PARA_HEADER, level, b"\x00" * 22) + make_record(
+        HWPTAG_PARA_TEXT, level + 1, body
+    )
+
+
+def note_body(level: int, ctrl_id: bytes, value: str) -> bytes:
+    """각주/미주 컨트롤 헤더와 그 본문 문단"""
+    return (
+        make_record(HWPTAG_CTRL_HEADER, level, ctrl_id + b"\x00" * 4)
+        + make_record(HWPTAG_LIST_HEADER, level + 1, b"\x00" * 8)
+        + paragraph(level + 1, text(value))
+    )
+
+
+def note_heavy_section(notes: int, notes_per_paragraph: int = 4) -> bytes:
+    """각주 ``notes``개와 미주 ``notes // 4``개를 가진 섹션"""
+    chunks = []
+    footnote = endnote = 0
+    while footnote < notes:
+        parts = []
+        bodies = []
+        for _ in range(min(notes_per_paragraph, notes - footnote)):
+            footnote += 1
+            parts.append(text(f"본문 문장 {footnote}"))
+            parts.append(extended_ctrl(FOOTNOTE_CTRL_ID))
+            bodies.append(note_body(1, FOOTNOTE_CTRL_ID, f"각주 내용 {footnote}"))
+            if footnote % 4 == 0:
+                endnote += 1
+                parts.append(extended_ctrl(ENDNOTE_CTRL_ID))
+                bodies.append(note_body(1, ENDNOTE_CTRL_ID, f"미주 내용 {endnote}"))
+        chunks.append(paragraph(0, *parts))
+        chunks.extend(bodies)
+    return b"".join(chunks)
+
+
+SAMPLE_SENTENCE = "한글 문서 본문 텍스트 Sample text 123, 가나다라마바사. "
+
+
+def text_dense_section(paragraphs: int, chars_per_paragraph: int = 400) -> bytes:
+    """제어 문자가 거의 없는 긴 문단 ``paragraphs``개로 된 섹션"""
+    repeat = chars_per_paragraph // len(SAMPLE_SENTENCE) + 1
+    body = (SAMPLE_SENTENCE * repeat)[:chars_per_paragraph]
+    return b"".join(paragraph(0, text(f"{n}. {body}")) for n in range(paragraphs))
+
+
+@dataclass
+class DocumentSpec:
+    """
+    합성 문서의 구성.
+
+    표는 ``table_size`` x ``table_size`` 셀이며 ``table_depth``가 2 이상이면
+    첫 셀 안에 한 단계 작은 깊이의 표가 들어갑니다. 각주/메모/그림/표는
+    문단에 고르게 나눠 붙고, 문단은 ``sections``개 섹션에 순서대로 나뉩니다.
+    """
+
+    paragraphs: int = 1000
+    tables: int = 20
+    table_depth: int = 1
+    table_size: int = 3
+    footnotes: int = 50
+    memos: int = 10
+    images: int = 5
+    image_bytes: int = 64 * 1024
+    sections: int = 1
+    chars_per_paragraph: int = 200
+
+    def __post_init__(self):
+        if self.paragraphs < self.sections:
+            raise ValueError("paragraphs must be at least sections")
+        if self.table_depth < 1:
+            raise ValueError("table_depth must be at least 1")
+
+    @property
+    def tables_with_nested(self) -> int:
+        """중첩 표까지 센 표 개수"""
+        return self.tables * self.table_depth
+
+
+# (문단 번호, 각주 수, 메모 수, 그림 수, 뒤에 오는 표 수)
+_Slot = Tuple[int, int, int, int, int]
+
+
+def _spread(count: int, slots: int) -> List[int]:
+    """``count``개를 ``slots``개 자리에 고르게 나눈 개수 목록"""
+    return [(i + 1) * count // slots - i * count // slots for i in range(slots)]
+
+
+def _layout(spec: DocumentSpec) -> List[List[_Slot]]:
+    sections: List[List[_Slot]] = [[] for _ in range(spec.sections)]
+    rows = zip(
+        range(spec.paragraphs),
+        _spread(spec.footnotes, spec.paragraphs),
+        _spread(spec.memos, spec.paragraphs),
+        _spread(spec.images, spec.paragraphs),
+        _spread(spec.tables, spec.paragraphs),
+    )
+    for row in rows:
+        sections[row[0] * spec.sections // spec.paragraphs].append(row)
+    return sections
+
+
+def _body_text(n: int, spec: DocumentSpec) -> str:
+    repeat = spec.chars_per_paragraph // len(SAMPLE_SENTENCE) + 1
+    return f"{n}. " + (SAMPLE_SENTENCE * repeat)[: spec.chars_per_paragraph]
+
+
+def png_image(size: int, seed: int = 0) -> bytes:
+    """압축이 거의 안 되는 약 ``size``바이트짜리 PNG (무작위 회색조 픽셀)"""
+    side = max(1, int(size**0.5))
+    rng = random.Random(seed)
+    rows = b"".join(
+        b"\x00" + rng.getrandbits(side * 8).to_bytes(side, "little")
+        for _ in range(side)
+    )
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        crc = zlib.crc32(kind + data) & 0xFFFFFFFF
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", crc)
+
+    ihdr = struct.pack(">IIBBBBB", side, side, 8, 0, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", ihdr)
+        + chunk(b"IDAT", zlib.compress(rows, 1))
+        + chunk(b"IEND", b"")
+    )
+
+
+# -- HWP 5.0 --------------------------------------------------------------
+
+
+def _hwp5_table(level: int, depth: int, spec: DocumentSpec, label: str) -> bytes:
+    """표 컨트롤을 가진 문단(``level``)과 표/셀 레코드"""
+    size = spec.table_size
+    table = struct.pack("<IHH", 0, size, size) + b"\x00" * 10
+    table += struct.pack(f"<{size}H", *([size] * size)) + b"\x00" * 2
+    chunks = [
+        paragraph(level, extended_ctrl(TABLE_CTRL_ID, CTRL_CHAR_OBJECT)),
+        make_record(HWPTAG_CTRL_HEADER, level + 1, TABLE_CTRL_ID + b"\x00" * 42),
+        make_record(HWPTAG_TABLE, level + 2, table),
+    ]
+    for row in range(size):
+        for col in range(size):
+            cell = struct.pack("<HIHHHH", 1, 0, 0, col, row, 1) + b"\x00" * 20
+            chunks.append(make_record(HWPTAG_LIST_HEADER, level + 2, cell))
+            if row == col == 0 and depth > 1:
+                chunks.append(_hwp5_table(level + 2, depth - 1, spec, label + ".1"))
+            else:
+                value = f"셀 {label} {row},{col}"
+                chunks.append(paragraph(level + 2, text(value)))
+    return b"".join(chunks)
+
+
+def _hwp5_picture(level: int, bindata_id: int) -> bytes:
+    picture = b"\x00" * 71 + struct.pack("<H", bindata_id) + b"\x00" * 8
+    return make_record(
+        HWPTAG_CTRL_HEADER, level, GSO_CTRL_ID + b"\x00" * 42
+    ) + make_record(HWPTAG_SHAPE_COMPONENT_PICTURE, level + 1, picture)
+
+
+def _hwp5_section(slots: List[_Slot], spec: DocumentSpec, counters: dict) -> bytes:
+    chunks = []
+    memo_bodies = []
+    for n, footnotes, memos, images, tables in slots:
+        parts = [text(_body_text(n, spec))]
+        bodies = []
+        for _ in range(footnotes):
+            counters["footnote"] += 1
+            parts.append(extended_ctrl(FOOTNOTE_CTRL_ID))
+            value = f"각주 내용 {counters['footnote']}"
+            bodies.append(note_body(1, FOOTNOTE_CTRL_ID, value))
+        for _ in range(memos):
+            counters["memo"] += 1
+            parts.append(extended_ctrl(MEMO_CTRL_ID, CTRL_CHAR_FIELD_BEGIN))
+            parts.append(text("메모 대상"))
+            parts.append(extended_ctrl(MEMO_CTRL_ID, CTRL_CHAR_FIELD_END))
+            memo_bodies.append(f"메모 내용 {counters['memo']}")
+        for _ in range(images):
+            counters["image"] += 1
+            parts.append(extended_ctrl(GSO_CTRL_ID, CTRL_CHAR_OBJECT))
+            bodies.append(_hwp5_picture(1, counters["image"]))
+        chunks.append(paragraph(0, *parts))
+        chunks.extend(bodies)
+        for _ in range(tables):
+            counters["table"] += 1
+            chunks.append(
+                _hwp5_table(0, spec.table_depth, spec, str(counters["table"]))
+            )
+    # 메모 목록은 섹션 끝에 둔다 (본문 스캔이 메모 목록 뒤를 건너뛴다)
+    for value in memo_bodies:
+        chunks.append(make_record(HWPTAG_MEMO_LIST, 0, b"\x00" * 4))
+        chunks.append(make_record(HWPTAG_LIST_HEADER, 1, b"\x00" * 8))
+        chunks.append(paragraph(1, text(value)))
+    return b"".join(chunks)
+
+
+def _raw_deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def write_hwp5(path: str, spec: DocumentSpec) -> None:
+    """``spec`` 구성의 HWP 5.0 문서(압축된 OLE 복합 파일)를 쓴다"""
+    header = b"HWP Document File".ljust(32, b"\x00")
+    header += struct.pack("<II", 0x05000300, 0x01)  # 5.0.3.0, 압축
+    streams = {"FileHeader": header.ljust(256, b"\x00")}
+
+    docinfo = []
+    for image in range(1, spec.images + 1):
+        ext = text("png")
+        record = struct.pack("<HHH", 0x0101, image, 3) + ext
+        docinfo.append(make_record(HWPTAG_BIN_DATA, 0, record))
+        png = png_image(spec.image_bytes, seed=image)
+        streams[f"BinData/BIN{image:04X}.png"] = _raw_deflate(png)
+    streams["DocInfo"] = _raw_deflate(b"".join(docinfo))
+
+    counters = dict.fromkeys(("footnote", "memo", "image", "table"), 0)
+    for idx, slots in enumerate(_layout(spec)):
+        section = _hwp5_section(slots, spec, counters)
+        streams[f"BodyText/Section{idx}"] = _raw_deflate(section)
+    write_compound_file(path, streams)
+
+
+# -- HWPX -----------------------------------------------------------------
+
+HWPX_NAMESPACES = (
+    'xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" '
+    'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph" '
+    'xmlns:hc="http://www.hancom.co.kr/hwpml/2011/core" '
+    'xmlns:hh="http://www.hancom.co.kr/hwpml/2011/head"'
+)
+
+
+def _hwpx_paragraph(*runs: str) -> str:
+    return "<hp:p>" + "".join(f"<hp:run>{run}</hp:run>" for run in runs) + "</hp:p>"
+
+
+def _hwpx_t(value: str) -> str:
+    return f"<hp:t>{escape(value)}</hp:t>"
+
+
+def _hwpx_table(depth: int, spec: DocumentSpec, label: str) -> str:
+    size = spec.table_size
+    rows = []
+    for row in range(size):
+        cells = []
+        for col in range(size):
+            if row == col == 0 and depth > 1:
+                content = _hwpx_table(depth - 1, spec, label + ".1")
+            else:
+                content = _hwpx_paragraph(_hwpx_t(f"셀 {label} {row},{col}"))
+            cells.append(f"<hp:tc><hp:subList>{content}</hp:subList></hp:tc>")
+        rows.append("<hp:tr>" + "".join(cells) + "</hp:tr>")
+    table = f'<hp:tbl rowCnt="{size}" colCnt="{size}">' + "".join(rows) + "</hp:tbl>"
+    return _hwpx_paragraph(table)
+
+
+def _hwpx_section(slots: List[_Slot], spec: DocumentSpec, counters: dict) -> str:
+    body = []
+    for n, footnotes, memos, images, tables in slots:
+        runs = [_hwpx_t(_body_text(n, spec))]
+        for _ in range(footnotes):
+            counters["footnote"] += 1
+            note = _hwpx_paragraph(_hwpx_t(f"각주 내용 {counters['footnote']}"))
+            runs.append(
+                f"<hp:ctrl><hp:footNote><hp:subList>{note}</hp:subList>"
+                "</hp:footNote></hp:ctrl>"
+            )
+        for _ in range(memos):
+            counters["memo"] += 1
+            memo = _hwpx_paragraph(_hwpx_t(f"메모 내용 {counters['memo']}"))
+            runs.append(
+                f'<hp:ctrl><hp:fieldBegin type="MEMO" id="{counters["memo"]}">'
+                f"<hp:subList>{memo}</hp:subList></hp:fieldBegin></hp:ctrl>"
+                + _hwpx_t("메모 대상")
+                + "<hp:ctrl><hp:fieldEnd/></hp:ctrl>"
+            )
+        for _ in range(images):
+            counters["image"] += 1
+            runs.append(
+                f'<hp:pic><hc:img binaryItemIDRef="image{counters["image"]}"/></hp:pic>'
+            )
+        body.append(_hwpx_paragraph("".join(runs)))
+        for _ in range(tables):
+            counters["table"] += 1
+            body.append(_hwpx_table(spec.table_depth, spec, str(counters["table"])))
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>'
+        f"<hs:sec {HWPX_NAMESPACES}>" + "".join(body) + "</hs:sec>"
+    )
+
+
+def write_hwpx(path: str, spec: DocumentSpec) -> None:
+    """``spec`` 구성의 HWPX 문서(ZIP 패키지)를 쓴다"""
+    counters = dict.fromkeys(("footnote", "memo", "image", "table"), 0)
+    sections = [_hwpx_section(slots, spec, counters) for slots in _layout(spec)]
+    images = [png_image(spec.image_bytes, seed=n) for n in range(1, spec.images + 1)]
+    _write_hwpx_package(path, sections, images)
+
+
+def nested_hwpx_section(depth: int) -> str:
+    """
+    표 -> 글상자 -> 표 ... 를 ``depth``단계 중첩한 섹션 XML
+
+    서식 생성기가 만드는 문서처럼 표 셀 안의 글상자(``hp:rect``/``drawText``)
+    안에 다시 표를 둔다. 단계마다 셀 텍스트와 각주가 하나씩 있다.
+    """
+    opened = []
+    closed = []
+    for level in range(depth):
+        note = _hwpx_paragraph(_hwpx_t(f"각주 {level}"))
+        opened.append(
+            '<hp:p><hp:run><hp:tbl rowCnt="1" colCnt="2"><hp:tr>'
+            "<hp:tc><hp:subList><hp:p><hp:run>"
+            + _hwpx_t(f"셀 {level}")
+            + f"<hp:ctrl><hp:footNote><hp:subList>{note}</hp:subList>"
+            "</hp:footNote></hp:ctrl>"
+            "<hp:rect><hp:drawText><hp:subList>"
+        )
+        closed.append(
+            "</hp:subList></hp:drawText></hp:rect>"
+            "</hp:run></hp:p></hp:subList></hp:tc>"
+            f"<hp:tc><hp:subList>{_hwpx_paragraph(_hwpx_t(str(level)))}</hp:subList>"
+            "</hp:tc></hp:tr></hp:tbl></hp:run></hp:p>"
+        )
+    body = "".join(opened) + _hwpx_paragraph(_hwpx_t("끝")) + "".join(reversed(closed))
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>'
+        f"<hs:sec {HWPX_NAMESPACES}>" + body + "</hs:sec>"
+    )
+
+
+def write_nested_hwpx(path: str, depth: int) -> None:
+    """``nested_hwpx_section(depth)`` 하나로 된 HWPX 문서를 쓴다"""
+    _write_hwpx_package(path, [nested_hwpx_section(depth)], [])
+
+
+def _write_hwpx_package(path: str, sections: List[str], images: List[bytes]) -> None:
+    # 실제 한글 파일처럼 그림 목록은 content.hpf에 두고 header.xml에는 넣지 않는다
+    manifest = "".join(
+        f'<opf:item id="image{image}" href="BinData/image{image}.png" '
+        'media-type="image/png" isEmbeded="1"/>'
+        for image in range(1, len(images) + 1)
+    )
+    content = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>'
+        '<opf:package xmlns:opf="http://www.idpf.org/2007/opf/">'
+        f"<opf:manifest>{manifest}</opf:manifest></opf:package>"
+    )
+    header = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>'
+        f"<hh:head {HWPX_NAMESPACES}/>"
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("mimetype", "application/hwp+zip", zipfile.ZIP_STORED)
+        zf.writestr("Contents/content.hpf", content)
+        zf.writestr("Contents/header.xml", header)
+        for idx, section in enumerate(sections):
+            zf.writestr(f"Contents/section{idx}.xml", section)
+        for image, png in enumerate(images, 1):
+            zf.writestr(f"BinData/image{image}.png", png, zipfile.ZIP_STORED)
@@ -29,10 +29,14 @@ from .models import (
     HyperlinkData,
     MemoData,
     ExtractResult,
+    TextChunk,
 )
-from .hwp5 import HWP5Reader, extract_hwp5, OLEFILE_AVAILABLE
-from .hwpx import HWPXReader, extract_hwpx
-from .reader import Reader, FileType, read
+from .cache import ExtractionCache
+from .hwp5 import HWP5Reader, FileHeaderInfo, extract_hwp5, OLEFILE_AVAILABLE
+from .hwpx import HWPXReader, HeaderInfo, extract_hwpx
+from .xmlbackend import LXML_AVAILABLE
+from .sniff import FileType, sniff
+from .reader import Reader, read
 
 __all__ = [
     "ExtractOptions",
@@ -43,12 +47,18 @@ __all__ = [
     "HyperlinkData",
     "MemoData",
     "ExtractResult",
+    "TextChunk",
     "HWP5Reader",
+    "FileHeaderInfo",
     "HWPXReader",
+    "HeaderInfo",
     "Reader",
     "FileType",
+    "sniff",
+    "ExtractionCache",
     "extract_hwp5",
     "extract_hwpx",
     "read",
     "OLEFILE_AVAILABLE",
+    "LXML_AVAILABLE",
 ]
@@ -0,0 +1,273 @@
+"""Batch extraction across worker processes
+
+파싱은 순수 Python(CPU 바운드)이라 스레드로는 빨라지지 않으므로 여러 파일을
+``ProcessPoolExecutor``로 나눠 처리합니다.
+
+Example:
+    >>> from hwp_hwpx_parser.batch import extract_many
+    >>> for path, result in extract_many(paths, workers=8, timeout=60):
+    ...     if isinstance(result, Exception):
+    ...         print("failed:", path, result)
+    ...     else:
+    ...         print(path, len(result.text))
+"""
+
+import os
+import pickle
+import signal
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .cache import ExtractionCache
+from .models import ExtractOptions, ExtractResult
+from .reader import Reader
+from .sniff import FileType, sniff, suffix_type, unsupported_error
+
+BatchItem = Tuple[int, Path]
+BatchOutcome = Union[ExtractResult, Exception]
+
+
+@contextmanager
+def _time_limit(seconds: Optional[float]):
+    """워커 안에서 파일 하나의 처리 시간을 제한 (SIGALRM 지원 플랫폼)"""
+    if (
+        not seconds
+        or not hasattr(signal, "SIGALRM")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def on_alarm(signum, frame):
+        raise TimeoutError(f"Extraction timed out after {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _portable_error(error: Exception) -> Exception:
+    # 부모 프로세스로 돌려보낼 수 없는 예외는 메시지만 남긴다
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+def _screen(path: Path) -> Optional[Exception]:
+    """Error for a file that need not reach a worker (reads the first bytes)"""
+    try:
+        file_type = sniff(path)
+    except OSError:
+        # 읽을 수 없는 파일은 워커에서 원래 오류를 내도록 그대로 보낸다
+        return None
+    if file_type in (FileType.HWP5, FileType.HWPX):
+        return None
+    if file_type == FileType.UNKNOWN and suffix_type(path.name) != FileType.UNKNOWN:
+        # Reader처럼 .hwp/.hwpx는 그 형식의 리더가 열어 보게 한다
+        return None
+    return unsupported_error(file_type, str(path))
+
+
+def _extract_one(
+    path: Path,
+    options: Optional[ExtractOptions],
+    timeout: Optional[float],
+    cache: Optional[ExtractionCache] = None,
+) -> BatchOutcome:
+    try:
+        with _time_limit(timeout):
+            with Reader(path, cache=cache) as reader:
+                return reader.extract_text_with_notes(options)
+    except Exception as e:
+        return _portable_error(e)
+
+
+def _extract_chunk(
+    chunk: List[BatchItem],
+    options: Optional[ExtractOptions],
+    timeout: Optional[float],
+    cache: Optional[ExtractionCache] = None,
+) -> List[Tuple[int, BatchOutcome]]:
+    return [
+        (index, _extract_one(path, options, timeout, cache)) for index, path in chunk
+    ]
+
+
+def extract_many(
+    paths: Iterable[Union[str, Path]],
+    options: Optional[ExtractOptions] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+    timeout: Optional[float] = None,
+    ordered: bool = False,
+    mp_context=None,
+    cache: Optional[ExtractionCache] = None,
+) -> Iterator[Tuple[Path, BatchOutcome]]:
+    """
+    Extract text with notes from many files in parallel.
+
+    Yields ``(path, result)`` pairs where ``result`` is an ``ExtractResult``
+    or the exception raised for that file. A failing file never stops the
+    batch.
+
+    Args:
+        paths: Files to extract (consumed lazily, so a generator over a large
+            archive is fine).
+        options: Extraction options passed to every file.
+        workers: Number of worker processes (default: ``os.cpu_count()``).
+            ``0`` extracts in the calling process.
+        chunksize: Files sent to a worker per task. Larger chunks cut IPC
+            overhead for many small files.
+        timeout: Per-file limit in seconds. Enforced inside the worker with
+            ``SIGALRM``; a file that exceeds it yields ``TimeoutError``.
+            Not enforced on platforms without ``SIGALRM`` (Windows).
+        ordered: Yield results in input order instead of completion order.
+        mp_context: ``multiprocessing`` context for the pool.
+        cache: ``ExtractionCache`` shared by the workers; files already in
+            the cache are hashed instead of parsed.
+
+    If a worker process dies (segfault, OOM kill), the files it was
+    processing are retried one at a time in an isolated worker; the file
+    that kills it again yields ``BrokenProcessPool``.
+
+    With worker processes, each file's format is sniffed from its first
+    bytes in the calling process first: HWP 3.x, encrypted-at-a-glance and
+    non-HWP files yield their ``ValueError`` without being sent to a worker.
+    Unrecognized ``.hwp``/``.hwpx`` files are still sent, as ``Reader``
+    tries them with the reader for their extension.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    items = ((index, Path(path)) for index, path in enumerate(paths))
+
+    if workers == 0:
+        results = (
+            (index, path, _extract_one(path, options, timeout, cache))
+            for index, path in items
+        )
+    else:
+        results = _run_pool(
+            items, options, workers, chunksize, timeout, mp_context, cache
+        )
+
+    if not ordered:
+        for index, path, result in results:
+            yield path, result
+        return
+
+    pending: Dict[int, Tuple[Path, BatchOutcome]] = {}
+    next_index = 0
+    for index, path, result in results:
+        pending[index] = (path, result)
+        while next_index in pending:
+            yield pending.pop(next_index)
+            next_index += 1
+
+
+def _run_pool(
+    items: Iterator[BatchItem],
+    options: Optional[ExtractOptions],
+    workers: int,
+    chunksize: int,
+    timeout: Optional[float],
+    mp_context,
+    cache: Optional[ExtractionCache] = None,
+) -> Iterator[Tuple[int, Path, BatchOutcome]]:
+    max_in_flight = workers * 2
+    paths: Dict[int, Path] = {}
+    in_flight = {}
+    suspects: Deque[BatchItem] = deque()
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=mp_context)
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(in_flight) < max_in_flight:
+                chunk = []
+                for index, path in items:
+                    error = _screen(path)
+                    if error is not None:
+                        yield index, path, error
+                        continue
+                    chunk.append((index, path))
+                    if len(chunk) == chunksize:
+                        break
+                if not chunk:
+                    exhausted = True
+                    break
+                paths.update(chunk)
+                future = executor.submit(_extract_chunk, chunk, options, timeout, cache)
+                in_flight[future] = chunk
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            broken = False
+            for future in done:
+                chunk = in_flight.pop(future)
+                try:
+                    outcomes = future.result()
+                except BrokenProcessPool:
+                    broken = True
+                    suspects.extend(chunk)
+                    continue
+                for index, result in outcomes:
+                    yield index, paths.pop(index), result
+
+            if broken:
+                # 풀 전체가 깨졌으므로 처리 중이던 파일은 모두 다시 확인한다
+                for chunk in in_flight.values():
+                    suspects.extend(chunk)
+                in_flight.clear()
+                executor.shutdown(wait=False)
+                for index, result in _run_isolated(
+                    suspects, options, timeout, mp_context, cache
+                ):
+                    yield index, paths.pop(index), result
+                executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=mp_context
+                )
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _run_isolated(
+    suspects: Deque[BatchItem],
+    options: Optional[ExtractOptions],
+    timeout: Optional[float],
+    mp_context,
+    cache: Optional[ExtractionCache] = None,
+) -> Iterator[Tuple[int, BatchOutcome]]:
+    """워커를 죽인 파일을 찾기 위해 한 파일씩 단독 워커에서 처리"""
+    executor = ProcessPoolExecutor(max_workers=1, mp_context=mp_context)
+    try:
+        while suspects:
+            index, path = suspects.popleft()
+            future = executor.submit(
+                _extract_chunk, [(index, path)], options, timeout, cache
+            )
+            try:
+                yield future.result()[0]
+            except BrokenProcessPool as e:
+                yield index, BrokenProcessPool(f"Worker process died: {path} ({e})")
+                executor.shutdown(wait=False)
+                executor = ProcessPoolExecutor(max_workers=1, mp_context=mp_context)
+    finally:
+        executor.shutdown(wait=True)
@@ -0,0 +1,272 @@
+"""Persistent extraction cache
+
+같은 파일을 반복해서 처리하는 파이프라인(재색인, 재시도, 중복 첨부)을 위한
+디스크 캐시입니다. 키는 파일 내용 해시 + 파서 버전 + ``ExtractOptions``이므로
+파일 이름이나 경로가 달라도 내용이 같으면 캐시를 공유합니다. 파서 버전에는
+패키지 소스 해시가 들어 있어, 배포 메타데이터가 없는 소스 체크아웃이나 버전을
+올리지 않은 코드 변경에서도 예전 결과를 재사용하지 않습니다.
+
+Example:
+    >>> from hwp_hwpx_parser import ExtractionCache, Reader
+    >>> cache = ExtractionCache("~/.cache/hwp-hwpx-parser", max_bytes=1 << 30)
+    >>> with Reader("document.hwp", cache=cache) as r:
+    ...     print(r.text)  # 두 번째부터는 파일 해시 한 번으로 끝남
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Union
+
+from . import __version__
+from .models import ExtractOptions, ExtractResult, MemoData, NoteData, TableData
+from .source import InputSource, Source
+
+logger = logging.getLogger(__name__)
+
+PARSER_VERSION = __version__
+
+# 저장 형식이 바뀌면 올린다 (이전 항목은 자연스럽게 무시/축출됨). 추출 결과는
+# 소스 해시(parser_fingerprint)로 갈리지만, 소스 밖의 원인(의존 패키지 등)으로
+# 결과가 달라지는 변경도 이 값을 올려 예전 항목을 버린다.
+CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+_ENTRY_SUFFIX = ".cache"
+
+_fingerprint: Optional[str] = None
+
+
+def parser_fingerprint() -> str:
+    """
+    Parser version plus a hash of the package's source files.
+
+    Part of every cache key: code changes invalidate cached results even
+    when the version is unknown (``"0.0.0"`` without distribution metadata,
+    e.g. ``PYTHONPATH=src``) or was not bumped.
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.blake2b(digest_size=10)
+        package_dir = Path(__file__).parent
+        try:
+            for path in sorted(package_dir.glob("*.py")):
+                digest.update(path.name.encode("utf-8"))
+                digest.update(path.read_bytes())
+        except OSError:
+            # 소스를 읽을 수 없는 설치(zip 등)에서는 버전만 쓴다
+            _fingerprint = PARSER_VERSION
+        else:
+            _fingerprint = f"{PARSER_VERSION}+{digest.hexdigest()}"
+    return _fingerprint
+
+
+class ExtractionCache:
+    """
+    On-disk cache of extraction results with LRU eviction by total size.
+
+    Entries are zlib-compressed JSON files under ``directory``. A hit
+    refreshes the entry's modification time; when the directory grows past
+    ``max_bytes`` the least recently used entries are removed. Several
+    processes may share one directory (writes are atomic renames).
+
+    Args:
+        directory: Cache directory (created if missing)
+        max_bytes: Upper bound for the total size of cache entries
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], max_bytes: int = DEFAULT_CACHE_BYTES
+    ):
+        self.directory = Path(directory).expanduser()
+        self.max_bytes = max_bytes
+        self._total_bytes: Optional[int] = None
+
+    def __getstate__(self):
+        # 워커 프로세스로 넘길 때 크기 추정치는 다시 계산하게 한다
+        state = self.__dict__.copy()
+        state["_total_bytes"] = None
+        return state
+
+    @staticmethod
+    def file_digest(source: Source) -> str:
+        """Content hash of a file, buffer or stream (the key for the file)."""
+        source = InputSource(source)
+        digest = hashlib.blake2b(digest_size=20)
+        if source.path is not None:
+            with open(source.path, "rb") as f:
+                for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+        else:
+            stream = source.open_arg()
+            for chunk in iter(lambda: stream.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+            stream.seek(0)
+        return digest.hexdigest()
+
+    def get_result(
+        self, digest: str, options: Optional[ExtractOptions] = None
+    ) -> Optional[ExtractResult]:
+        return self._get("result", digest, options, _result_from_json)
+
+    def put_result(
+        self,
+        digest: str,
+        options: Optional[ExtractOptions],
+        result: ExtractResult,
+    ) -> None:
+        self._put("result", digest, options, asdict(result))
+
+    def get_tables(
+        self, digest: str, options: Optional[ExtractOptions] = None
+    ) -> Optional[List[TableData]]:
+        return self._get(
+            "tables",
+            digest,
+            options,
+            lambda rows_list: [TableData(rows=rows) for rows in rows_list],
+        )
+
+    def put_tables(
+        self,
+        digest: str,
+        options: Optional[ExtractOptions],
+        tables: List[TableData],
+    ) -> None:
+        self._put("tables", digest, options, [table.rows for table in tables])
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        for path, _, _ in self._scan():
+            _unlink(path)
+        self._total_bytes = 0
+
+    @property
+    def size(self) -> int:
+        """Total size of cache entries in bytes."""
+        return sum(size for _, size, _ in self._scan())
+
+    def _entry_path(
+        self, kind: str, digest: str, options: Optional[ExtractOptions]
+    ) -> Path:
+        options = options or ExtractOptions()
+        # 옵션 repr에는 모든 필드가 들어가므로 옵션 값이 같으면 키도 같다
+        material = (
+            f"{CACHE_FORMAT_VERSION}:{parser_fingerprint()}:{kind}:{digest}"
+            f":{options!r}"
+        )
+        key = hashlib.blake2b(material.encode("utf-8"), digest_size=20).hexdigest()
+        return self.directory / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def _get(
+        self,
+        kind: str,
+        digest: str,
+        options: Optional[ExtractOptions],
+        decode: Callable[[Any], Any],
+    ) -> Any:
+        path = self._entry_path(kind, digest, options)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            value = decode(json.loads(zlib.decompress(data)))
+        except Exception:
+            logger.debug("Discarding unreadable cache entry %s", path)
+            _unlink(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def _put(
+        self,
+        kind: str,
+        digest: str,
+        options: Optional[ExtractOptions],
+        value: Any,
+    ) -> None:
+        path = self._entry_path(kind, digest, options)
+        data = zlib.compress(
+            json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        )
+        if len(data) > self.max_bytes:
+            return
+
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("Could not write cache entry %s: %s", path, e)
+            if tmp_path is not None:
+                _unlink(tmp_path)
+            return
+
+        if self._total_bytes is None:
+            self._total_bytes = self.size
+        else:
+            self._total_bytes += len(data)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        # 다른 프로세스도 쓰므로 축출할 때는 디렉터리를 다시 훑는다
+        entries = sorted(self._scan(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if _unlink(path):
+                total -= size
+        self._total_bytes = total
+
+    def _scan(self):
+        """(path, size, mtime) for every entry"""
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for subdir in os.scandir(self.directory):
+            if not subdir.is_dir():
+                continue
+            for entry in os.scandir(subdir.path):
+                if entry.name.endswith(_ENTRY_SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((Path(entry.path), stat.st_size, stat.st_mtime))
+        return entries
+
+
+def _unlink(path: Path) -> bool:
+    try:
+        path.unlink()
+        return True
+    except OSError:
+        return False
+
+
+def _result_from_json(value: dict) -> ExtractResult:
+    return ExtractResult(
+        text=value["text"],
+        footnotes=[NoteData(**note) for note in value["footnotes"]],
+        endnotes=[NoteData(**note) for note in value["endnotes"]],
+        hyperlinks=[tuple(link) for link in value["hyperlinks"]],
+        memos=[MemoData(**memo) for memo in value["memos"]],
+    )
@@ -1,10 +1,15 @@
 """HWP 5.0 Parser (Pure Python, olefile-based)"""
 
+import re
 import struct
+import sys
 import zlib
 import logging
-from pathlib import Path
-from typing import Optional, List, Tuple, Union, Dict
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import BinaryIO, Optional, List, Tuple, Union, Dict, Iterator, Sequence
 
 try:
     import olefile
@@ -14,20 +19,39 @@ except ImportError:
     OLEFILE_AVAILABLE = False
     olefile = None
 
+from .cache import ExtractionCache
+from .images import inflate_stream, inflated_head_reader, read_image_header
+from .parallel import (
+    ENDNOTE,
+    FOOTNOTE,
+    IMAGE,
+    MEMO,
+    SectionResult,
+    fill_placeholders,
+    map_sections,
+    number_marker,
+    number_markers,
+    placeholder,
+    renumber,
+)
+from .source import InputSource, Source
 from .models import (
     ExtractOptions,
+    ImageMarkerStyle,
     TableData,
     format_image_marker,
     NoteData,
     ExtractResult,
     MemoData,
     ImageData,
+    TextChunk,
     detect_image_format,
 )
 
 logger = logging.getLogger(__name__)
 
 FILE_HEADER_STREAM = "FileHeader"
+FILE_HEADER_SIZE = 40
 BODY_TEXT_STREAM = "BodyText/Section{}"
 
 HWPTAG_BEGIN = 0x10
@@ -54,16 +78,655 @@ CTRL_ID_HYPERLINK = _make_ctrl_id("k", "l", "h", "%")
 CTRL_ID_MEMO = _make_ctrl_id("e", "m", "%", "%")
 CTRL_ID_GSO = _make_ctrl_id(" ", "o", "s", "g")
 
+DEFAULT_SECTION_CACHE_BYTES = 256 * 1024 * 1024
+
+ByteView = Union[bytes, memoryview]
+Record = Tuple[int, int, memoryview]
+
+# 텍스트로 추출하는 유니코드 블록 (BMP, 양 끝 포함)
+# ExtractOptions.allowed_char_ranges로 바꿀 수 있다
+DEFAULT_CHAR_RANGES: Tuple[Tuple[int, int], ...] = (
+    (0x0020, 0x007E),  # Basic Latin
+    (0x00A0, 0x024F),  # Latin-1/Extended-A/Extended-B
+    (0x0250, 0x02AF),  # IPA Extensions
+    (0x0370, 0x03FF),  # Greek and Coptic
+    (0x0400, 0x052F),  # Cyrillic/Supplement
+    (0x0530, 0x058F),  # Armenian
+    (0x0590, 0x05FF),  # Hebrew
+    (0x0600, 0x06FF),  # Arabic
+    (0x0700, 0x074F),  # Syriac
+    (0x0780, 0x07BF),  # Thaana
+    (0x0900, 0x097F),  # Devanagari
+    (0x0980, 0x09FF),  # Bengali
+    (0x0A00, 0x0A7F),  # Gurmukhi
+    (0x0A80, 0x0AFF),  # Gujarati
+    (0x0B00, 0x0B7F),  # Oriya
+    (0x0B80, 0x0BFF),  # Tamil
+    (0x0C00, 0x0C7F),  # Telugu
+    (0x0C80, 0x0CFF),  # Kannada
+    (0x0D00, 0x0D7F),  # Malayalam
+    (0x0D80, 0x0DFF),  # Sinhala
+    (0x0E00, 0x0E7F),  # Thai
+    (0x0E80, 0x0EFF),  # Lao
+    (0x0F00, 0x0FFF),  # Tibetan
+    (0x1000, 0x109F),  # Myanmar
+    (0x10A0, 0x10FF),  # Georgian
+    (0x1100, 0x11FF),  # Hangul Jamo
+    (0x1200, 0x137F),  # Ethiopic
+    (0x13A0, 0x13FF),  # Cherokee
+    (0x1400, 0x167F),  # Canadian Aboriginal
+    (0x1680, 0x169F),  # Ogham
+    (0x16A0, 0x16FF),  # Runic
+    (0x1780, 0x17FF),  # Khmer
+    (0x1800, 0x18AF),  # Mongolian
+    (0x1E00, 0x1EFF),  # Latin Extended Additional
+    (0x1F00, 0x1FFF),  # Greek Extended
+    (0x2000, 0x206F),  # General Punctuation
+    (0x2070, 0x209F),  # Superscripts/Subscripts
+    (0x20A0, 0x20CF),  # Currency Symbols
+    (0x2100, 0x214F),  # Letterlike Symbols
+    (0x2150, 0x218F),  # Number Forms
+    (0x2190, 0x21FF),  # Arrows
+    (0x2200, 0x22FF),  # Mathematical Operators
+    (0x2300, 0x23FF),  # Miscellaneous Technical
+    (0x2400, 0x243F),  # Control Pictures
+    (0x2460, 0x24FF),  # Enclosed Alphanumerics
+    (0x2500, 0x257F),  # Box Drawing
+    (0x2580, 0x259F),  # Block Elements
+    (0x25A0, 0x25FF),  # Geometric Shapes
+    (0x2600, 0x26FF),  # Miscellaneous Symbols
+    (0x2700, 0x27BF),  # Dingbats
+    (0x27C0, 0x27EF),  # Misc Mathematical Symbols-A
+    (0x27F0, 0x27FF),  # Supplemental Arrows-A
+    (0x2800, 0x28FF),  # Braille Patterns
+    (0x2900, 0x297F),  # Supplemental Arrows-B
+    (0x2980, 0x29FF),  # Misc Mathematical Symbols-B
+    (0x2A00, 0x2AFF),  # Supplemental Math Operators
+    (0x2E80, 0x2EFF),  # CJK Radicals Supplement
+    (0x2F00, 0x2FDF),  # Kangxi Radicals
+    (0x3000, 0x303F),  # CJK Symbols and Punctuation
+    (0x3040, 0x309F),  # Hiragana
+    (0x30A0, 0x30FF),  # Katakana
+    (0x3100, 0x312F),  # Bopomofo
+    (0x3130, 0x318F),  # Hangul Compatibility Jamo
+    (0x3190, 0x319F),  # Kanbun
+    (0x31A0, 0x31BF),  # Bopomofo Extended
+    (0x31F0, 0x31FF),  # Katakana Phonetic Extensions
+    (0x3200, 0x32FF),  # Enclosed CJK Letters
+    (0x3300, 0x33FF),  # CJK Compatibility
+    (0x3400, 0x4DBF),  # CJK Unified Ideographs Ext A
+    (0x4E00, 0x9FFF),  # CJK Unified Ideographs
+    (0xA000, 0xA48F),  # Yi Syllables
+    (0xA490, 0xA4CF),  # Yi Radicals
+    (0xAC00, 0xD7AF),  # Hangul Syllables
+    (0xF900, 0xFAFF),  # CJK Compatibility Ideographs
+    (0xFB00, 0xFB4F),  # Alphabetic Presentation Forms
+    (0xFB50, 0xFDFF),  # Arabic Presentation Forms-A
+    (0xFE00, 0xFE0F),  # Variation Selectors
+    (0xFE20, 0xFE2F),  # Combining Half Marks
+    (0xFE30, 0xFE4F),  # CJK Compatibility Forms
+    (0xFE50, 0xFE6F),  # Small Form Variants
+    (0xFE70, 0xFEFF),  # Arabic Presentation Forms-B
+    (0xFF00, 0xFFEF),  # Halfwidth and Fullwidth Forms
+)
+
+# PARA_TEXT에서 분기가 필요한 제어 문자 (0x00-0x1F)
+_CTRL_CHAR_RE = re.compile(r"[\x00-\x1f]")
+
+
+def _build_char_table(ranges: Sequence[Tuple[int, int]]) -> bytearray:
+    """코드 유닛(0x0000-0xFFFF)별 유효 여부 테이블"""
+    table = bytearray(0x10000)
+    for low, high in ranges:
+        low, high = max(low, 0), min(high, 0xFFFF)
+        if low <= high:
+            table[low : high + 1] = b"\x01" * (high - low + 1)
+    return table
+
+
+def _build_invalid_char_re(table: bytearray) -> "re.Pattern":
+    """일반 문자 구간(0x20 이상)에서 유효하지 않은 문자 연속을 찾는 정규식"""
+    blocks = []
+    code = 0x20
+    while code <= 0xFFFF:
+        if table[code]:
+            code = table.find(0, code)
+            if code < 0:
+                break
+            continue
+        end = table.find(1, code)
+        end = 0x10000 if end < 0 else end
+        blocks.append(r"\u%04x-\u%04x" % (code, end - 1))
+        code = end
+    if not blocks:
+        return re.compile("(?!)")
+    return re.compile("[" + "".join(blocks) + "]+")
+
+
+@lru_cache(maxsize=8)
+def _char_filter(ranges: Tuple[Tuple[int, int], ...]) -> Tuple[bytearray, "re.Pattern"]:
+    table = _build_char_table(ranges)
+    return table, _build_invalid_char_re(table)
+
+
+# 기본 블록의 유효 문자 테이블과 무효 문자 정규식 (import 시 한 번 생성)
+_VALID_CHAR_TABLE, _INVALID_CHAR_RE = _char_filter(DEFAULT_CHAR_RANGES)
+
+
+def _decode_code_units(data: ByteView) -> str:
+    """PARA_TEXT를 코드 유닛과 1:1로 대응하는 문자열로 디코딩"""
+    end = len(data) & ~1
+    text = str(data[:end], "utf-16-le", "surrogatepass")
+    if len(text) != end >> 1:
+        # 서로게이트 쌍은 한 글자로 합쳐지므로 유닛 단위로 다시 만든다
+        units = array("H", bytes(data[:end]))
+        if sys.byteorder == "big":
+            units.byteswap()
+        text = "".join(map(chr, units))
+    return text
+
+
+def _is_text_after_ctrl(code: int) -> bool:
+    """제어 문자 바로 뒤가 본문이면 확장 영역이 없는 것으로 본다"""
+    return (
+        0x0020 <= code <= 0x007E
+        or 0xAC00 <= code <= 0xD7AF
+        or 0x3130 <= code <= 0x318F
+        or code in (3, 4, 11, 12, 13)
+        or 15 <= code <= 23
+    )
+
+
+def _find_ctrl_markers(data: ByteView, code: int, ctrl_id: int) -> List[int]:
+    """짝수 오프셋의 ``code`` + ``ctrl_id`` 위치 (코드 유닛 경계만)"""
+    pattern = re.compile(re.escape(struct.pack("<HI", code, ctrl_id)))
+    positions = []
+    match = pattern.search(data)
+    while match is not None:
+        pos = match.start()
+        if pos & 1:
+            match = pattern.search(data, pos + 1)
+            continue
+        positions.append(pos)
+        match = pattern.search(data, pos + 2)
+    return positions
+
+
+class ParagraphTokens:
+    """Token stream of one PARA_TEXT record, produced by a single scan.
+
+    ``units`` is the record decoded one character per UTF-16 code unit and
+    ``controls`` holds the unit indices of control characters (0x00-0x1F);
+    everything between two controls is an ordinary text run. The same scan
+    classifies control events by byte offset: footnote/endnote fields (17),
+    memo and hyperlink field starts (3), and whether an object control (11)
+    is present. Decoders walk ``controls`` instead of rescanning the bytes.
+    """
+
+    __slots__ = (
+        "data",
+        "units",
+        "controls",
+        "footnotes",
+        "endnotes",
+        "memos",
+        "hyperlinks",
+        "has_object",
+    )
+
+    def __init__(self, data: ByteView):
+        self.data = data
+        self.units = units = _decode_code_units(data)
+        self.controls: List[int] = []
+        self.footnotes: List[int] = []
+        self.endnotes: List[int] = []
+        self.memos: List[int] = []
+        self.hyperlinks: List[int] = []
+        self.has_object = False
+
+        last = len(units) - 2
+        for match in _CTRL_CHAR_RE.finditer(units):
+            index = match.start()
+            self.controls.append(index)
+            code = units[index]
+            if code == "\x0b":
+                self.has_object = True
+            elif (code == "\x11" or code == "\x03") and index < last:
+                ctrl_id = self.ctrl_id(index)
+                if code == "\x11":
+                    if ctrl_id == CTRL_ID_FOOTNOTE:
+                        self.footnotes.append(index << 1)
+                    elif ctrl_id == CTRL_ID_ENDNOTE:
+                        self.endnotes.append(index << 1)
+                elif ctrl_id == CTRL_ID_MEMO:
+                    self.memos.append(index << 1)
+                elif ctrl_id == CTRL_ID_HYPERLINK:
+                    self.hyperlinks.append(index << 1)
+
+    def ctrl_id(self, index: int) -> int:
+        """``index`` 위치 제어 문자 뒤의 ctrl-id (유닛 두 개)"""
+        units = self.units
+        return ord(units[index + 1]) | (ord(units[index + 2]) << 16)
+
+    def field_text(self, start: int) -> Tuple[str, int]:
+        """유닛 ``start``부터 필드 끝(4)까지의 문자와 필드 끝 위치"""
+        units = self.units
+        end = units.find("\x04", start)
+        if end < 0:
+            end = len(units)
+        return _CTRL_CHAR_RE.sub("", units[start:end]), end
+
+
+# FileHeader 속성 비트 (offset 36)
+HEADER_FLAG_COMPRESSED = 0x01
+HEADER_FLAG_ENCRYPTED = 0x02
+HEADER_FLAG_DISTRIBUTION = 0x04
+HEADER_FLAG_SCRIPT = 0x08
+HEADER_FLAG_DRM = 0x10
+HEADER_FLAG_XML_TEMPLATE = 0x20
+HEADER_FLAG_HISTORY = 0x40
+HEADER_FLAG_SIGNATURE = 0x80
+HEADER_FLAG_CERT_ENCRYPTED = 0x100
+
+
+@dataclass(frozen=True)
+class FileHeaderInfo:
+    """
+    Parsed HWP 5.0 FileHeader stream.
+
+    Attributes:
+        signature: File signature ("HWP Document File")
+        version: (major, minor, build, revision) tuple
+        properties: Raw property bit field
+    """
+
+    signature: str
+    version: Tuple[int, int, int, int]
+    properties: int
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FileHeaderInfo":
+        signature = data[:32].split(b"\x00", 1)[0].decode("ascii", errors="ignore")
+        version = struct.unpack_from("<I", data, 32)[0]
+        properties = struct.unpack_from("<I", data, 36)[0]
+        return cls(
+            signature=signature,
+            version=(
+                (version >> 24) & 0xFF,
+                (version >> 16) & 0xFF,
+                (version >> 8) & 0xFF,
+                version & 0xFF,
+            ),
+            properties=properties,
+        )
+
+    @property
+    def version_string(self) -> str:
+        return ".".join(str(part) for part in self.version)
+
+    @property
+    def compressed(self) -> bool:
+        return (self.properties & HEADER_FLAG_COMPRESSED) != 0
+
+    @property
+    def encrypted(self) -> bool:
+        return (self.properties & HEADER_FLAG_ENCRYPTED) != 0
+
+    @property
+    def distribution(self) -> bool:
+        return (self.properties & HEADER_FLAG_DISTRIBUTION) != 0
+
+    @property
+    def has_script(self) -> bool:
+        return (self.properties & HEADER_FLAG_SCRIPT) != 0
+
+    @property
+    def drm(self) -> bool:
+        return (self.properties & HEADER_FLAG_DRM) != 0
+
+    @property
+    def xml_template(self) -> bool:
+        return (self.properties & HEADER_FLAG_XML_TEMPLATE) != 0
+
+    @property
+    def has_history(self) -> bool:
+        return (self.properties & HEADER_FLAG_HISTORY) != 0
+
+    @property
+    def signed(self) -> bool:
+        return (self.properties & HEADER_FLAG_SIGNATURE) != 0
+
+    @property
+    def certificate_encrypted(self) -> bool:
+        return (self.properties & HEADER_FLAG_CERT_ENCRYPTED) != 0
+
+
+_RECORD_HEADER = struct.Struct("<I")
+
+
+class RecordTable:
+    """Record index over one decompressed section (no payload copies).
+
+    Records are stored as parallel ``array('I')`` columns of tag, level,
+    payload offset and payload size into a single ``memoryview`` of the
+    section, so indexing a record yields a view rather than a new ``bytes``.
+    Scanners that only need the structure read ``tags``/``levels`` directly.
+
+    The same pass builds the control lookup index: ``ctrl_index`` maps a
+    CTRL_HEADER ctrl-id to the ordered record indices where it occurs, and
+    ``memo_list_indices`` lists the MEMO_LIST records in order.
+
+    ``subtree_end[i]`` is the index of the first record after record ``i``'s
+    subtree (the next record whose level is not deeper), computed in the same
+    pass with a stack of open records, so scanners skip a control, note, memo
+    or table body with one jump instead of comparing levels record by record.
+    The table tree (``tables``) is built on first use and kept with the
+    records.
+    """
+
+    __slots__ = (
+        "buffer",
+        "tags",
+        "levels",
+        "offsets",
+        "sizes",
+        "subtree_end",
+        "ctrl_index",
+        "memo_list_indices",
+        "_tables",
+    )
+
+    def __init__(self, data: ByteView):
+        self.buffer = memoryview(data)
+        self.tags = array("I")
+        self.levels = array("I")
+        self.offsets = array("I")
+        self.sizes = array("I")
+        self.subtree_end = array("I")
+        self.ctrl_index: Dict[int, List[int]] = {}
+        self.memo_list_indices: List[int] = []
+        self._tables: Optional[Dict[int, "TableNode"]] = None
+        self._scan()
+
+    def _scan(self) -> None:
+        buffer = self.buffer
+        unpack_from = _RECORD_HEADER.unpack_from
+        total = len(buffer)
+        offset = 0
+        count = 0
+        tags_append = self.tags.append
+        levels_append = self.levels.append
+        offsets_append = self.offsets.append
+        sizes_append = self.sizes.append
+        subtree_end = self.subtree_end
+        # 아직 끝나지 않은 레코드들 (레벨이 깊어지는 순서)
+        open_levels: List[int] = []
+        open_records: List[int] = []
+
+        while offset + 4 <= total:
+            header_value = unpack_from(buffer, offset)[0]
+            tag_id = header_value & 0x3FF
+            size = (header_value >> 20) & 0xFFF
+            offset += 4
+
+            if size == 0xFFF:
+                if offset + 4 > total:
+                    break
+                size = unpack_from(buffer, offset)[0]
+                offset += 4
+
+            if size == 0 or offset + size > total:
+                offset += size
+                continue
+
+            if tag_id == HWPTAG_CTRL_HEADER and size >= 4:
+                ctrl_id = unpack_from(buffer, offset)[0]
+                self.ctrl_index.setdefault(ctrl_id, []).append(count)
+            elif tag_id == HWPTAG_MEMO_LIST:
+                self.memo_list_indices.append(count)
+
+            level = (header_value >> 10) & 0x3FF
+            while open_levels and open_levels[-1] >= level:
+                open_levels.pop()
+                subtree_end[open_records.pop()] = count
+            open_levels.append(level)
+            open_records.append(count)
+
+            tags_append(tag_id)
+            levels_append(level)
+            offsets_append(offset)
+            sizes_append(size)
+            subtree_end.append(0)
+            count += 1
+            offset += size
+
+        for index in open_records:
+            subtree_end[index] = count
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __getitem__(self, index: int) -> Record:
+        return self.tags[index], self.levels[index], self.data(index)
+
+    def __iter__(self) -> Iterator[Record]:
+        for index in range(len(self.tags)):
+            yield self[index]
+
+    def data(self, index: int) -> memoryview:
+        offset = self.offsets[index]
+        return self.buffer[offset : offset + self.sizes[index]]
+
+    def level_end(self, index: int) -> int:
+        """Index of the first record after ``index`` at a shallower level
+        (record ``index``, its later siblings and all their subtrees)."""
+        subtree_end, levels = self.subtree_end, self.levels
+        level = levels[index]
+        end = subtree_end[index]
+        while end < len(levels) and levels[end] == level:
+            end = subtree_end[end]
+        return end
+
+    def ctrl_id(self, index: int) -> int:
+        if self.sizes[index] >= 4:
+            return _RECORD_HEADER.unpack_from(self.buffer, self.offsets[index])[0]
+        return 0
+
+    @property
+    def tables(self) -> Dict[int, "TableNode"]:
+        """Tables outside other tables by TABLE record index (record order)."""
+        if self._tables is None:
+            self._tables = build_table_tree(self)
+        return self._tables
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.buffer) + len(self.tags) * 20
+
+
+class TableNode:
+    """One table of a section, as record indices.
+
+    ``cells`` holds each cell's content in record order: PARA_TEXT record
+    indices and nested ``TableNode``s. ``end`` is the index of the table's
+    last record.
+    """
+
+    __slots__ = ("index", "rows", "cols", "row_counts", "cells", "end")
+
+    def __init__(self, index: int, rows: int, cols: int, row_counts: List[int]):
+        self.index = index
+        self.rows = rows
+        self.cols = cols
+        self.row_counts = row_counts
+        self.cells: List[List[Union[int, "TableNode"]]] = []
+        self.end = index
+
+
+def build_table_tree(records: RecordTable) -> Dict[int, TableNode]:
+    """
+    Build the tree of every table in ``records`` in one pass.
+
+    Each record is visited once: a nested table is built while reading the
+    cell that contains it and the scan continues after its last record.
+    """
+    tables = {}
+    tags = records.tags
+    i = 0
+    while i < len(tags):
+        if tags[i] == HWPTAG_TABLE:
+            node = _build_table(records, i)
+            if node is not None:
+                tables[i] = node
+                i = node.end + 1
+                continue
+        i += 1
+    return tables
+
+
+def _build_table(records: RecordTable, index: int) -> Optional[TableNode]:
+    parsed = _parse_table_record(records.data(index))
+    if parsed is None:
+        return None
+    node = TableNode(index, *parsed)
+    total_cells = sum(node.row_counts)
+    tags, levels = records.tags, records.levels
+    count = len(tags)
+    table_level = levels[index]
+
+    # 셀은 표 레코드 다음의 LIST_HEADER와 같은 레벨의 LIST_HEADER들
+    i = index + 1
+    while i < count and levels[i] >= table_level and tags[i] != HWPTAG_LIST_HEADER:
+        i += 1
+    if i < count and tags[i] == HWPTAG_LIST_HEADER and levels[i] >= table_level:
+        cell_level = levels[i]
+        while len(node.cells) < total_cells:
+            cell: List[Union[int, TableNode]] = []
+            i = _read_cell(records, i, cell_level, cell)
+            node.cells.append(cell)
+            if not (
+                i < count and tags[i] == HWPTAG_LIST_HEADER and levels[i] == cell_level
+            ):
+                break
+    node.end = i - 1
+    return node
+
+
+def _read_cell(
+    records: RecordTable,
+    start: int,
+    cell_level: int,
+    cell: List[Union[int, TableNode]],
+) -> int:
+    """Collect the cell starting at LIST_HEADER ``start``; return the index
+    of the first record after it."""
+    tags, levels = records.tags, records.levels
+    count = len(tags)
+    i = start + 1
+    while i < count:
+        tag_id = tags[i]
+        level = levels[i]
+        if level < cell_level or (
+            level == cell_level
+            and (tag_id == HWPTAG_LIST_HEADER or tag_id == HWPTAG_TABLE)
+        ):
+            break
+
+        if tag_id == HWPTAG_PARA_TEXT and level > cell_level:
+            cell.append(i)
+        elif tag_id == HWPTAG_TABLE and level > cell_level:
+            nested = _build_table(records, i)
+            if nested is not None:
+                cell.append(nested)
+                i = nested.end + 1
+            else:
+                i = records.level_end(i)
+            continue
+        elif tag_id == HWPTAG_CTRL_HEADER and level > cell_level:
+            # 셀 안 각주/미주 본문은 셀 텍스트에서 제외
+            if records.ctrl_id(i) in (CTRL_ID_FOOTNOTE, CTRL_ID_ENDNOTE):
+                i = records.subtree_end[i]
+                continue
+        i += 1
+    return i
+
+
+def _parse_table_record(data: ByteView) -> Optional[Tuple[int, int, List[int]]]:
+    """(rows, cols, cells per row) from a TABLE record."""
+    if len(data) < 14:
+        return None
+
+    try:
+        rows = struct.unpack_from("<H", data, 4)[0]
+        cols = struct.unpack_from("<H", data, 6)[0]
+
+        offset = 18
+        row_counts = []
+
+        for _ in range(rows):
+            if offset + 2 > len(data):
+                break
+            count = struct.unpack_from("<H", data, offset)[0]
+            row_counts.append(count)
+            offset += 2
+
+        if len(row_counts) != rows:
+            row_counts = [cols] * rows
+
+        return rows, cols, row_counts
+    except struct.error:
+        return None
+
+
+class _ParsedSection:
+    """Decompressed BodyText section and its record table."""
+
+    __slots__ = ("index", "records")
+
+    def __init__(self, index: int, records: RecordTable):
+        self.index = index
+        self.records = records
+
+    @property
+    def data(self) -> memoryview:
+        return self.records.buffer
+
+    @property
+    def nbytes(self) -> int:
+        return self.records.nbytes
+
 
 class HWP5Reader:
-    """HWP 5.0 file reader (pure Python)."""
+    """HWP 5.0 file reader (pure Python).
+
+    Each ``BodyText/SectionN`` stream is decompressed and tokenized into
+    records once, on first use, and shared by every extraction method.
+    Parsed sections are kept in a least-recently-used cache bounded by
+    ``max_section_cache_bytes`` (decompressed data plus the record table);
+    the most recently used section is always kept. Call :meth:`parse` to
+    warm the cache up front.
 
-    def __init__(self, filepath: Union[str, Path]):
+    ``filepath`` may also be the file content (``bytes``, ``memoryview``,
+    ``mmap``) or a binary file object; ``self.filepath`` is then ``None``.
+    """
+
+    def __init__(
+        self,
+        filepath: Source,
+        max_section_cache_bytes: int = DEFAULT_SECTION_CACHE_BYTES,
+    ):
         if not OLEFILE_AVAILABLE:
             raise ImportError("olefile package required: pip install olefile")
 
-        self.filepath = Path(filepath)
+        self._input = InputSource(filepath)
+        self.filepath = self._input.path
+        self.max_section_cache_bytes = max_section_cache_bytes
         self._ole = None
+        self._header: Optional[FileHeaderInfo] = None
+        self._header_loaded = False
+        self._sections: "OrderedDict[int, _ParsedSection]" = OrderedDict()
+        self._section_cache_bytes = 0
+        self._section_count: Optional[int] = None
         self._bin_data_names: List[str] = []
         self._bindata_id_map: Dict[int, str] = {}
         self._image_bindata_queue: List[int] = []
@@ -74,20 +737,28 @@ class HWP5Reader:
         self._memos: List[MemoData] = []
         self._footnote_counter = 0
         self._endnote_counter = 0
-        self._processed_hyperlinks = set()
+        self._footnote_base = 0
+        self._endnote_base = 0
         self._hyperlink_texts = []
+        # 워커에서 섹션 하나만 추출할 때: 번호 마커 대신 자리표시자
+        self._deferred = False
+        self._valid_chars = _VALID_CHAR_TABLE
+        self._invalid_char_re = _INVALID_CHAR_RE
 
     def _open(self):
         if self._ole is None:
-            if not olefile.isOleFile(str(self.filepath)):
-                raise ValueError(f"Invalid HWP file: {self.filepath}")
-            self._ole = olefile.OleFileIO(str(self.filepath))
+            if not olefile.isOleFile(self._input.open_arg()):
+                raise ValueError(f"Invalid HWP file: {self._input.name}")
+            self._ole = olefile.OleFileIO(self._input.open_arg())
         return self._ole
 
     def _close(self):
         if self._ole is not None:
             self._ole.close()
             self._ole = None
+        self._sections.clear()
+        self._section_cache_bytes = 0
+        self._section_count = None
 
     def __enter__(self):
         self._open()
@@ -103,29 +774,31 @@ class HWP5Reader:
         except Exception:
             return False
 
+    @property
+    def header(self) -> Optional[FileHeaderInfo]:
+        """FileHeader properties, read once per reader (None if missing)."""
+        if not self._header_loaded:
+            ole = self._open()
+            header = None
+            if ole.exists(FILE_HEADER_STREAM):
+                data = ole.openstream(FILE_HEADER_STREAM).read(FILE_HEADER_SIZE)
+                if len(data) >= FILE_HEADER_SIZE:
+                    header = FileHeaderInfo.from_bytes(data)
+            self._header = header
+            self._header_loaded = True
+        return self._header
+
     def is_encrypted(self) -> bool:
         try:
-            ole = self._open()
-            if not ole.exists(FILE_HEADER_STREAM):
-                return False
-            header = ole.openstream(FILE_HEADER_STREAM).read(40)
-            if len(header) < 40:
-                return False
-            properties = struct.unpack_from("<I", header, 36)[0]
-            return (properties & 0x02) != 0
+            header = self.header
+            return header.encrypted if header is not None else False
         except Exception:
             return False
 
     def is_compressed(self) -> bool:
         try:
-            ole = self._open()
-            if not ole.exists(FILE_HEADER_STREAM):
-                return True
-            header = ole.openstream(FILE_HEADER_STREAM).read(40)
-            if len(header) < 40:
-                return True
-            properties = struct.unpack_from("<I", header, 36)[0]
-            return (properties & 0x01) != 0
+            header = self.header
+            return header.compressed if header is not None else True
         except Exception:
             return True
 
@@ -186,13 +859,14 @@ class HWP5Reader:
         self._load_bindata_id_map()
         return self._bindata_id_map.get(bindata_id)
 
-    def _extract_image_bindata_ids(
-        self, records: List[Tuple[int, int, bytes]]
-    ) -> List[int]:
+    def _extract_image_bindata_ids(self, records: RecordTable) -> List[int]:
         bindata_ids = []
-        for tag_id, level, data in records:
-            if tag_id == HWPTAG_SHAPE_COMPONENT_PICTURE and len(data) >= 73:
-                bindata_id = struct.unpack_from("<H", data, 71)[0]
+        sizes = records.sizes
+        for i, tag_id in enumerate(records.tags):
+            if tag_id == HWPTAG_SHAPE_COMPONENT_PICTURE and sizes[i] >= 73:
+                bindata_id = struct.unpack_from(
+                    "<H", records.buffer, records.offsets[i] + 71
+                )[0]
                 if bindata_id > 0:
                     bindata_ids.append(bindata_id)
         return bindata_ids
@@ -215,11 +889,13 @@ class HWP5Reader:
                 return data
 
     def _iter_sections(self):
-        ole = self._open()
-        section_idx = 0
-        while ole.exists(BODY_TEXT_STREAM.format(section_idx)):
-            yield section_idx
-            section_idx += 1
+        if self._section_count is None:
+            ole = self._open()
+            section_idx = 0
+            while ole.exists(BODY_TEXT_STREAM.format(section_idx)):
+                section_idx += 1
+            self._section_count = section_idx
+        return iter(range(self._section_count))
 
     def _read_section(self, section_idx: int) -> bytes:
         ole = self._open()
@@ -227,32 +903,42 @@ class HWP5Reader:
         compressed = ole.openstream(stream_name).read()
         return self._decompress(compressed)
 
-    def _parse_records(self, data: bytes):
-        offset = 0
-        while offset < len(data):
-            try:
-                header_value = struct.unpack_from("<I", data, offset)[0]
-            except struct.error:
-                break
+    def _get_section(self, section_idx: int) -> _ParsedSection:
+        """Return the parsed section, decoding it only on a cache miss."""
+        section = self._sections.get(section_idx)
+        if section is not None:
+            self._sections.move_to_end(section_idx)
+            return section
 
-            tag_id = header_value & 0x3FF
-            level = (header_value >> 10) & 0x3FF
-            size = (header_value >> 20) & 0xFFF
-            offset += 4
+        section = _ParsedSection(
+            section_idx, self._parse_records(self._read_section(section_idx))
+        )
+        self._sections[section_idx] = section
+        self._section_cache_bytes += section.nbytes
 
-            if size == 0xFFF:
-                if offset + 4 > len(data):
-                    break
-                size = struct.unpack_from("<I", data, offset)[0]
-                offset += 4
+        while (
+            self._section_cache_bytes > self.max_section_cache_bytes
+            and len(self._sections) > 1
+        ):
+            _, evicted = self._sections.popitem(last=False)
+            self._section_cache_bytes -= evicted.nbytes
 
-            if size == 0 or offset + size > len(data):
-                offset += size if size > 0 else 0
-                continue
+        return section
 
-            record_data = data[offset : offset + size]
-            yield tag_id, level, record_data
-            offset += size
+    def parse(self) -> None:
+        """Decode every BodyText section into the section cache.
+
+        Sections that do not fit in ``max_section_cache_bytes`` are evicted
+        least-recently-used first and decoded again on demand.
+        """
+        if self.is_encrypted():
+            raise ValueError("Encrypted files are not supported")
+
+        for section_idx in self._iter_sections():
+            self._get_section(section_idx)
+
+    def _parse_records(self, data: ByteView) -> RecordTable:
+        return RecordTable(data)
 
     def _reset_counters(self):
         self._image_index = 0
@@ -263,26 +949,179 @@ class HWP5Reader:
         self._footnote_counter = 0
         self._endnote_counter = 0
         self._memo_counter = 0
-        self._processed_hyperlinks = set()
         self._hyperlink_texts = []
 
     def extract_text(self, options: Optional[ExtractOptions] = None) -> str:
         options = options or ExtractOptions()
+        return options.paragraph_separator.join(
+            chunk.text for chunk in self.iter_sections(options)
+        )
+
+    def iter_sections(
+        self, options: Optional[ExtractOptions] = None
+    ) -> Iterator[TextChunk]:
+        """
+        섹션 단위로 텍스트를 생성합니다 (빈 섹션 제외).
+
+        각주/미주 번호는 ``extract_text()``와 같고, 각 청크에는 그 섹션에서
+        나온 각주/미주가 들어 있습니다. 같은 리더에서 다른 추출과 동시에
+        순회하지 마세요 (번호 카운터를 공유합니다).
+
+        ``options.parallel_sections``가 2 이상이면 섹션을 워커 프로세스에서
+        추출하고 번호는 섹션 순서대로 다시 매깁니다 (결과는 같음).
+        """
+        options = options or ExtractOptions()
+        self._start_text_extraction(options)
+
+        sections = list(self._iter_sections())
+        if options.parallel_sections > 1 and len(sections) > 1:
+            results = map_sections(
+                partial(HWP5Reader, max_section_cache_bytes=0),
+                self._input,
+                sections,
+                options,
+            )
+        else:
+            results = (None for _ in sections)
+
+        for section_idx, result in zip(sections, results):
+            notes = self._note_counts()
+            section_text = None
+            if result is not None:
+                section_text = self._merge_section(result, options)
+            if section_text is None:
+                records = self._get_section(section_idx).records
+                section_text = self._extract_section_text(records, options)
+            if section_text.strip():
+                yield self._text_chunk(section_idx, None, section_text, notes)
+
+    def _extract_section_deferred(
+        self, section_idx: int, options: ExtractOptions
+    ) -> SectionResult:
+        """섹션 하나를 추출 (워커 프로세스용, 번호는 섹션 안에서의 순번)"""
+        self._start_text_extraction(options)
+        self._deferred = True
+        try:
+            records = self._get_section(section_idx).records
+            text = self._extract_section_text(records, options)
+        finally:
+            self._deferred = False
+
+        memo_texts = []
+        if self._memos:
+            memo_texts = [
+                self._extract_memo_text(records, i) for i in records.memo_list_indices
+            ]
+        return SectionResult(
+            text=text,
+            footnotes=self._footnotes,
+            endnotes=self._endnotes,
+            memos=self._memos,
+            hyperlinks=self._hyperlinks,
+            images=(self._image_index, self._image_bindata_queue),
+            memo_texts=memo_texts,
+        )
+
+    def _merge_section(
+        self, result: SectionResult, options: ExtractOptions
+    ) -> Optional[str]:
+        """
+        워커 결과에 이 섹션 앞까지의 번호를 적용 (순차 추출과 같은 결과).
+
+        그림 이름을 찾지 못해 마커가 빠지는 등 자리표시자로 재현할 수 없으면
+        아무것도 반영하지 않고 None을 반환한다.
+        """
+        markers = number_markers(
+            FOOTNOTE, self._footnote_counter, len(result.footnotes)
+        )
+        markers.update(
+            number_markers(ENDNOTE, self._endnote_counter, len(result.endnotes))
+        )
+        markers.update(number_markers(MEMO, self._memo_counter, len(result.memos)))
+
+        image_count, bindata_queue = result.images
+        image_index = self._image_index
+        for local in range(1, image_count + 1):
+            image_name = self._image_name_at(image_index, bindata_queue)
+            if not image_name:
+                if options.image_marker != ImageMarkerStyle.NONE:
+                    return None
+                continue
+            image_index += 1
+            if options.image_marker != ImageMarkerStyle.NONE:
+                markers[f"{IMAGE}{local}"] = format_image_marker(
+                    options.image_marker, image_name, image_index
+                )
+
+        text = fill_placeholders(result.text, markers, options)
+        if text is None:
+            return None
+
+        renumber(result.footnotes, self._footnote_counter)
+        renumber(result.endnotes, self._endnote_counter)
+        renumber(result.memos, self._memo_counter)
+        # 메모 본문은 전체 순번으로 현재 섹션의 메모 목록에서 찾는다
+        for memo in result.memos:
+            occurrence = memo.number
+            memo.text = (
+                result.memo_texts[occurrence - 1]
+                if 0 < occurrence <= len(result.memo_texts)
+                else ""
+            )
+
+        self._footnotes.extend(result.footnotes)
+        self._endnotes.extend(result.endnotes)
+        self._memos.extend(result.memos)
+        self._hyperlinks.extend(result.hyperlinks)
+        self._footnote_counter += len(result.footnotes)
+        self._endnote_counter += len(result.endnotes)
+        self._memo_counter += len(result.memos)
+        self._image_index = image_index
+        return text
+
+    def iter_paragraphs(
+        self, options: Optional[ExtractOptions] = None
+    ) -> Iterator[TextChunk]:
+        """
+        문단 단위로 텍스트를 생성합니다 (표는 하나의 청크).
+
+        번호 규칙은 ``iter_sections()``와 같습니다.
+        """
+        options = options or ExtractOptions()
+        self._start_text_extraction(options)
+
+        for section_idx in self._iter_sections():
+            records = self._get_section(section_idx).records
+            notes = self._note_counts()
+            blocks = self._iter_section_blocks(records, options)
+            for paragraph_idx, (text, _) in enumerate(blocks):
+                yield self._text_chunk(section_idx, paragraph_idx, text, notes)
+                notes = self._note_counts()
+
+    def _start_text_extraction(self, options: ExtractOptions) -> None:
         self._reset_counters()
+        self._use_char_ranges(options)
 
         if self.is_encrypted():
             raise ValueError("Encrypted files are not supported")
 
-        sections_text = []
-        section_files = list(self._iter_sections())
-
-        for section_idx in section_files:
-            section_data = self._read_section(section_idx)
-            section_text = self._extract_section_text(section_data, options)
-            if section_text.strip():
-                sections_text.append(section_text)
+    def _note_counts(self) -> Tuple[int, int]:
+        return len(self._footnotes), len(self._endnotes)
 
-        return options.paragraph_separator.join(sections_text)
+    def _text_chunk(
+        self,
+        section_idx: int,
+        paragraph_idx: Optional[int],
+        text: str,
+        notes: Tuple[int, int],
+    ) -> TextChunk:
+        return TextChunk(
+            section_index=section_idx,
+            paragraph_index=paragraph_idx,
+            text=text,
+            footnotes=self._footnotes[notes[0] :],
+            endnotes=self._endnotes[notes[1] :],
+        )
 
     def extract_text_with_notes(
         self, options: Optional[ExtractOptions] = None
@@ -302,322 +1141,283 @@ class HWP5Reader:
 
         memos = []
         memo_counter = 0
+        self._use_char_ranges(None)
         section_files = list(self._iter_sections())
         if not section_files:
             return memos
 
         last_section_idx = section_files[-1]
-        section_data = self._read_section(last_section_idx)
-        records = list(self._parse_records(section_data))
-
-        for i, (tag_id, level, record_data) in enumerate(records):
-            if tag_id == HWPTAG_MEMO_LIST:
-                memo_text = self._extract_memo_text(records, i)
-                if memo_text.strip():
-                    memo_counter += 1
-                    memos.append(
-                        MemoData(
-                            text=memo_text.strip(),
-                            number=memo_counter,
-                        )
+        records = self._get_section(last_section_idx).records
+
+        for i in records.memo_list_indices:
+            memo_text = self._extract_memo_text(records, i)
+            if memo_text.strip():
+                memo_counter += 1
+                memos.append(
+                    MemoData(
+                        text=memo_text.strip(),
+                        number=memo_counter,
                     )
+                )
 
         return memos
 
     def get_tables(self, options: Optional[ExtractOptions] = None) -> List[TableData]:
         options = options or ExtractOptions()
+        self._use_char_ranges(options)
         if self.is_encrypted():
             raise ValueError("Encrypted files are not supported")
 
         all_tables = []
         for section_idx in self._iter_sections():
-            section_data = self._read_section(section_idx)
-            tables = self._extract_tables_from_section(section_data, options)
+            records = self._get_section(section_idx).records
+            tables = self._extract_tables_from_section(records, options)
             all_tables.extend(tables)
 
         return all_tables
 
     def get_images(self) -> List[ImageData]:
+        images = []
+        for image in self.iter_images():
+            data = image.data
+            fmt = detect_image_format(data)
+            if fmt != "unknown":
+                images.append(
+                    ImageData(
+                        filename=image.filename,
+                        data=data,
+                        index=image.index,
+                        format=fmt,
+                    )
+                )
+        return images
+
+    def list_images(self, probe: bool = False) -> List[ImageData]:
+        """
+        Images without their payloads (see ``iter_images``).
+
+        With ``probe=True`` ``width``/``height`` are filled from the image
+        headers, decompressing only the first few KB of each stream.
+        """
+        return list(self.iter_images(probe))
+
+    def iter_images(self, probe: bool = False) -> Iterator[ImageData]:
+        """
+        Yield images without loading their payloads.
+
+        Only the first bytes of each BinData stream are decompressed to
+        detect the format (and, with ``probe``, the pixel size); ``data`` is
+        decompressed on first access and ``save()`` decompresses straight to
+        disk in chunks. The images stay readable after the reader is closed
+        (the file is opened only for the duration of each read).
+        """
         if self.is_encrypted():
             raise ValueError("Encrypted files are not supported")
 
-        images = []
         ole = self._open()
         self._load_bin_data_names()
 
         for idx, name in enumerate(self._bin_data_names):
             stream_path = ["BinData", name]
-            if ole.exists(stream_path):
-                data = ole.openstream(stream_path).read()
-
-                # Always try raw deflate decompression (HWP uses raw deflate, not zlib wrapper)
-                try:
-                    data = zlib.decompress(data, -15)
-                except zlib.error:
-                    pass  # Keep original data if decompression fails
-
-                fmt = detect_image_format(data)
-                if fmt != "unknown":
-                    images.append(
-                        ImageData(
-                            filename=name,
-                            data=data,
-                            index=idx,
-                            format=fmt,
-                        )
-                    )
-        return images
+            if not ole.exists(stream_path):
+                continue
+            with ole.openstream(stream_path) as source:
+                fmt, width, height = read_image_header(
+                    inflated_head_reader(source), probe
+                )
+            if fmt != "unknown":
+                yield ImageData(
+                    filename=name,
+                    data=None,
+                    index=idx,
+                    format=fmt,
+                    width=width,
+                    height=height,
+                    writer=partial(self._write_bin_data, stream_path),
+                )
+
+    def _write_bin_data(self, stream_path: List[str], out: BinaryIO) -> None:
+        # 닫힌 리더는 다시 열어 두지 않고 이 복사 동안만 연다
+        ole = self._ole or olefile.OleFileIO(self._input.open_arg())
+        try:
+            # HWP uses raw deflate, not the zlib wrapper; undecodable data is kept
+            with ole.openstream(stream_path) as source:
+                inflate_stream(source, out)
+        finally:
+            if ole is not self._ole:
+                ole.close()
 
     def close(self):
         self._close()
 
-    def _extract_memos_from_section(self, data: bytes) -> None:
-        records = list(self._parse_records(data))
-        for i, (tag_id, level, record_data) in enumerate(records):
-            if tag_id == HWPTAG_MEMO_LIST:
-                memo_text = self._extract_memo_text(records, i)
-                if memo_text.strip():
-                    self._memo_counter += 1
-                    self._memos.append(
-                        MemoData(
-                            text=memo_text.strip(),
-                            number=self._memo_counter,
-                        )
+    def _extract_memos_from_section(self, records: RecordTable) -> None:
+        for i in records.memo_list_indices:
+            memo_text = self._extract_memo_text(records, i)
+            if memo_text.strip():
+                self._memo_counter += 1
+                self._memos.append(
+                    MemoData(
+                        text=memo_text.strip(),
+                        number=self._memo_counter,
                     )
+                )
 
-    def _extract_memo_text(
-        self, records: List[Tuple[int, int, bytes]], memo_list_idx: int
-    ) -> str:
+    def _extract_memo_text(self, records: RecordTable, memo_list_idx: int) -> str:
         texts = []
-        start_level = records[memo_list_idx][1] if memo_list_idx < len(records) else 0
-
-        for i in range(memo_list_idx + 1, len(records)):
-            tag_id, level, record_data = records[i]
-            if tag_id == HWPTAG_MEMO_LIST and level <= start_level:
-                break
-            if level < start_level:
-                break
-            if tag_id == HWPTAG_PARA_TEXT:
-                text = self._decode_paragraph_plain(record_data)
+        if memo_list_idx >= len(records):
+            return ""
+        tags, levels = records.tags, records.levels
+        subtree_end = records.subtree_end
+        start_level = levels[memo_list_idx]
+
+        # 메모 본문: 다음 MEMO_LIST 또는 더 얕은 레벨의 레코드 전까지
+        end = subtree_end[memo_list_idx]
+        while (
+            end < len(records)
+            and levels[end] == start_level
+            and tags[end] != HWPTAG_MEMO_LIST
+        ):
+            end = subtree_end[end]
+
+        for i in range(memo_list_idx + 1, end):
+            if tags[i] == HWPTAG_PARA_TEXT:
+                text = self._decode_paragraph_plain(records.data(i))
                 if text.strip():
                     texts.append(text.strip())
 
         return " ".join(texts)
 
-    def _extract_section_text(self, data: bytes, options: ExtractOptions) -> str:
+    def _begin_section(self) -> None:
+        # 각주/미주 본문은 해당 섹션 안에서 몇 번째인지로 찾는다
+        self._footnote_base = self._footnote_counter
+        self._endnote_base = self._endnote_counter
+
+    def _extract_section_text(
+        self, records: RecordTable, options: ExtractOptions
+    ) -> str:
         paragraphs = []
-        records = list(self._parse_records(data))
+        for text, is_table in self._iter_section_blocks(records, options):
+            if is_table:
+                # 테이블 전후에 빈 줄 추가 (HWPX와 동일한 구조)
+                paragraphs.extend(("", text, ""))
+            else:
+                paragraphs.append(text)
+        return options.line_separator.join(paragraphs)
+
+    def _iter_section_blocks(
+        self, records: RecordTable, options: ExtractOptions
+    ) -> Iterator[Tuple[str, bool]]:
+        """섹션 본문의 문단/표 텍스트를 순서대로 생성 (text, is_table)"""
         ctrl_queue = []
         i = 0
-        memo_section_level = None
-        note_section_level = None
+
+        self._begin_section()
 
         self._image_bindata_queue = self._extract_image_bindata_ids(records)
 
-        table_ranges = self._find_table_ranges(records)
+        tables = records.tables
 
         self._hyperlink_texts = self._collect_hyperlink_texts(records)
 
+        tags = records.tags
         while i < len(records):
-            tag_id, level, record_data = records[i]
+            tag_id = tags[i]
 
+            # 메모 목록은 같은 레벨의 뒤따르는 레코드까지 본문에서 제외
             if tag_id == HWPTAG_MEMO_LIST:
-                memo_section_level = level
-                i += 1
+                i = records.level_end(i)
                 continue
 
-            if memo_section_level is not None:
-                if level < memo_section_level:
-                    memo_section_level = None
-                else:
-                    i += 1
-                    continue
-
-            # 각주/미주 섹션 내부 스킵 (본문에서 분리)
-            if note_section_level is not None:
-                if level <= note_section_level:
-                    note_section_level = None  # 섹션 종료
-                else:
-                    i += 1
-                    continue  # 각주/미주 내용 스킵
-
-            if i in table_ranges:
-                table_start, table_end = table_ranges[i]
-                table_data = self._extract_table_at(records, table_start, options)
+            table = tables.get(i)
+            if table is not None:
+                table_data = self._render_table(records, table, options)
                 if table_data and table_data.rows:
-                    table_text = table_data.format(
-                        options.table_style, options.table_delimiter
+                    yield (
+                        table_data.format(options.table_style, options.table_delimiter),
+                        True,
                     )
-                    # 테이블 전후에 빈 줄 추가 (HWPX와 동일한 구조)
-                    paragraphs.append("")
-                    paragraphs.append(table_text)
-                    paragraphs.append("")
 
                 # 표 범위 건너뛰기
-                i = table_end + 1
+                i = table.end + 1
                 continue
 
             if tag_id == HWPTAG_CTRL_HEADER:
-                ctrl_id = self._read_ctrl_id(record_data)
-                # 각주/미주 섹션 시작 감지
-                if ctrl_id in (CTRL_ID_FOOTNOTE, CTRL_ID_ENDNOTE):
-                    note_section_level = level
+                ctrl_id = records.ctrl_id(i)
                 ctrl_queue.append((ctrl_id, i))
+                # 각주/미주 본문은 본문에서 분리 (하위 레코드 건너뛰기)
+                if ctrl_id in (CTRL_ID_FOOTNOTE, CTRL_ID_ENDNOTE):
+                    i = records.subtree_end[i]
+                    continue
 
             elif tag_id == HWPTAG_PARA_TEXT:
                 para_text = self._decode_paragraph_with_notes(
-                    record_data, options, records, i, ctrl_queue
+                    records.data(i), options, records, i, ctrl_queue
                 )
                 if para_text.strip() or options.include_empty_paragraphs:
-                    paragraphs.append(para_text)
+                    yield para_text, False
 
             i += 1
 
-        return options.line_separator.join(paragraphs)
-
-    def _read_ctrl_id(self, record_data: bytes) -> int:
-        if len(record_data) >= 4:
-            return struct.unpack_from("<I", record_data, 0)[0]
-        return 0
-
-    def _find_table_ranges(
-        self, records: List[Tuple[int, int, bytes]]
-    ) -> Dict[int, Tuple[int, int]]:
-        """표의 시작과 끝 인덱스를 미리 계산"""
-        table_ranges = {}
-        i = 0
-
-        while i < len(records):
-            tag_id, level, record_data = records[i]
-
-            if tag_id == HWPTAG_TABLE:
-                table_start = i
-                parsed = self._parse_table_record(record_data)
-
-                if parsed:
-                    rows, cols, row_counts = parsed
-                    total_cells = sum(row_counts)
-
-                    # 모든 셀(LIST_HEADER)을 찾을 때까지 진행
-                    cells_found = 0
-                    j = i + 1
-                    table_end = i
-
-                    while j < len(records) and cells_found < total_cells:
-                        jtag, jlevel, jdata = records[j]
-                        if jtag == HWPTAG_LIST_HEADER:
-                            cells_found += 1
-                            if cells_found == total_cells:
-                                # 마지막 셀 - 이 셀의 끝까지 찾기
-                                cell_level = jlevel
-                                k = j + 1
-                                while k < len(records):
-                                    ktag, klevel, kdata = records[k]
-                                    if (
-                                        klevel <= cell_level
-                                        and ktag == HWPTAG_LIST_HEADER
-                                    ):
-                                        break
-                                    if klevel < cell_level:
-                                        break
-                                    k += 1
-                                table_end = k - 1
-                                break
-                        j += 1
-
-                    if table_end <= table_start:
-                        table_end = j - 1 if j > i else i
-
-                    table_ranges[table_start] = (table_start, table_end)
-                    i = table_end + 1
-                    continue
-
-            i += 1
-
-        return table_ranges
-
-    def _extract_table_at(
+    def _render_table(
         self,
-        records: List[Tuple[int, int, bytes]],
-        table_record_idx: int,
+        records: RecordTable,
+        table: TableNode,
         options: ExtractOptions,
+        rendered: Optional[Dict[int, Optional[TableData]]] = None,
     ) -> Optional[TableData]:
-        tag_id, level, record_data = records[table_record_idx]
-        if tag_id != HWPTAG_TABLE:
-            return None
-
-        table_info = self._parse_table_record(record_data)
-        if not table_info:
-            return None
-
-        rows, cols, row_counts = table_info
-        total_cells = sum(row_counts)
-
-        cells_text = []
-        cell_idx = 0
-        j = table_record_idx + 1
-        note_section_level = None
-
-        while j < len(records) and cell_idx < total_cells:
-            cell_tag, cell_level, cell_data = records[j]
-
-            if note_section_level is not None:
-                if cell_level <= note_section_level:
-                    note_section_level = None
-                else:
-                    j += 1
-                    continue
-
-            if cell_tag == HWPTAG_CTRL_HEADER:
-                ctrl_id = self._read_ctrl_id(cell_data)
-                if ctrl_id in (CTRL_ID_FOOTNOTE, CTRL_ID_ENDNOTE):
-                    note_section_level = cell_level
-                    j += 1
-                    continue
-
-            if cell_tag == HWPTAG_LIST_HEADER:
-                cell_text = self._extract_cell_text(records, j, options)
-                cells_text.append(cell_text)
-                cell_idx += 1
-            j += 1
-
+        """
+        Decode a table's cells; nested tables become inline cell text.
+
+        Every table of the tree is decoded exactly once, in record order. With
+        ``rendered``, each table's result (nested ones included) is also
+        stored there by TABLE record index.
+        """
+        cells_text = [
+            self._render_cell(records, cell, options, rendered) for cell in table.cells
+        ]
+        table_data = None
         if cells_text:
-            return self._build_table_data(rows, cols, row_counts, cells_text)
-        return None
+            table_data = self._build_table_data(
+                table.rows, table.cols, table.row_counts, cells_text
+            )
+        if rendered is not None:
+            rendered[table.index] = table_data
+        return table_data
+
+    def _render_cell(
+        self,
+        records: RecordTable,
+        cell: List[Union[int, TableNode]],
+        options: ExtractOptions,
+        rendered: Optional[Dict[int, Optional[TableData]]],
+    ) -> str:
+        texts = []
+        for item in cell:
+            if isinstance(item, TableNode):
+                nested_table = self._render_table(records, item, options, rendered)
+                if nested_table and nested_table.rows:
+                    texts.append(nested_table.to_inline())
+                continue
+            text = self._decode_cell_paragraph_with_markers(
+                records.data(item), records, options
+            )
+            if text.strip():
+                texts.append(text.strip())
+        return " ".join(texts)
 
     def _decode_paragraph_with_notes(
         self,
-        record_data: bytes,
+        record_data: ByteView,
         options: ExtractOptions,
-        records: List[Tuple[int, int, bytes]],
+        records: RecordTable,
         para_record_idx: int,
         ctrl_queue: List[Tuple[int, int]],
     ) -> str:
-        footnote_positions = self._find_note_markers(record_data, CTRL_ID_FOOTNOTE)
-        endnote_positions = self._find_note_markers(record_data, CTRL_ID_ENDNOTE)
-        memo_markers = self._find_memo_markers(record_data)
-
-        for pos in footnote_positions:
-            self._footnote_counter += 1
-            fn_text = self._find_note_text(
-                records, CTRL_ID_FOOTNOTE, self._footnote_counter
-            )
-            self._footnotes.append(
-                NoteData(
-                    note_type="footnote", number=self._footnote_counter, text=fn_text
-                )
-            )
-
-        for pos in endnote_positions:
-            self._endnote_counter += 1
-            en_text = self._find_note_text(
-                records, CTRL_ID_ENDNOTE, self._endnote_counter
-            )
-            self._endnotes.append(
-                NoteData(
-                    note_type="endnote", number=self._endnote_counter, text=en_text
-                )
-            )
+        tokens = ParagraphTokens(record_data)
+        self._register_notes(tokens, records)
+        memo_markers = [
+            (pos, self._extract_memo_ref_text(tokens, pos + 14)) for pos in tokens.memos
+        ]
 
         for pos, ref_text in memo_markers:
             self._memo_counter += 1
@@ -625,326 +1425,187 @@ class HWP5Reader:
             self._memos.append(
                 MemoData(
                     text=memo_text,
-                    number=self._memo_counter,
+                    number=None if self._deferred else self._memo_counter,
                     referenced_text=ref_text if ref_text else None,
                 )
             )
 
         self._extract_hyperlinks_from_queue(ctrl_queue, records)
-        is_image_gso = self._has_image_gso(record_data, records, para_record_idx)
+        is_image_gso = self._has_image_gso(tokens, records, para_record_idx)
         return self._decode_paragraph_text_with_markers(
-            record_data,
+            tokens,
             options,
-            footnote_positions,
-            endnote_positions,
+            tokens.footnotes,
+            tokens.endnotes,
             memo_markers,
             is_image_gso,
         )
 
-    def _find_note_markers(self, data: bytes, target_ctrl_id: int) -> List[int]:
-        positions = []
-        i = 0
-        while i < len(data) - 5:
-            code = struct.unpack_from("<H", data, i)[0]
-            if code == CTRL_CHAR_FIELD:
-                ctrl_id = struct.unpack_from("<I", data, i + 2)[0]
-                if ctrl_id == target_ctrl_id:
-                    positions.append(i)
-            i += 2
-        return positions
+    def _register_notes(self, tokens: ParagraphTokens, records: RecordTable) -> None:
+        for pos in tokens.footnotes:
+            self._footnote_counter += 1
+            fn_text = self._find_note_text(
+                records, CTRL_ID_FOOTNOTE, self._footnote_counter - self._footnote_base
+            )
+            self._footnotes.append(
+                NoteData(
+                    note_type="footnote",
+                    number=None if self._deferred else self._footnote_counter,
+                    text=fn_text,
+                )
+            )
 
-    def _find_memo_markers(self, data: bytes) -> List[Tuple[int, str]]:
-        markers = []
-        i = 0
-        while i < len(data) - 5:
-            code = struct.unpack_from("<H", data, i)[0]
-            if code == 3:
-                ctrl_id = struct.unpack_from("<I", data, i + 2)[0]
-                if ctrl_id == CTRL_ID_MEMO:
-                    ref_text = self._extract_memo_ref_text(data, i + 14)
-                    markers.append((i, ref_text))
-            i += 2
-        return markers
+        for pos in tokens.endnotes:
+            self._endnote_counter += 1
+            en_text = self._find_note_text(
+                records, CTRL_ID_ENDNOTE, self._endnote_counter - self._endnote_base
+            )
+            self._endnotes.append(
+                NoteData(
+                    note_type="endnote",
+                    number=None if self._deferred else self._endnote_counter,
+                    text=en_text,
+                )
+            )
 
-    def _extract_memo_ref_text(self, data: bytes, start: int) -> str:
-        chars = []
-        i = start
-        if i < len(data) - 1:
-            code = struct.unpack_from("<H", data, i)[0]
-            if code == 3:
-                i += 2
-        while i < len(data) - 1:
-            code = struct.unpack_from("<H", data, i)[0]
-            if code == 4:
-                break
-            elif code >= 32:
-                chars.append(chr(code))
-            i += 2
-        return "".join(chars)
+    def _extract_memo_ref_text(self, tokens: ParagraphTokens, start: int) -> str:
+        index = start >> 1
+        if index < len(tokens.units) and tokens.units[index] == "\x03":
+            index += 1
+        return tokens.field_text(index)[0]
 
-    def _skip_memo_field(self, data: bytes, start: int) -> int:
+    def _skip_memo_field(self, tokens: ParagraphTokens, start: int) -> int:
+        units = tokens.units
         i = start + 14
-        if i < len(data) - 1:
-            code = struct.unpack_from("<H", data, i)[0]
-            if code == 3:
-                i += 2
-        while i < len(data) - 1:
-            code = struct.unpack_from("<H", data, i)[0]
-            if code == 4:
-                i += 14
-                if i < len(data) - 1:
-                    next_code = struct.unpack_from("<H", data, i)[0]
-                    if next_code == 4:
-                        i += 2
-                break
+        if (i >> 1) < len(units) and units[i >> 1] == "\x03":
+            i += 2
+        end = units.find("\x04", i >> 1)
+        if end < 0:
+            return max(i, len(units) << 1)
+        i = (end << 1) + 14
+        if (i >> 1) < len(units) and units[i >> 1] == "\x04":
             i += 2
         return i
 
     def _decode_paragraph_text_with_markers(
         self,
-        record_data: bytes,
+        tokens: ParagraphTokens,
         options: ExtractOptions,
         footnote_positions: List[int],
         endnote_positions: List[int],
         memo_markers: Optional[List[Tuple[int, str]]] = None,
         is_image_gso: bool = False,
     ) -> str:
-        note_positions = set(footnote_positions + endnote_positions)
-        memo_positions = {pos: ref_text for pos, ref_text in (memo_markers or [])}
-        chars = []
-        i = 0
-        fn_count = 0
-        en_count = 0
-        memo_count = 0
-
-        fn_start = self._footnote_counter - len(footnote_positions)
-        en_start = self._endnote_counter - len(endnote_positions)
-        memo_start = self._memo_counter - len(memo_markers or [])
-
-        while i < len(record_data) - 1:
-            code = struct.unpack_from("<H", record_data, i)[0]
-
-            if i in footnote_positions:
-                fn_count += 1
-                chars.append(f"[^{fn_start + fn_count}]")
-                i += 2 + EXTENDED_CTRL_EXT_SIZE
-                continue
-            elif i in endnote_positions:
-                en_count += 1
-                chars.append(f"[^e{en_start + en_count}]")
-                i += 2 + EXTENDED_CTRL_EXT_SIZE
-                continue
-            elif i in memo_positions:
-                memo_count += 1
-                memo_num = memo_start + memo_count
-                ref_text = memo_positions[i]
-                chars.append(ref_text)
-                chars.append(f"[MEMO:{memo_num}]")
-                i = self._skip_memo_field(record_data, i)
-                continue
-
-            i += 2
-
-            if code < 8:
-                if code == 0:
-                    pass
-                elif code in (2, 3, 4):
-                    if i + 2 <= len(record_data) - 1:
-                        next_code = struct.unpack_from("<H", record_data, i)[0]
-                        if (
-                            0x0020 <= next_code <= 0x007E
-                            or 0xAC00 <= next_code <= 0xD7AF
-                            or 0x3130 <= next_code <= 0x318F
-                            or next_code in (3, 4, 11, 12, 13)
-                            or 15 <= next_code <= 23
-                        ):
-                            pass
-                        else:
-                            i += EXTENDED_CTRL_EXT_SIZE
-                    else:
-                        i += EXTENDED_CTRL_EXT_SIZE
-                else:
-                    i += INLINE_CTRL_EXT_SIZE
-            elif code == 9:
-                chars.append("\t")
-            elif code == 10 or code == 13:
-                pass
-            elif 11 <= code <= 12:
-                if code == 11:
-                    if i + 4 <= len(record_data):
-                        ctrl_id = struct.unpack_from("<I", record_data, i)[0]
-                        if ctrl_id == CTRL_ID_GSO:
-                            marker = self._handle_control_char(code, options)
-                            if marker:
-                                chars.append(marker)
-                            i += EXTENDED_CTRL_EXT_SIZE
-                        elif self._is_valid_ctrl_id(ctrl_id):
-                            i += EXTENDED_CTRL_EXT_SIZE
-                else:
-                    i += INLINE_CTRL_EXT_SIZE
-            elif code == CTRL_CHAR_FIELD:
-                if i + 4 <= len(record_data):
-                    ctrl_id = struct.unpack_from("<I", record_data, i)[0]
-                    if ctrl_id in (
-                        CTRL_ID_FOOTNOTE,
-                        CTRL_ID_ENDNOTE,
-                        CTRL_ID_HYPERLINK,
-                    ):
-                        i += EXTENDED_CTRL_EXT_SIZE
-                    elif self._is_valid_ctrl_id(ctrl_id):
-                        i += EXTENDED_CTRL_EXT_SIZE
-                    else:
-                        pass
-                else:
-                    i += EXTENDED_CTRL_EXT_SIZE
-            elif 15 <= code <= 23:
-                if i + 2 <= len(record_data) - 1:
-                    next_code = struct.unpack_from("<H", record_data, i)[0]
-                    if (
-                        0x0020 <= next_code <= 0x007E
-                        or 0xAC00 <= next_code <= 0xD7AF
-                        or 0x3130 <= next_code <= 0x318F
-                        or next_code in (3, 4, 11, 12, 13)
-                        or 15 <= next_code <= 23
-                    ):
-                        pass
-                    else:
-                        i += EXTENDED_CTRL_EXT_SIZE
-                else:
-                    i += EXTENDED_CTRL_EXT_SIZE
-            elif code < 32:
-                pass
-            else:
-                if self._is_valid_char(code):
-                    chars.append(chr(code))
-
-        return "".join(chars)
+        return self._decode_para_text(
+            tokens,
+            "\t",
+            options,
+            field_ctrl_ids=True,
+            footnote_positions=footnote_positions,
+            endnote_positions=endnote_positions,
+            memo_markers=memo_markers or (),
+        )
 
     def _find_note_text(
         self,
-        records: List[Tuple[int, int, bytes]],
+        records: RecordTable,
         target_ctrl_id: int,
         occurrence: int,
     ) -> str:
-        count = 0
-        for i, (tag_id, level, record_data) in enumerate(records):
-            if tag_id == HWPTAG_CTRL_HEADER:
-                ctrl_id = self._read_ctrl_id(record_data)
-                if ctrl_id == target_ctrl_id:
-                    count += 1
-                    if count == occurrence:
-                        return self._extract_note_text(records, i)
+        positions = records.ctrl_index.get(target_ctrl_id, ())
+        if 0 < occurrence <= len(positions):
+            return self._extract_note_text(records, positions[occurrence - 1])
         return ""
 
     def _find_memo_content(
         self,
-        records: List[Tuple[int, int, bytes]],
+        records: RecordTable,
         occurrence: int,
     ) -> str:
-        count = 0
-        for i, (tag_id, level, record_data) in enumerate(records):
-            if tag_id == HWPTAG_MEMO_LIST:
-                count += 1
-                if count == occurrence:
-                    return self._extract_memo_text(records, i)
+        positions = records.memo_list_indices
+        if 0 < occurrence <= len(positions):
+            return self._extract_memo_text(records, positions[occurrence - 1])
         return ""
 
-    def _extract_note_text(
-        self, records: List[Tuple[int, int, bytes]], ctrl_record_idx: int
-    ) -> str:
+    def _extract_note_text(self, records: RecordTable, ctrl_record_idx: int) -> str:
         texts = []
-        start_level = (
-            records[ctrl_record_idx][1] if ctrl_record_idx < len(records) else 0
-        )
+        if ctrl_record_idx >= len(records):
+            return ""
+        tags = records.tags
+        end = min(ctrl_record_idx + 50, records.subtree_end[ctrl_record_idx])
 
-        for i in range(ctrl_record_idx + 1, min(ctrl_record_idx + 50, len(records))):
-            tag_id, level, record_data = records[i]
-            if level <= start_level:
-                break
-            if tag_id == HWPTAG_PARA_TEXT and level > start_level:
-                text = self._decode_paragraph_plain(record_data)
+        for i in range(ctrl_record_idx + 1, end):
+            if tags[i] == HWPTAG_PARA_TEXT:
+                text = self._decode_paragraph_plain(records.data(i))
                 if text.strip():
                     texts.append(text.strip())
 
         return " ".join(texts)
 
     def _extract_hyperlinks_from_queue(
-        self, ctrl_queue: List[Tuple[int, int]], records: List[Tuple[int, int, bytes]]
+        self, ctrl_queue: List[Tuple[int, int]], records: RecordTable
     ) -> None:
         for ctrl_id, ctrl_record_idx in ctrl_queue:
             if ctrl_id == CTRL_ID_HYPERLINK:
-                if ctrl_record_idx in self._processed_hyperlinks:
-                    continue
-                self._processed_hyperlinks.add(ctrl_record_idx)
                 hyperlink_data = self._extract_hyperlink_data(records, ctrl_record_idx)
                 if hyperlink_data:
                     self._hyperlinks.append(hyperlink_data)
+        # 큐에 쌓인 컨트롤은 한 번만 처리한다
+        ctrl_queue.clear()
 
-    def _collect_hyperlink_texts(
-        self, records: List[Tuple[int, int, bytes]]
-    ) -> List[str]:
+    def _collect_hyperlink_texts(self, records: RecordTable) -> List[str]:
         texts = []
-        for tag_id, _, record_data in records:
+        for i, tag_id in enumerate(records.tags):
             if tag_id == HWPTAG_PARA_TEXT:
-                texts.extend(self._extract_hyperlink_texts_from_para(record_data))
+                data = records.data(i)
+                # 하이퍼링크 필드가 없는 문단은 토큰화하지 않는다
+                if _find_ctrl_markers(data, 3, CTRL_ID_HYPERLINK):
+                    tokens = ParagraphTokens(data)
+                    texts.extend(self._extract_hyperlink_texts_from_para(tokens))
         return texts
 
-    def _extract_hyperlink_texts_from_para(self, para_data: bytes) -> List[str]:
+    def _extract_hyperlink_texts_from_para(self, tokens: ParagraphTokens) -> List[str]:
         hyperlink_texts = []
+        if not tokens.hyperlinks:
+            return hyperlink_texts
+
+        units, controls = tokens.units, tokens.controls
+        size = len(tokens.data)
+        p = 0
         i = 0
 
-        while i < len(para_data) - 1:
-            code = struct.unpack_from("<H", para_data, i)[0]
-
-            if code == 0x03:
-                if i + 6 <= len(para_data):
-                    ctrl_id = struct.unpack_from("<I", para_data, i + 2)[0]
-
-                    if ctrl_id == CTRL_ID_HYPERLINK:
-                        text_start = i + 14
-                        text_chars = []
-                        j = text_start
-
-                        while j < len(para_data) - 1:
-                            c = struct.unpack_from("<H", para_data, j)[0]
-                            if c == 0x04:
-                                break
-                            elif c == 0x03:
-                                j += 2
-                            elif 0x20 <= c < 0x10000:
-                                text_chars.append(chr(c))
-                                j += 2
-                            else:
-                                j += 2
-
-                        if text_chars:
-                            hyperlink_texts.append("".join(text_chars))
-                        i = j
-                        continue
-                    else:
-                        i += 14
-                        continue
-            elif code == 0x04:
-                i += 10
-            elif code < 32:
-                if code in (11, 12):
-                    i += 10
-                elif 15 <= code <= 23:
-                    i += 14
+        while i < size - 1:
+            while p < len(controls) and controls[p] < (i >> 1):
+                p += 1
+            if p == len(controls):
+                break
+            i = controls[p] << 1
+            code = ord(units[controls[p]])
+
+            if code == 0x03 and i + 6 <= size:
+                if tokens.ctrl_id(i >> 1) == CTRL_ID_HYPERLINK:
+                    text, end = tokens.field_text((i + 14) >> 1)
+                    if text:
+                        hyperlink_texts.append(text)
+                    i = max(end << 1, i + 14)
                 else:
-                    i += 2
+                    i += 14
+            elif code == 0x04 or code in (11, 12):
+                i += 10
+            elif 15 <= code <= 23:
+                i += 14
             else:
                 i += 2
 
         return hyperlink_texts
 
     def _extract_hyperlink_data(
-        self, records: List[Tuple[int, int, bytes]], ctrl_record_idx: int
+        self, records: RecordTable, ctrl_record_idx: int
     ) -> Optional[Tuple[str, str]]:
         if ctrl_record_idx >= len(records):
             return None
 
-        _, _, ctrl_data = records[ctrl_record_idx]
+        ctrl_data = records.data(ctrl_record_idx)
         if len(ctrl_data) < 11:
             return None
 
@@ -955,7 +1616,7 @@ class HWP5Reader:
         link_text = self._hyperlink_texts.pop(0) if self._hyperlink_texts else ""
         return (link_text, url) if link_text else None
 
-    def _try_extract_url_from_ctrl(self, ctrl_data: bytes) -> Optional[str]:
+    def _try_extract_url_from_ctrl(self, ctrl_data: ByteView) -> Optional[str]:
         if len(ctrl_data) < 11:
             return None
         try:
@@ -963,9 +1624,7 @@ class HWP5Reader:
             if str_len <= 0 or 11 + str_len * 2 > len(ctrl_data):
                 return None
 
-            command = ctrl_data[11 : 11 + str_len * 2].decode(
-                "utf-16-le", errors="ignore"
-            )
+            command = str(ctrl_data[11 : 11 + str_len * 2], "utf-16-le", "ignore")
             url = command.replace("\\:", ":").replace("\\?", "?").replace("\\;", ";")
             if ";" in url:
                 url = url.split(";")[0]
@@ -976,15 +1635,25 @@ class HWP5Reader:
             pass
         return None
 
+    def _image_name_at(
+        self, image_index: int, bindata_queue: Sequence[int]
+    ) -> Optional[str]:
+        image_name = None
+        if image_index < len(bindata_queue):
+            image_name = self._get_image_name_by_bindata_id(bindata_queue[image_index])
+        return image_name or self._get_image_name(image_index)
+
     def _handle_control_char(self, code: int, options: ExtractOptions) -> Optional[str]:
         if code == 11:
-            if self._image_index < len(self._image_bindata_queue):
-                bindata_id = self._image_bindata_queue[self._image_index]
-                image_name = self._get_image_name_by_bindata_id(bindata_id)
-                if not image_name:
-                    image_name = self._get_image_name(self._image_index)
-            else:
-                image_name = self._get_image_name(self._image_index)
+            if self._deferred:
+                # 그림 이름과 번호는 앞 섹션의 그림 수에 따라 병합할 때 정한다
+                self._image_index += 1
+                if options.image_marker == ImageMarkerStyle.NONE:
+                    return None
+                return placeholder(IMAGE, self._image_index)
+            image_name = self._image_name_at(
+                self._image_index, self._image_bindata_queue
+            )
             if image_name:
                 self._image_index += 1
                 return format_image_marker(
@@ -994,27 +1663,17 @@ class HWP5Reader:
 
     def _has_image_gso(
         self,
-        record_data: bytes,
-        records: List[Tuple[int, int, bytes]],
+        tokens: ParagraphTokens,
+        records: RecordTable,
         para_record_idx: int,
     ) -> bool:
-        has_code_11 = False
-        i = 0
-        while i < len(record_data) - 1:
-            code = struct.unpack_from("<H", record_data, i)[0]
-            if code == 11:
-                has_code_11 = True
-                break
-            i += 2
-
-        if not has_code_11:
+        if not tokens.has_object:
             return False
 
+        tags, sizes = records.tags, records.sizes
         for j in range(para_record_idx + 1, min(para_record_idx + 20, len(records))):
-            tag_id, level, data = records[j]
-            if tag_id == HWPTAG_CTRL_HEADER and len(data) >= 4:
-                ctrl_id = struct.unpack_from("<I", data, 0)[0]
-                return ctrl_id == CTRL_ID_GSO
+            if tags[j] == HWPTAG_CTRL_HEADER and sizes[j] >= 4:
+                return records.ctrl_id(j) == CTRL_ID_GSO
         return False
 
     def _is_valid_ctrl_id(self, ctrl_id: int) -> bool:
@@ -1024,443 +1683,167 @@ class HWP5Reader:
                 return False
         return True
 
+    def _use_char_ranges(self, options: Optional[ExtractOptions]) -> None:
+        ranges = options.allowed_char_ranges if options else None
+        if ranges is None:
+            self._valid_chars = _VALID_CHAR_TABLE
+            self._invalid_char_re = _INVALID_CHAR_RE
+        else:
+            self._valid_chars, self._invalid_char_re = _char_filter(
+                tuple((int(low), int(high)) for low, high in ranges)
+            )
+
     def _is_valid_char(self, code: int) -> bool:
-        return (
-            0x0020 <= code <= 0x007E  # Basic Latin
-            or 0x00A0 <= code <= 0x024F  # Latin-1/Extended-A/Extended-B
-            or 0x0250 <= code <= 0x02AF  # IPA Extensions
-            or 0x0370 <= code <= 0x03FF  # Greek and Coptic
-            or 0x0400 <= code <= 0x052F  # Cyrillic/Supplement
-            or 0x0530 <= code <= 0x058F  # Armenian
-            or 0x0590 <= code <= 0x05FF  # Hebrew
-            or 0x0600 <= code <= 0x06FF  # Arabic
-            or 0x0700 <= code <= 0x074F  # Syriac
-            or 0x0780 <= code <= 0x07BF  # Thaana
-            or 0x0900 <= code <= 0x097F  # Devanagari
-            or 0x0980 <= code <= 0x09FF  # Bengali
-            or 0x0A00 <= code <= 0x0A7F  # Gurmukhi
-            or 0x0A80 <= code <= 0x0AFF  # Gujarati
-            or 0x0B00 <= code <= 0x0B7F  # Oriya
-            or 0x0B80 <= code <= 0x0BFF  # Tamil
-            or 0x0C00 <= code <= 0x0C7F  # Telugu
-            or 0x0C80 <= code <= 0x0CFF  # Kannada
-            or 0x0D00 <= code <= 0x0D7F  # Malayalam
-            or 0x0D80 <= code <= 0x0DFF  # Sinhala
-            or 0x0E00 <= code <= 0x0E7F  # Thai
-            or 0x0E80 <= code <= 0x0EFF  # Lao
-            or 0x0F00 <= code <= 0x0FFF  # Tibetan
-            or 0x1000 <= code <= 0x109F  # Myanmar
-            or 0x10A0 <= code <= 0x10FF  # Georgian
-            or 0x1100 <= code <= 0x11FF  # Hangul Jamo
-            or 0x1200 <= code <= 0x137F  # Ethiopic
-            or 0x13A0 <= code <= 0x13FF  # Cherokee
-            or 0x1400 <= code <= 0x167F  # Canadian Aboriginal
-            or 0x1680 <= code <= 0x169F  # Ogham
-            or 0x16A0 <= code <= 0x16FF  # Runic
-            or 0x1780 <= code <= 0x17FF  # Khmer
-            or 0x1800 <= code <= 0x18AF  # Mongolian
-            or 0x1E00 <= code <= 0x1EFF  # Latin Extended Additional
-            or 0x1F00 <= code <= 0x1FFF  # Greek Extended
-            or 0x2000 <= code <= 0x206F  # General Punctuation
-            or 0x2070 <= code <= 0x209F  # Superscripts/Subscripts
-            or 0x20A0 <= code <= 0x20CF  # Currency Symbols
-            or 0x2100 <= code <= 0x214F  # Letterlike Symbols
-            or 0x2150 <= code <= 0x218F  # Number Forms
-            or 0x2190 <= code <= 0x21FF  # Arrows
-            or 0x2200 <= code <= 0x22FF  # Mathematical Operators
-            or 0x2300 <= code <= 0x23FF  # Miscellaneous Technical
-            or 0x2400 <= code <= 0x243F  # Control Pictures
-            or 0x2460 <= code <= 0x24FF  # Enclosed Alphanumerics
-            or 0x2500 <= code <= 0x257F  # Box Drawing
-            or 0x2580 <= code <= 0x259F  # Block Elements
-            or 0x25A0 <= code <= 0x25FF  # Geometric Shapes
-            or 0x2600 <= code <= 0x26FF  # Miscellaneous Symbols
-            or 0x2700 <= code <= 0x27BF  # Dingbats
-            or 0x27C0 <= code <= 0x27EF  # Misc Mathematical Symbols-A
-            or 0x27F0 <= code <= 0x27FF  # Supplemental Arrows-A
-            or 0x2800 <= code <= 0x28FF  # Braille Patterns
-            or 0x2900 <= code <= 0x297F  # Supplemental Arrows-B
-            or 0x2980 <= code <= 0x29FF  # Misc Mathematical Symbols-B
-            or 0x2A00 <= code <= 0x2AFF  # Supplemental Math Operators
-            or 0x2E80 <= code <= 0x2EFF  # CJK Radicals Supplement
-            or 0x2F00 <= code <= 0x2FDF  # Kangxi Radicals
-            or 0x3000 <= code <= 0x303F  # CJK Symbols and Punctuation
-            or 0x3040 <= code <= 0x309F  # Hiragana
-            or 0x30A0 <= code <= 0x30FF  # Katakana
-            or 0x3100 <= code <= 0x312F  # Bopomofo
-            or 0x3130 <= code <= 0x318F  # Hangul Compatibility Jamo
-            or 0x3190 <= code <= 0x319F  # Kanbun
-            or 0x31A0 <= code <= 0x31BF  # Bopomofo Extended
-            or 0x31F0 <= code <= 0x31FF  # Katakana Phonetic Extensions
-            or 0x3200 <= code <= 0x32FF  # Enclosed CJK Letters
-            or 0x3300 <= code <= 0x33FF  # CJK Compatibility
-            or 0x3400 <= code <= 0x4DBF  # CJK Unified Ideographs Ext A
-            or 0x4E00 <= code <= 0x9FFF  # CJK Unified Ideographs
-            or 0xA000 <= code <= 0xA48F  # Yi Syllables
-            or 0xA490 <= code <= 0xA4CF  # Yi Radicals
-            or 0xAC00 <= code <= 0xD7AF  # Hangul Syllables
-            or 0xF900 <= code <= 0xFAFF  # CJK Compatibility Ideographs
-            or 0xFB00 <= code <= 0xFB4F  # Alphabetic Presentation Forms
-            or 0xFB50 <= code <= 0xFDFF  # Arabic Presentation Forms-A
-            or 0xFE00 <= code <= 0xFE0F  # Variation Selectors
-            or 0xFE20 <= code <= 0xFE2F  # Combining Half Marks
-            or 0xFE30 <= code <= 0xFE4F  # CJK Compatibility Forms
-            or 0xFE50 <= code <= 0xFE6F  # Small Form Variants
-            or 0xFE70 <= code <= 0xFEFF  # Arabic Presentation Forms-B
-            or 0xFF00 <= code <= 0xFFEF  # Halfwidth and Fullwidth Forms
-        )
+        return code <= 0xFFFF and self._valid_chars[code] == 1
 
-    def _is_valid_char_strict(self, code: int) -> bool:
-        return self._is_valid_char(code)
+    def _decode_para_text(
+        self,
+        tokens: ParagraphTokens,
+        tab: str = " ",
+        options: Optional[ExtractOptions] = None,
+        field_ctrl_ids: bool = False,
+        footnote_positions: Sequence[int] = (),
+        endnote_positions: Sequence[int] = (),
+        memo_markers: Sequence[Tuple[int, str]] = (),
+    ) -> str:
+        """PARA_TEXT 디코딩 엔진
+
+        토큰의 제어 문자 위치만 따라가며 확장 영역 건너뛰기 규칙을 적용하고,
+        그 사이의 일반 문자 구간은 통째로 필터링한다.
+
+        ``options``가 있으면 그림 개체(GSO) 마커를 넣고 제어 문자 12의 확장
+        영역을 건너뛴다. ``field_ctrl_ids``는 필드 제어 문자(17)를 ctrl-id로
+        판별하는 본문 규칙이다. 마커 번호는 호출 전에 증가시킨 카운터 기준이다.
+        """
+        record_data = tokens.data
+        size = len(record_data)
+        units, controls = tokens.units, tokens.controls
+        unit_count, control_count = len(units), len(controls)
+        strip_invalid = self._invalid_char_re.sub
+
+        markers: Dict[int, Tuple[int, str]] = {}
+        for pos in footnote_positions:
+            markers[pos] = (0, "")
+        for pos in endnote_positions:
+            markers[pos] = (1, "")
+        for pos, ref_text in memo_markers:
+            markers[pos] = (2, ref_text)
+        fn_number = self._footnote_counter - len(footnote_positions)
+        en_number = self._endnote_counter - len(endnote_positions)
+        memo_number = self._memo_counter - len(memo_markers) if memo_markers else 0
 
-    def _decode_paragraph_plain(self, record_data: bytes) -> str:
         chars = []
-        i = 0
-        while i < len(record_data) - 1:
-            code = struct.unpack_from("<H", record_data, i)[0]
+        p = 0
+        k = 0
+        while k < unit_count:
+            while p < control_count and controls[p] < k:
+                p += 1
+            if p == control_count:
+                chars.append(strip_invalid("", units[k:]))
+                break
+            j = controls[p]
+            if j > k:
+                chars.append(strip_invalid("", units[k:j]))
+            code = ord(units[j])
+            i = j << 1
+
+            if markers and i in markers:
+                kind, ref_text = markers[i]
+                if kind == 0:
+                    fn_number += 1
+                    chars.append(number_marker(FOOTNOTE, fn_number, self._deferred))
+                    i += 2 + EXTENDED_CTRL_EXT_SIZE
+                elif kind == 1:
+                    en_number += 1
+                    chars.append(number_marker(ENDNOTE, en_number, self._deferred))
+                    i += 2 + EXTENDED_CTRL_EXT_SIZE
+                else:
+                    memo_number += 1
+                    chars.append(ref_text)
+                    chars.append(number_marker(MEMO, memo_number, self._deferred))
+                    i = self._skip_memo_field(tokens, i)
+                k = i >> 1
+                continue
+
             i += 2
             if code < 8:
                 if code == 0:
                     pass
                 elif code in (2, 3, 4):
-                    if i + 2 <= len(record_data) - 1:
-                        next_code = struct.unpack_from("<H", record_data, i)[0]
-                        if (
-                            0x0020 <= next_code <= 0x007E
-                            or 0xAC00 <= next_code <= 0xD7AF
-                            or 0x3130 <= next_code <= 0x318F
-                            or next_code in (3, 4, 11, 12, 13)
-                            or 15 <= next_code <= 23
-                        ):
-                            pass
-                        else:
+                    if i + 2 <= size - 1:
+                        if not _is_text_after_ctrl(ord(units[i >> 1])):
                             i += EXTENDED_CTRL_EXT_SIZE
                     else:
                         i += EXTENDED_CTRL_EXT_SIZE
                 else:
                     i += INLINE_CTRL_EXT_SIZE
             elif code == 9:
-                chars.append(" ")
+                chars.append(tab)
             elif code == 11:
-                if i + 4 <= len(record_data):
+                if i + 4 <= size:
                     ctrl_id = struct.unpack_from("<I", record_data, i)[0]
-                    if self._is_valid_ctrl_id(ctrl_id):
+                    if options is not None and ctrl_id == CTRL_ID_GSO:
+                        marker = self._handle_control_char(code, options)
+                        if marker:
+                            chars.append(marker)
                         i += EXTENDED_CTRL_EXT_SIZE
-            elif 15 <= code <= 23:
-                if i + 2 <= len(record_data) - 1:
-                    next_code = struct.unpack_from("<H", record_data, i)[0]
-                    if (
-                        0x0020 <= next_code <= 0x007E
-                        or 0xAC00 <= next_code <= 0xD7AF
-                        or 0x3130 <= next_code <= 0x318F
-                        or next_code in (3, 4, 11, 12, 13)
-                        or 15 <= next_code <= 23
-                    ):
-                        pass
-                    else:
-                        i += EXTENDED_CTRL_EXT_SIZE
-                else:
-                    i += EXTENDED_CTRL_EXT_SIZE
-            elif code >= 32 and self._is_valid_char(code):
-                chars.append(chr(code))
-        return "".join(chars)
-
-    def _decode_paragraph_plain_for_table(self, record_data: bytes) -> str:
-        chars = []
-        i = 0
-        while i < len(record_data) - 1:
-            code = struct.unpack_from("<H", record_data, i)[0]
-            i += 2
-            if code < 8:
-                if code == 0:
-                    pass
-                elif code in (2, 3, 4):
-                    if i + 2 <= len(record_data) - 1:
-                        next_code = struct.unpack_from("<H", record_data, i)[0]
-                        if (
-                            0x0020 <= next_code <= 0x007E
-                            or 0xAC00 <= next_code <= 0xD7AF
-                            or 0x3130 <= next_code <= 0x318F
-                            or next_code in (3, 4, 11, 12, 13)
-                            or 15 <= next_code <= 23
-                        ):
-                            pass
-                        else:
-                            i += EXTENDED_CTRL_EXT_SIZE
-                    else:
+                    elif self._is_valid_ctrl_id(ctrl_id):
                         i += EXTENDED_CTRL_EXT_SIZE
-                else:
+            elif code == 12:
+                if options is not None:
                     i += INLINE_CTRL_EXT_SIZE
-            elif code == 9:
-                chars.append(" ")
-            elif code == 11:
-                if i + 4 <= len(record_data):
+            elif code == CTRL_CHAR_FIELD and field_ctrl_ids:
+                if i + 4 <= size:
                     ctrl_id = struct.unpack_from("<I", record_data, i)[0]
-                    if self._is_valid_ctrl_id(ctrl_id):
-                        i += EXTENDED_CTRL_EXT_SIZE
-            elif 15 <= code <= 23:
-                if i + 2 <= len(record_data) - 1:
-                    next_code = struct.unpack_from("<H", record_data, i)[0]
-                    if (
-                        0x0020 <= next_code <= 0x007E
-                        or 0xAC00 <= next_code <= 0xD7AF
-                        or 0x3130 <= next_code <= 0x318F
-                        or next_code in (3, 4, 11, 12, 13)
-                        or 15 <= next_code <= 23
-                    ):
-                        pass
-                    else:
+                    if ctrl_id in (
+                        CTRL_ID_FOOTNOTE,
+                        CTRL_ID_ENDNOTE,
+                        CTRL_ID_HYPERLINK,
+                    ) or self._is_valid_ctrl_id(ctrl_id):
                         i += EXTENDED_CTRL_EXT_SIZE
                 else:
                     i += EXTENDED_CTRL_EXT_SIZE
-            elif code >= 32 and self._is_valid_char_strict(code):
-                chars.append(chr(code))
-        return "".join(chars)
-
-    def _decode_cell_paragraph_with_markers(
-        self,
-        record_data: bytes,
-        records: List[Tuple[int, int, bytes]],
-        options: ExtractOptions,
-    ) -> str:
-        footnote_positions = self._find_note_markers(record_data, CTRL_ID_FOOTNOTE)
-        endnote_positions = self._find_note_markers(record_data, CTRL_ID_ENDNOTE)
-
-        for pos in footnote_positions:
-            self._footnote_counter += 1
-            fn_text = self._find_note_text(
-                records, CTRL_ID_FOOTNOTE, self._footnote_counter
-            )
-            self._footnotes.append(
-                NoteData(
-                    note_type="footnote", number=self._footnote_counter, text=fn_text
-                )
-            )
-
-        for pos in endnote_positions:
-            self._endnote_counter += 1
-            en_text = self._find_note_text(
-                records, CTRL_ID_ENDNOTE, self._endnote_counter
-            )
-            self._endnotes.append(
-                NoteData(
-                    note_type="endnote", number=self._endnote_counter, text=en_text
-                )
-            )
-
-        note_positions = set(footnote_positions + endnote_positions)
-        chars = []
-        i = 0
-        fn_count = 0
-        en_count = 0
-        fn_start = self._footnote_counter - len(footnote_positions)
-        en_start = self._endnote_counter - len(endnote_positions)
-
-        while i < len(record_data) - 1:
-            code = struct.unpack_from("<H", record_data, i)[0]
-
-            if i in footnote_positions:
-                fn_count += 1
-                chars.append(f"[^{fn_start + fn_count}]")
-                i += 2 + EXTENDED_CTRL_EXT_SIZE
-                continue
-            elif i in endnote_positions:
-                en_count += 1
-                chars.append(f"[^e{en_start + en_count}]")
-                i += 2 + EXTENDED_CTRL_EXT_SIZE
-                continue
-
-            i += 2
-            if code < 8:
-                if code == 0:
-                    pass
-                elif code in (2, 3, 4):
-                    if i + 2 <= len(record_data) - 1:
-                        next_code = struct.unpack_from("<H", record_data, i)[0]
-                        if (
-                            0x0020 <= next_code <= 0x007E
-                            or 0xAC00 <= next_code <= 0xD7AF
-                            or 0x3130 <= next_code <= 0x318F
-                            or next_code in (3, 4, 11, 12, 13)
-                            or 15 <= next_code <= 23
-                        ):
-                            pass
-                        else:
-                            i += EXTENDED_CTRL_EXT_SIZE
-                    else:
-                        i += EXTENDED_CTRL_EXT_SIZE
-                else:
-                    i += INLINE_CTRL_EXT_SIZE
-            elif code == 9:
-                chars.append(" ")
-            elif code == 10 or code == 13:
-                pass
-            elif 11 <= code <= 12:
-                if code == 11:
-                    if i + 4 <= len(record_data):
-                        ctrl_id = struct.unpack_from("<I", record_data, i)[0]
-                        if ctrl_id == CTRL_ID_GSO:
-                            marker = self._handle_control_char(code, options)
-                            if marker:
-                                chars.append(marker)
-                            i += EXTENDED_CTRL_EXT_SIZE
-                        elif self._is_valid_ctrl_id(ctrl_id):
-                            i += EXTENDED_CTRL_EXT_SIZE
-                else:
-                    i += INLINE_CTRL_EXT_SIZE
             elif 15 <= code <= 23:
-                if i + 2 <= len(record_data) - 1:
-                    next_code = struct.unpack_from("<H", record_data, i)[0]
-                    if (
-                        0x0020 <= next_code <= 0x007E
-                        or 0xAC00 <= next_code <= 0xD7AF
-                        or 0x3130 <= next_code <= 0x318F
-                        or next_code in (3, 4, 11, 12, 13)
-                        or 15 <= next_code <= 23
-                    ):
-                        pass
-                    else:
+                if i + 2 <= size - 1:
+                    if not _is_text_after_ctrl(ord(units[i >> 1])):
                         i += EXTENDED_CTRL_EXT_SIZE
                 else:
                     i += EXTENDED_CTRL_EXT_SIZE
-            elif code >= 32 and self._is_valid_char_strict(code):
-                chars.append(chr(code))
-        return "".join(chars)
+            k = i >> 1
 
-    def _extract_tables_from_section(
-        self, data: bytes, options: ExtractOptions
-    ) -> List[TableData]:
-        tables = []
-        records = list(self._parse_records(data))
-
-        i = 0
-        while i < len(records):
-            tag_id, level, record_data = records[i]
-
-            if tag_id == HWPTAG_TABLE:
-                table_info = self._parse_table_record(record_data)
-                if table_info:
-                    rows, cols, row_counts = table_info
-                    total_cells = sum(row_counts)
-
-                    cells_text = []
-                    cell_idx = 0
-                    j = i + 1
-
-                    while j < len(records) and cell_idx < total_cells:
-                        cell_tag, cell_level, cell_data = records[j]
-                        if cell_tag == HWPTAG_LIST_HEADER:
-                            cell_text = self._extract_cell_text(records, j, options)
-                            cells_text.append(cell_text)
-                            cell_idx += 1
-                        j += 1
-
-                    if cells_text:
-                        table_data = self._build_table_data(
-                            rows, cols, row_counts, cells_text
-                        )
-                        if table_data.rows:
-                            tables.append(table_data)
-
-            i += 1
-
-        return tables
-
-    def _parse_table_record(self, data: bytes) -> Optional[Tuple[int, int, List[int]]]:
-        if len(data) < 14:
-            return None
-
-        try:
-            rows = struct.unpack_from("<H", data, 4)[0]
-            cols = struct.unpack_from("<H", data, 6)[0]
-
-            offset = 18
-            row_counts = []
-
-            for _ in range(rows):
-                if offset + 2 > len(data):
-                    break
-                count = struct.unpack_from("<H", data, offset)[0]
-                row_counts.append(count)
-                offset += 2
-
-            if len(row_counts) != rows:
-                row_counts = [cols] * rows
+        return "".join(chars)
 
-            return rows, cols, row_counts
-        except struct.error:
-            return None
+    def _decode_paragraph_plain(self, record_data: ByteView) -> str:
+        return self._decode_para_text(ParagraphTokens(record_data))
 
-    def _extract_cell_text(
+    def _decode_cell_paragraph_with_markers(
         self,
-        records: List[Tuple[int, int, bytes]],
-        start_idx: int,
+        record_data: ByteView,
+        records: RecordTable,
         options: ExtractOptions,
     ) -> str:
-        texts = []
-        cell_level = records[start_idx][1]
-        nested_table_start = None
-        nested_table_level = None
-        note_section_level = None
-
-        i = start_idx + 1
-        while i < len(records):
-            tag_id, level, record_data = records[i]
-            if level < cell_level:
-                if nested_table_level is not None and nested_table_start is not None:
-                    nested_table = self._extract_table_at(
-                        records, nested_table_start, options
-                    )
-                    if nested_table and nested_table.rows:
-                        texts.append(nested_table.to_inline())
-                    nested_table_level = None
-                    nested_table_start = None
-                break
-            if tag_id == HWPTAG_LIST_HEADER and level <= cell_level:
-                break
-            if tag_id == HWPTAG_TABLE and level <= cell_level:
-                break
-
-            if note_section_level is not None:
-                if level <= note_section_level:
-                    note_section_level = None
-                else:
-                    i += 1
-                    continue
-
-            if tag_id == HWPTAG_CTRL_HEADER and level > cell_level:
-                ctrl_id = self._read_ctrl_id(record_data)
-                if ctrl_id in (CTRL_ID_FOOTNOTE, CTRL_ID_ENDNOTE):
-                    note_section_level = level
-                    i += 1
-                    continue
-
-            if tag_id == HWPTAG_TABLE and level > cell_level:
-                nested_table = self._extract_table_at(records, i, options)
-                if nested_table and nested_table.rows:
-                    texts.append(nested_table.to_inline())
-                nested_table_level = level
-                i += 1
-                while i < len(records) and records[i][1] >= nested_table_level:
-                    i += 1
-                nested_table_level = None
-                continue
-
-            if tag_id == HWPTAG_PARA_TEXT and level > cell_level:
-                text = self._decode_cell_paragraph_with_markers(
-                    record_data, records, options
-                )
-                if text.strip():
-                    texts.append(text.strip())
-
-            i += 1
-
-        if nested_table_level is not None and nested_table_start is not None:
-            nested_table = self._extract_table_at(records, nested_table_start, options)
-            if nested_table and nested_table.rows:
-                texts.append(nested_table.to_inline())
+        tokens = ParagraphTokens(record_data)
+        self._register_notes(tokens, records)
+        return self._decode_para_text(
+            tokens,
+            options=options,
+            footnote_positions=tokens.footnotes,
+            endnote_positions=tokens.endnotes,
+        )
 
-        return " ".join(texts)
+    def _extract_tables_from_section(
+        self, records: RecordTable, options: ExtractOptions
+    ) -> List[TableData]:
+        """Every table of the section, nested ones included, in record order."""
+        self._begin_section()
+        rendered: Dict[int, Optional[TableData]] = {}
+        for table in records.tables.values():
+            self._render_table(records, table, options, rendered)
+        return [
+            table_data
+            for _, table_data in sorted(rendered.items())
+            if table_data and table_data.rows
+        ]
 
     def _build_table_data(
         self, rows: int, cols: int, row_counts: List[int], cells_text: List[str]
@@ -1486,20 +1869,34 @@ class HWP5Reader:
 
 
 def extract_hwp5(
-    filepath: Union[str, Path], options: Optional[ExtractOptions] = None
+    filepath: Source,
+    options: Optional[ExtractOptions] = None,
+    cache: Optional[ExtractionCache] = None,
 ) -> Tuple[str, Optional[str]]:
     """
     Extract text from HWP 5.0 file.
 
+    With ``cache``, a result stored for the same file content and options
+    is returned without parsing the file.
+
     Returns:
         tuple: (text, error_message) - error is None on success
     """
     try:
-        with HWP5Reader(str(filepath)) as reader:
+        source = InputSource(filepath)
+        digest = cache.file_digest(source) if cache is not None else None
+        if digest is not None:
+            cached = cache.get_result(digest, options)
+            if cached is not None:
+                return cached.text, None
+
+        with HWP5Reader(source) as reader:
             if reader.is_encrypted():
                 return "", "Password protected file"
-            text = reader.extract_text(options)
-            return text, None
+            result = reader.extract_text_with_notes(options)
+            if digest is not None:
+                cache.put_result(digest, options, result)
+            return result.text, None
     except ImportError as e:
         return "", f"Missing package: {e}"
     except Exception as e:
@@ -1,34 +1,326 @@
 """HWPX Parser (Pure Python, ZIP/XML-based)"""
 
+import re
 import zipfile
 import xml.etree.ElementTree as ET
 import logging
-from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple, Union
-
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
+from typing import BinaryIO, Optional, List, Dict, Any, Tuple, Iterator
+
+from .cache import ExtractionCache
+from .images import copy_stream, head_reader, read_image_header
+from .parallel import (
+    ENDNOTE,
+    FOOTNOTE,
+    IMAGE,
+    MEMO,
+    SectionResult,
+    fill_placeholders,
+    map_sections,
+    number_marker,
+    number_markers,
+    placeholder,
+    renumber,
+)
+from .source import InputSource, Source
+from .xmlbackend import ETREE, LXML_PARSE_ERRORS, iterparse, resolve_xml_backend
 from .models import (
     ExtractOptions,
+    ImageMarkerStyle,
     TableData,
     format_image_marker,
     NoteData,
     ExtractResult,
     MemoData,
     ImageData,
-    detect_image_format,
+    TextChunk,
 )
 
 logger = logging.getLogger(__name__)
 
 MANIFEST_PATH = "META-INF/manifest.xml"
+HEADER_PATH = "Contents/header.xml"
 CONTENT_SECTION_PREFIX = "Contents/section"
+BINDATA_PREFIX = "BinData/"
+
+_SECTION_NUMBER_RE = re.compile(r"(\d+)\.xml")
+
+
+def _local_name(tag: str) -> str:
+    if "}" in tag:
+        return tag.split("}")[1]
+    return tag
+
+
+# OWPML 네임스페이스 (ElementTree의 "{uri}" 표기)
+HP_NS = "{http://www.hancom.co.kr/hwpml/2011/paragraph}"
+HC_NS = "{http://www.hancom.co.kr/hwpml/2011/core}"
+HH_NS = "{http://www.hancom.co.kr/hwpml/2011/head}"
+
+TAG_P = HP_NS + "p"
+TAG_T = HP_NS + "t"
+TAG_TBL = HP_NS + "tbl"
+TAG_TR = HP_NS + "tr"
+TAG_TC = HP_NS + "tc"
+TAG_SUBLIST = HP_NS + "subList"
+TAG_FOOTNOTE = HP_NS + "footNote"
+TAG_ENDNOTE = HP_NS + "endNote"
+TAG_PIC = HP_NS + "pic"
+TAG_FIELD_BEGIN = HP_NS + "fieldBegin"
+TAG_FIELD_END = HP_NS + "fieldEnd"
+TAG_STRING_PARAM = HP_NS + "stringParam"
+TAG_PARAM = HP_NS + "param"
+TAG_IMG = HC_NS + "img"
+TAG_BIN_ITEM = HH_NS + "binItem"
+TAG_MEMO_PR = HH_NS + "memoPr"
+
+_TAGS_BY_LOCAL_NAME = {
+    _local_name(tag): tag
+    for tag in (
+        TAG_P,
+        TAG_T,
+        TAG_TBL,
+        TAG_TR,
+        TAG_TC,
+        TAG_SUBLIST,
+        TAG_FOOTNOTE,
+        TAG_ENDNOTE,
+        TAG_PIC,
+        TAG_FIELD_BEGIN,
+        TAG_FIELD_END,
+        TAG_STRING_PARAM,
+        TAG_PARAM,
+        TAG_IMG,
+        TAG_BIN_ITEM,
+        TAG_MEMO_PR,
+    )
+}
+
+
+class _QualifiedTags(dict):
+    """
+    파서가 만든 태그 -> 위의 ``TAG_*`` 상수
+
+    처리하는 요소는 접두어가 다르거나 네임스페이스가 없어도 같은 상수로
+    바꾸고 나머지 태그는 그대로 둔다. 태그 문자열마다 처음 한 번만 계산하므로
+    요소마다 태그를 쪼개지 않고 사전 조회 한 번으로 끝난다.
+    """
+
+    def __missing__(self, tag: str) -> str:
+        qualified = _TAGS_BY_LOCAL_NAME.get(_local_name(tag), tag)
+        self[tag] = qualified
+        return qualified
+
+
+_QUALIFIED_TAGS = _QualifiedTags({tag: tag for tag in _TAGS_BY_LOCAL_NAME.values()})
+
+# 스트리밍 중 하위 트리 전체를 받아 처리하는 요소
+_MEMO_LEAVES = frozenset((TAG_FIELD_BEGIN, TAG_FIELD_END, TAG_T))
+_SECTION_LEAVES = frozenset((TAG_PIC, TAG_FOOTNOTE, TAG_ENDNOTE))
+_PARA_LEAVES = _MEMO_LEAVES | _SECTION_LEAVES
+
+# 표 순회(HWPXReader._walk_table) 프레임의 종류
+_ROWS, _CELLS, _TEXT, _SEARCH = range(4)
+
+
+@dataclass
+class HeaderInfo:
+    """
+    Parsed ``Contents/header.xml`` (document-wide definitions).
+
+    Attributes:
+        bin_items: binItem id -> (filename, src path), in document order
+        memo_properties: memoPr id -> {"width", "fillColor", "lineColor"}
+    """
+
+    bin_items: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    memo_properties: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_xml(cls, source) -> "HeaderInfo":
+        """header.xml 스트림을 한 번 훑으며 필요한 정의만 모은다"""
+        info = cls()
+        for _, elem in ET.iterparse(source, events=("end",)):
+            tag = _QUALIFIED_TAGS[elem.tag]
+            if tag == TAG_BIN_ITEM:
+                item_id = elem.get("id", "")
+                src = elem.get("src", "")
+                if item_id and src:
+                    filename = src.split("/")[-1] if "/" in src else src
+                    info.bin_items[item_id] = (filename, src)
+            elif tag == TAG_MEMO_PR:
+                memo_id = elem.get("id", "")
+                if memo_id:
+                    info.memo_properties[memo_id] = {
+                        "width": elem.get("width"),
+                        "fillColor": elem.get("fillColor"),
+                        "lineColor": elem.get("lineColor"),
+                    }
+            elem.clear()
+        return info
+
+
+class _ZipIndex:
+    """ZIP 멤버 이름 색인 (파일을 열 때 한 번 만든다)"""
+
+    def __init__(self, names: List[str]):
+        self.names = frozenset(names)
+        self.has_sections = False
+        self.bindata_by_stem: Dict[str, str] = {}
+        sections = []
+        bindata = []
+
+        for name in names:
+            if name.startswith(CONTENT_SECTION_PREFIX):
+                self.has_sections = True
+                if name.endswith(".xml"):
+                    sections.append(name)
+            elif name.startswith(BINDATA_PREFIX):
+                filename = name.split("/")[-1]
+                stem = filename.rsplit(".", 1)[0] if "." in filename else filename
+                self.bindata_by_stem.setdefault(stem, filename)
+                if not name.endswith("/"):
+                    bindata.append(name)
+
+        # section10.xml이 section2.xml 뒤에 오도록 번호 순으로 정렬
+        self.section_files = sorted(sections, key=self._section_key)
+        self.bindata_files = sorted(bindata)
+
+    @staticmethod
+    def _section_key(name: str) -> Tuple[int, float, str]:
+        match = _SECTION_NUMBER_RE.fullmatch(name, len(CONTENT_SECTION_PREFIX))
+        if match:
+            return (0, int(match.group(1)), name)
+        return (1, 0, name)
+
+
+class _ElementStream:
+    """
+    섹션 XML을 ``iterparse``로 읽으며 처리가 끝난 요소를 트리에서 떼어낸다.
+
+    컨테이너 요소는 ``("start", elem)`` / ``("end", elem)``으로 전달된다.
+    ``start``를 받은 직후 ``capture()``를 호출하면 그 요소는 하위 트리가 모두
+    만들어진 뒤 ``("subtree", elem)``으로 한 번에 전달된다. 따라서 메모리에는
+    현재 경로의 컨테이너와 처리 중인 하위 트리 하나만 남는다.
+
+    요소의 태그는 만들어질 때 ``_QUALIFIED_TAGS``로 바꿔 두므로 이후의
+    순회는 ``elem.tag``를 ``TAG_*`` 상수와 바로 비교한다.
+
+    ``xml_backend``가 ``"lxml"``이면 lxml로 읽다가, lxml이 거부한 문서(예:
+    libxml2의 중첩 깊이 한도 초과)는 같은 위치부터 ElementTree로 이어 읽는다.
+    """
+
+    def __init__(self, source, xml_backend: str = ETREE):
+        self._source = source
+        self._backend = xml_backend
+        self._capture = False
+
+    def capture(self) -> None:
+        self._capture = True
+
+    def __iter__(self) -> Iterator[Tuple[str, ET.Element]]:
+        parents: List[ET.Element] = []
+        captured = None
+        consumed = 0
+        qualified = _QUALIFIED_TAGS
+        events = iterparse(self._source, ("start", "end"), self._backend)
+
+        while True:
+            try:
+                for event, elem in events:
+                    consumed += 1
+                    if event == "start":
+                        tag = elem.tag
+                        qualified_tag = qualified[tag]
+                        if qualified_tag != tag:
+                            elem.tag = qualified_tag
+
+                    if captured is not None:
+                        # 캡처한 요소의 end가 올 때까지 하위 이벤트는 건너뛴다
+                        if elem is captured:
+                            captured = None
+                            yield "subtree", elem
+                            parents[-1].remove(elem)
+                        continue
+
+                    if event == "start":
+                        self._capture = False
+                        yield "start", elem
+                        if self._capture:
+                            captured = elem
+                        else:
+                            parents.append(elem)
+                    else:
+                        parents.pop()
+                        yield "end", elem
+                        if parents:
+                            parents[-1].remove(elem)
+                return
+            except LXML_PARSE_ERRORS:
+                # libxml2는 중첩 깊이 등에 한도가 있어 ElementTree가 읽는 문서를
+                # 거부할 수 있다. 처음부터 ElementTree로 다시 읽어 이어간다.
+                if not self._source.seekable():
+                    raise
+                captured_depth = len(parents) + 1 if captured is not None else 0
+                events, path = self._replay_with_etree(consumed, captured_depth)
+                if captured_depth:
+                    parents = path[: captured_depth - 1]
+                    captured = path[captured_depth - 1]
+                else:
+                    parents = path
+
+    def _replay_with_etree(
+        self, count: int, captured_depth: int
+    ) -> Tuple[Iterator[Tuple[str, ET.Element]], List[ET.Element]]:
+        """
+        ElementTree로 처음 ``count``개 이벤트를 다시 읽어 같은 상태를 만든다.
+
+        남은 이벤트 반복자와 열려 있는 요소 경로를 반환한다. 경로에서
+        ``captured_depth``(1부터, 0이면 없음) 단계의 요소는 캡처 중이므로 그
+        하위 트리는 떼어내지 않는다.
+        """
+        self._source.seek(0)
+        events = iterparse(self._source, ("start", "end"), ETREE)
+        path: List[ET.Element] = []
+        for event, elem in islice(events, count):
+            if event == "start":
+                _qualify(elem)
+                path.append(elem)
+            else:
+                path.pop()
+                if path and not (captured_depth and len(path) >= captured_depth):
+                    path[-1].remove(elem)
+        return events, path
+
+
+def _qualify(elem: ET.Element) -> None:
+    tag = elem.tag
+    qualified = _QUALIFIED_TAGS[tag]
+    if qualified != tag:
+        elem.tag = qualified
 
 
 class HWPXReader:
-    """HWPX file reader (pure Python)."""
+    """HWPX file reader (pure Python).
 
-    def __init__(self, filepath: Union[str, Path]):
-        self.filepath = Path(filepath)
+    ``filepath`` may also be the file content (``bytes``, ``memoryview``,
+    ``mmap``) or a binary file object; ``self.filepath`` is then ``None``.
+
+    Section XML is parsed with the standard library ElementTree unless
+    ``xml_backend`` (or the ``HWP_HWPX_PARSER_XML_BACKEND`` environment
+    variable) is ``"lxml"``, or ``"auto"`` with lxml installed. Both
+    backends give the same results.
+    """
+
+    def __init__(self, filepath: Source, xml_backend: Optional[str] = None):
+        self.xml_backend = resolve_xml_backend(xml_backend)
+        self._input = InputSource(filepath)
+        self.filepath = self._input.path
         self._zipfile = None
+        self._index: Optional[_ZipIndex] = None
+        self._header: Optional[HeaderInfo] = None
         self._image_index = 0
         self._bin_item_map: Dict[str, str] = {}
         self._footnotes: List[NoteData] = []
@@ -37,19 +329,29 @@ class HWPXReader:
         self._memos: List[MemoData] = []
         self._footnote_counter = 0
         self._endnote_counter = 0
-        self._memo_properties: Dict[str, Dict[str, Any]] = {}
+        # 워커에서 섹션 하나만 추출할 때: 번호 마커 대신 자리표시자
+        self._deferred = False
+        self._image_names: List[Optional[str]] = []
 
     def _open(self):
         if self._zipfile is None:
-            if not zipfile.is_zipfile(str(self.filepath)):
-                raise ValueError(f"Invalid HWPX file: {self.filepath}")
-            self._zipfile = zipfile.ZipFile(str(self.filepath), "r")
+            if not zipfile.is_zipfile(self._input.open_arg()):
+                raise ValueError(f"Invalid HWPX file: {self._input.name}")
+            self._zipfile = zipfile.ZipFile(self._input.open_arg(), "r")
+            self._index = _ZipIndex(self._zipfile.namelist())
         return self._zipfile
 
+    def _zip_index(self) -> _ZipIndex:
+        self._open()
+        return self._index
+
     def _close(self):
         if self._zipfile is not None:
             self._zipfile.close()
             self._zipfile = None
+        self._index = None
+        self._header = None
+        self._bin_item_map = {}
 
     def __enter__(self):
         self._open()
@@ -60,55 +362,44 @@ class HWPXReader:
 
     def is_valid(self) -> bool:
         try:
-            zf = self._open()
-            return any(
-                name.startswith(CONTENT_SECTION_PREFIX) for name in zf.namelist()
-            )
+            return self._zip_index().has_sections
         except Exception:
             return False
 
     def is_encrypted(self) -> bool:
         try:
-            zf = self._open()
-            if MANIFEST_PATH not in zf.namelist():
+            if MANIFEST_PATH not in self._zip_index().names:
                 return False
-            manifest = zf.read(MANIFEST_PATH)
+            manifest = self._open().read(MANIFEST_PATH)
             return b"encryption-data" in manifest.lower()
         except Exception:
             return False
 
     def _get_section_files(self) -> List[str]:
-        zf = self._open()
-        section_files = [
-            name
-            for name in zf.namelist()
-            if name.startswith(CONTENT_SECTION_PREFIX) and name.endswith(".xml")
-        ]
-        return sorted(section_files)
+        return list(self._zip_index().section_files)
+
+    @property
+    def header(self) -> HeaderInfo:
+        """Contents/header.xml definitions, parsed once per open reader."""
+        if self._header is None:
+            header = HeaderInfo()
+            try:
+                if HEADER_PATH in self._zip_index().names:
+                    with self._open().open(HEADER_PATH) as source:
+                        header = HeaderInfo.from_xml(source)
+            except Exception:
+                header = HeaderInfo()
+            self._header = header
+        return self._header
 
     def _load_bin_item_map(self):
         if self._bin_item_map:
             return
 
-        try:
-            zf = self._open()
-            header_path = "Contents/header.xml"
-            if header_path not in zf.namelist():
-                return
-
-            header_xml = zf.read(header_path)
-            root = ET.fromstring(header_xml)
-
-            for elem in root.iter():
-                tag = self._local_name(elem.tag)
-                if tag == "binItem":
-                    item_id = elem.get("id", "")
-                    src = elem.get("src", "")
-                    if item_id and src:
-                        filename = src.split("/")[-1] if "/" in src else src
-                        self._bin_item_map[item_id] = filename
-        except Exception:
-            pass
+        self._bin_item_map = {
+            item_id: filename
+            for item_id, (filename, _) in self.header.bin_items.items()
+        }
 
     def _get_bin_items_with_path(self) -> Dict[str, Tuple[str, str]]:
         """Load binItem id -> (filename, src_path) mapping.
@@ -119,27 +410,7 @@ class HWPXReader:
         Returns:
             Dict mapping binItem id to (filename, src_path) tuple
         """
-        result = {}
-        try:
-            zf = self._open()
-            header_path = "Contents/header.xml"
-            if header_path not in zf.namelist():
-                return result
-
-            header_xml = zf.read(header_path)
-            root = ET.fromstring(header_xml)
-
-            for elem in root.iter():
-                tag = self._local_name(elem.tag)
-                if tag == "binItem":
-                    item_id = elem.get("id", "")
-                    src = elem.get("src", "")
-                    if item_id and src:
-                        filename = src.split("/")[-1] if "/" in src else src
-                        result[item_id] = (filename, src)
-        except Exception:
-            pass
-        return result
+        return dict(self.header.bin_items)
 
     def _get_image_filename(self, ref_id: str) -> Optional[str]:
         self._load_bin_item_map()
@@ -147,23 +418,9 @@ class HWPXReader:
             return self._bin_item_map[ref_id]
 
         try:
-            zf = self._open()
-            for name in zf.namelist():
-                if name.startswith("BinData/"):
-                    filename = name.split("/")[-1]
-                    base_name = (
-                        filename.rsplit(".", 1)[0] if "." in filename else filename
-                    )
-                    if base_name == ref_id:
-                        return filename
+            return self._zip_index().bindata_by_stem.get(ref_id)
         except Exception:
-            pass
-        return None
-
-    def _local_name(self, tag: str) -> str:
-        if "}" in tag:
-            return tag.split("}")[1]
-        return tag
+            return None
 
     def _reset_counters(self):
         self._image_index = 0
@@ -174,25 +431,151 @@ class HWPXReader:
         self._footnote_counter = 0
         self._endnote_counter = 0
         self._memo_counter = 0
-        self._memo_properties = {}
+        self._image_names = []
 
     def extract_text(self, options: Optional[ExtractOptions] = None) -> str:
         options = options or ExtractOptions()
+        return options.paragraph_separator.join(
+            chunk.text for chunk in self.iter_sections(options)
+        )
+
+    def iter_sections(
+        self, options: Optional[ExtractOptions] = None
+    ) -> Iterator[TextChunk]:
+        """
+        섹션 단위로 텍스트를 생성합니다 (빈 섹션 제외).
+
+        각주/미주 번호는 ``extract_text()``와 같고, 각 청크에는 그 섹션에서
+        나온 각주/미주가 들어 있습니다.
+
+        ``options.parallel_sections``가 2 이상이면 섹션을 워커 프로세스에서
+        추출하고 번호는 섹션 순서대로 다시 매깁니다 (결과는 같음).
+        """
+        options = options or ExtractOptions()
+        self._start_text_extraction(options)
+
+        section_files = self._get_section_files()
+        if options.parallel_sections > 1 and len(section_files) > 1:
+            results = map_sections(
+                partial(HWPXReader, xml_backend=self.xml_backend),
+                self._input,
+                section_files,
+                options,
+            )
+        else:
+            results = (None for _ in section_files)
+
+        for section_idx, (section_file, result) in enumerate(
+            zip(section_files, results)
+        ):
+            notes = self._note_counts()
+            section_text = None
+            if result is not None:
+                section_text = self._merge_section(result, options)
+            if section_text is None:
+                section_text = self._extract_section(section_file, options)
+            if section_text.strip():
+                yield self._text_chunk(section_idx, None, section_text, notes)
+
+    def _extract_section_deferred(
+        self, section_file: str, options: ExtractOptions
+    ) -> SectionResult:
+        """섹션 하나를 추출 (워커 프로세스용, 번호는 섹션 안에서의 순번)"""
+        self._start_text_extraction(options)
+        self._deferred = True
+        try:
+            text = self._extract_section(section_file, options)
+        finally:
+            self._deferred = False
+
+        return SectionResult(
+            text=text,
+            footnotes=self._footnotes,
+            endnotes=self._endnotes,
+            memos=self._memos,
+            hyperlinks=self._hyperlinks,
+            images=self._image_names,
+        )
+
+    def _merge_section(
+        self, result: SectionResult, options: ExtractOptions
+    ) -> Optional[str]:
+        """
+        워커 결과에 이 섹션 앞까지의 번호를 적용 (순차 추출과 같은 결과).
+
+        자리표시자로 재현할 수 없으면 아무것도 반영하지 않고 None을 반환한다.
+        """
+        markers = number_markers(
+            FOOTNOTE, self._footnote_counter, len(result.footnotes)
+        )
+        markers.update(
+            number_markers(ENDNOTE, self._endnote_counter, len(result.endnotes))
+        )
+        markers.update(number_markers(MEMO, self._memo_counter, len(result.memos)))
+        for local, filename in enumerate(result.images, 1):
+            markers[f"{IMAGE}{local}"] = format_image_marker(
+                options.image_marker, filename, self._image_index + local
+            )
+
+        text = fill_placeholders(result.text, markers, options)
+        if text is None:
+            return None
+
+        renumber(result.footnotes, self._footnote_counter)
+        renumber(result.endnotes, self._endnote_counter)
+        renumber(result.memos, self._memo_counter)
+        self._footnotes.extend(result.footnotes)
+        self._endnotes.extend(result.endnotes)
+        self._memos.extend(result.memos)
+        self._hyperlinks.extend(result.hyperlinks)
+        self._footnote_counter += len(result.footnotes)
+        self._endnote_counter += len(result.endnotes)
+        self._memo_counter += len(result.memos)
+        self._image_index += len(result.images)
+        return text
+
+    def iter_paragraphs(
+        self, options: Optional[ExtractOptions] = None
+    ) -> Iterator[TextChunk]:
+        """
+        문단 단위로 텍스트를 생성합니다 (표/그림 마커는 각각 하나의 청크).
+
+        번호 규칙은 ``iter_sections()``와 같습니다.
+        """
+        options = options or ExtractOptions()
+        self._start_text_extraction(options)
+
+        for section_idx, section_file in enumerate(self._get_section_files()):
+            notes = self._note_counts()
+            parts = self._iter_section_parts(section_file, options)
+            for paragraph_idx, text in enumerate(parts):
+                yield self._text_chunk(section_idx, paragraph_idx, text, notes)
+                notes = self._note_counts()
+
+    def _start_text_extraction(self, options: ExtractOptions) -> None:
         self._current_options = options
         self._reset_counters()
-        self._load_memo_properties()
 
         if self.is_encrypted():
             raise ValueError("Encrypted files are not supported")
 
-        sections_text = []
-
-        for section_file in self._get_section_files():
-            section_text = self._extract_section(section_file, options)
-            if section_text.strip():
-                sections_text.append(section_text)
+    def _note_counts(self) -> Tuple[int, int]:
+        return len(self._footnotes), len(self._endnotes)
 
-        return options.paragraph_separator.join(sections_text)
+    def _text_chunk(
+        self,
+        section_idx: int,
+        paragraph_idx: Optional[int],
+        text: str,
+        notes: Tuple[int, int],
+    ) -> TextChunk:
+        return TextChunk(
+            section_index=section_idx,
+            paragraph_index=paragraph_idx,
+            text=text,
+            footnotes=self._footnotes[notes[0] :],
+            endnotes=self._endnotes[notes[1] :],
+        )
 
     def extract_text_with_notes(
         self, options: Optional[ExtractOptions] = None
@@ -210,15 +593,10 @@ class HWPXReader:
         if self.is_encrypted():
             raise ValueError("Encrypted files are not supported")
 
-        self._load_memo_properties()
         memos = []
 
         for section_file in self._get_section_files():
-            zf = self._open()
-            xml_content = zf.read(section_file)
-            root = ET.fromstring(xml_content)
-            section_memos = self._extract_memos_from_element(root)
-            memos.extend(section_memos)
+            memos.extend(self._extract_memos_from_section(section_file))
 
         return memos
 
@@ -227,21 +605,86 @@ class HWPXReader:
         tables = []
 
         for section_file in self._get_section_files():
-            zf = self._open()
-            xml_content = zf.read(section_file)
-            root = ET.fromstring(xml_content)
-
-            for elem in root.iter():
-                tag = self._local_name(elem.tag)
-                if tag == "tbl":
-                    table_data = self._extract_table(elem)
-                    if table_data.rows:
-                        tables.append(table_data)
+            tables.extend(self._iter_section_tables(section_file))
 
         return tables
 
+    def _iter_section_tables(self, section_file: str) -> Iterator[TableData]:
+        """섹션의 모든 표 (중첩 표 포함, 문서 순서: 바깥 표 다음에 안쪽 표)"""
+        with self._open().open(section_file) as source:
+            stream = _ElementStream(source, self.xml_backend)
+            # [rows, 안쪽 표의 TableData 목록] - 바깥 표를 읽는 동안만 존재
+            table: Optional[List[Any]] = None
+            table_depth = 0
+
+            for event, elem in stream:
+                tag = elem.tag
+                if table is None:
+                    if event == "start" and tag == TAG_TBL:
+                        table = [[], []]
+                        table_depth = 1
+                    continue
+
+                if event == "start":
+                    if tag == TAG_TR or tag == TAG_TBL:
+                        stream.capture()
+                    else:
+                        table_depth += 1
+                elif event == "subtree":
+                    rows, nested_tables = table
+                    if tag == TAG_TR:
+                        row_cells = self._walk_table(elem, _CELLS, nested_tables)
+                        if row_cells:
+                            rows.append(row_cells)
+                    else:
+                        # 행 밖에 놓인 표: 바깥 표의 행은 아니지만 목록에는 넣는다
+                        slot = len(nested_tables)
+                        nested_tables.append(None)
+                        nested_tables[slot] = TableData(
+                            rows=self._walk_table(elem, _ROWS, nested_tables)
+                        )
+                else:
+                    table_depth -= 1
+                    if table_depth == 0:
+                        rows, nested_tables = table
+                        table = None
+                        if rows:
+                            yield TableData(rows=rows)
+                        for table_data in nested_tables:
+                            if table_data.rows:
+                                yield table_data
+
     def get_images(self) -> List[ImageData]:
         """Extract all images from HWPX file."""
+        return [
+            ImageData(
+                filename=image.filename,
+                data=image.data,
+                index=image.index,
+                format=image.format,
+            )
+            for image in self.iter_images()
+        ]
+
+    def list_images(self, probe: bool = False) -> List[ImageData]:
+        """
+        Images without their payloads (see ``iter_images``).
+
+        With ``probe=True`` ``width``/``height`` are filled from the image
+        headers, reading only the first few KB of each member.
+        """
+        return list(self.iter_images(probe))
+
+    def iter_images(self, probe: bool = False) -> Iterator[ImageData]:
+        """
+        Yield images without loading their payloads.
+
+        Only the first bytes of each member are read to detect the format
+        (and, with ``probe``, the pixel size); ``data`` is read on first
+        access and ``save()`` copies the member to disk in chunks. The images
+        stay readable after the reader is closed (the file is opened only for
+        the duration of each read).
+        """
         if self.is_encrypted():
             raise ValueError("Encrypted files are not supported")
 
@@ -249,10 +692,10 @@ class HWPXReader:
 
         # Fallback: If no binItem elements, scan BinData/ directory directly
         if not bin_items:
-            return self._get_images_from_bindata_directory()
+            yield from self._iter_images_from_bindata_directory(probe)
+            return
 
-        images = []
-        zf = self._open()
+        names = self._zip_index().names
 
         for idx, (item_id, (filename, src_path)) in enumerate(bin_items.items()):
             full_path = (
@@ -261,114 +704,109 @@ class HWPXReader:
                 else src_path
             )
 
-            if full_path in zf.namelist():
-                data = zf.read(full_path)
-                fmt = detect_image_format(data)
-                if fmt != "unknown":
-                    images.append(
-                        ImageData(
-                            filename=filename,
-                            data=data,
-                            index=idx,
-                            format=fmt,
-                        )
-                    )
-        return images
+            if full_path in names:
+                image = self._lazy_image(full_path, filename, idx, probe)
+                if image is not None:
+                    yield image
 
-    def _get_images_from_bindata_directory(self) -> List[ImageData]:
+    def _iter_images_from_bindata_directory(
+        self, probe: bool = False
+    ) -> Iterator[ImageData]:
         """Fallback: extract images directly from BinData/ directory."""
-        images = []
-        zf = self._open()
-
-        # Find all files in BinData/ directory
-        bindata_files = sorted(
-            [
-                name
-                for name in zf.namelist()
-                if name.startswith("BinData/") and not name.endswith("/")
-            ]
+        for idx, filepath in enumerate(self._zip_index().bindata_files):
+            image = self._lazy_image(filepath, filepath.split("/")[-1], idx, probe)
+            if image is not None:
+                yield image
+
+    def _lazy_image(
+        self, member: str, filename: str, index: int, probe: bool = False
+    ) -> Optional[ImageData]:
+        with self._open().open(member) as source:
+            fmt, width, height = read_image_header(head_reader(source), probe)
+        if fmt == "unknown":
+            return None
+        return ImageData(
+            filename=filename,
+            data=None,
+            index=index,
+            format=fmt,
+            width=width,
+            height=height,
+            writer=partial(self._write_member, member),
         )
 
-        for idx, filepath in enumerate(bindata_files):
-            data = zf.read(filepath)
-            fmt = detect_image_format(data)
-            if fmt != "unknown":
-                filename = filepath.split("/")[-1]
-                images.append(
-                    ImageData(
-                        filename=filename,
-                        data=data,
-                        index=idx,
-                        format=fmt,
-                    )
-                )
-        return images
+    def _write_member(self, member: str, out: BinaryIO) -> None:
+        # 닫힌 리더는 다시 열어 두지 않고 이 복사 동안만 연다
+        zf = self._zipfile or zipfile.ZipFile(self._input.open_arg(), "r")
+        try:
+            with zf.open(member) as source:
+                copy_stream(source, out)
+        finally:
+            if zf is not self._zipfile:
+                zf.close()
 
     def close(self):
         self._close()
 
-    def _load_memo_properties(self):
-        if self._memo_properties:
-            return
-
-        try:
-            zf = self._open()
-            header_path = "Contents/header.xml"
-            if header_path not in zf.namelist():
-                return
-
-            header_xml = zf.read(header_path)
-            root = ET.fromstring(header_xml)
-
-            for elem in root.iter():
-                tag = self._local_name(elem.tag)
-                if tag == "memoPr":
-                    memo_id = elem.get("id", "")
-                    if memo_id:
-                        self._memo_properties[memo_id] = {
-                            "width": elem.get("width"),
-                            "fillColor": elem.get("fillColor"),
-                            "lineColor": elem.get("lineColor"),
-                        }
-        except Exception:
-            pass
-
-    def _extract_memos_from_element(self, root: ET.Element) -> List[MemoData]:
-        memos = []
+    def _extract_memos_from_section(self, section_file: str) -> List[MemoData]:
+        memos: List[MemoData] = []
         state = {
             "memo_id": None,
             "memo_content": None,
             "memo_ref_parts": [],
             "memo_counter": 0,
         }
-        self._collect_memos_recursive(root, memos, state, in_memo_content=False)
+        with self._open().open(section_file) as source:
+            stream = _ElementStream(source, self.xml_backend)
+            for event, elem in stream:
+                if event == "start":
+                    if elem.tag in _MEMO_LEAVES:
+                        stream.capture()
+                elif event == "subtree":
+                    self._collect_memos(elem, memos, state, in_memo_content=False)
         return memos
 
-    def _collect_memos_recursive(
+    def _collect_memos(
         self,
         elem: ET.Element,
         memos: List[MemoData],
         state: Dict[str, Any],
         in_memo_content: bool,
     ) -> None:
-        tag = self._local_name(elem.tag)
+        # 문서 순서(전위 순회)를 명시적 스택으로 따라간다
+        stack = [iter((elem,))]
+        while stack:
+            for child in stack[-1]:
+                children = self._memo_element(child, memos, state, in_memo_content)
+                if children is not None and len(children):
+                    stack.append(iter(children))
+                    break
+            else:
+                stack.pop()
+
+    def _memo_element(
+        self,
+        elem: ET.Element,
+        memos: List[MemoData],
+        state: Dict[str, Any],
+        in_memo_content: bool,
+    ) -> Optional[Any]:
+        """요소 하나를 처리하고 이어서 순회할 하위 요소를 반환한다"""
+        tag = elem.tag
 
-        if tag == "fieldBegin":
+        if tag == TAG_FIELD_BEGIN:
             field_type = elem.get("type", "")
             if field_type == "MEMO":
                 state["memo_id"] = elem.get("id") or elem.get("name")
                 state["memo_content"] = self._extract_memo_content(elem)
                 state["memo_ref_parts"] = []
-            for child in elem:
-                if self._local_name(child.tag) != "subList":
-                    self._collect_memos_recursive(child, memos, state, in_memo_content)
-            return
+            return [child for child in elem if child.tag != TAG_SUBLIST]
 
-        if tag == "fieldEnd" and state["memo_id"]:
+        if tag == TAG_FIELD_END and state["memo_id"]:
             if state["memo_content"]:
                 state["memo_counter"] += 1
                 referenced_text = "".join(state["memo_ref_parts"]).strip()
-                props = self._memo_properties.get(state["memo_id"], {})
+                props = self.header.memo_properties.get(state["memo_id"], {})
                 memos.append(
                     MemoData(
                         text=state["memo_content"],
@@ -382,61 +820,120 @@ class HWPXReader:
             state["memo_id"] = None
             state["memo_content"] = None
             state["memo_ref_parts"] = []
-            return
+            return None
 
-        if tag == "t" and elem.text and state["memo_id"] and not in_memo_content:
+        if tag == TAG_T and elem.text and state["memo_id"] and not in_memo_content:
             state["memo_ref_parts"].append(elem.text)
 
-        for child in elem:
-            self._collect_memos_recursive(child, memos, state, in_memo_content)
+        return elem
 
     def _extract_section(self, section_file: str, options: ExtractOptions) -> str:
-        zf = self._open()
-        xml_content = zf.read(section_file)
-        root = ET.fromstring(xml_content)
-
-        result_parts = []
-        self._process_element(root, result_parts, options)
-
-        return options.line_separator.join(result_parts)
-
-    def _process_element(
-        self, elem: ET.Element, result: List[str], options: ExtractOptions
-    ):
-        tag = self._local_name(elem.tag)
-
-        if tag == "p":
-            para_text = self._extract_paragraph_text(elem, options)
-            if para_text.strip() or options.include_empty_paragraphs:
-                result.append(para_text)
-
-        elif tag == "tbl":
-            table_data = self._extract_table(elem)
-            if table_data.rows:
-                table_text = table_data.format(
-                    options.table_style, options.table_delimiter
-                )
-                result.append(table_text)
+        return options.line_separator.join(
+            self._iter_section_parts(section_file, options)
+        )
 
-        elif tag == "pic":
-            marker = self._extract_image_marker(elem, options)
-            if marker:
-                result.append(marker)
+    def _iter_section_parts(
+        self, section_file: str, options: ExtractOptions
+    ) -> Iterator[str]:
+        """
+        섹션 본문의 문단/표/그림 마커 텍스트를 순서대로 생성
 
-        elif tag == "footNote":
-            self._process_footnote(elem)
+        XML을 스트리밍으로 읽습니다. 최상위 문단은 하위 요소(``t``, 필드,
+        각주/미주, 그림)가 끝날 때마다 처리하고, 표는 행 단위로 처리하므로
+        섹션 전체 트리를 메모리에 만들지 않습니다.
+        """
+        with self._open().open(section_file) as source:
+            stream = _ElementStream(source, self.xml_backend)
+            # 열린 컨테이너마다 (모드, 데이터): 모드는 "section", "para", "tbl"
+            frames: List[Tuple[str, Any]] = [("section", None)]
+
+            for event, elem in stream:
+                mode, data = frames[-1]
+
+                if event == "subtree":
+                    if mode == "para":
+                        self._process_para_element(
+                            elem, options, data, in_memo_content=False
+                        )
+                    elif mode == "tbl":
+                        self._add_table_row(elem, data)
+                    else:
+                        part = self._section_leaf_text(elem, options)
+                        if part:
+                            yield part
+                    continue
+
+                if event == "start":
+                    frame = self._open_frame(elem, mode, data)
+                    if frame is None:
+                        stream.capture()
+                    else:
+                        frames.append(frame)
+                    continue
+
+                frames.pop()
+                if mode == frames[-1][0] and data is frames[-1][1]:
+                    continue  # 같은 모드 안의 컨테이너
+
+                parent_mode, parent_data = frames[-1]
+                if mode == "para":
+                    para_text = "".join(data["texts"])
+                    if para_text.strip() or options.include_empty_paragraphs:
+                        yield para_text
+                elif data:
+                    table_text = TableData(rows=data).format(
+                        options.table_style, options.table_delimiter
+                    )
+                    if parent_mode == "para":
+                        parent_data["texts"].append("\n" + table_text + "\n")
+                    else:
+                        yield table_text
+
+    def _open_frame(
+        self, elem: ET.Element, mode: str, data: Any
+    ) -> Optional[Tuple[str, Any]]:
+        """
+        스트리밍 중 새로 시작한 요소의 처리 방식을 정한다.
 
-        elif tag == "endNote":
+        새 프레임(컨테이너)을 반환하거나, 하위 트리 전체가 필요하면 None.
+        """
+        tag = elem.tag
+
+        if tag == TAG_TBL and mode != "tbl":
+            return ("tbl", [])
+
+        if mode == "section":
+            if tag == TAG_P:
+                return ("para", self._new_paragraph_state())
+            if tag in _SECTION_LEAVES:
+                return None
+        elif mode == "para":
+            if tag in _PARA_LEAVES:
+                return None
+        elif tag == TAG_TR or tag == TAG_TBL:
+            return None
+
+        return (mode, data)
+
+    def _section_leaf_text(self, elem: ET.Element, options: ExtractOptions) -> str:
+        tag = elem.tag
+        if tag == TAG_PIC:
+            return self._extract_image_marker(elem, options)
+        if tag == TAG_FOOTNOTE:
+            self._process_footnote(elem)
+        elif tag == TAG_ENDNOTE:
             self._process_endnote(elem)
+        return ""
 
-        else:
-            for child in elem:
-                self._process_element(child, result, options)
+    def _add_table_row(self, elem: ET.Element, rows: List[List[str]]) -> None:
+        # 행 밖에 직접 놓인 중첩 표는 _find_direct_rows와 같이 건너뛴다
+        if elem.tag == TAG_TR:
+            row_cells = self._extract_table_row_direct(elem)
+            if row_cells:
+                rows.append(row_cells)
 
-    def _extract_paragraph_text(
-        self, p_elem: ET.Element, options: ExtractOptions
-    ) -> str:
-        state = {
+    def _new_paragraph_state(self) -> Dict[str, Any]:
+        return {
             "texts": [],
             "hyperlink_id": None,
             "hyperlink_parts": [],
@@ -445,8 +942,6 @@ class HWPXReader:
             "memo_content": None,
             "memo_ref_parts": [],
         }
-        self._process_para_element(p_elem, options, state, in_memo_content=False)
-        return "".join(state["texts"])
 
     def _process_para_element(
         self,
@@ -455,262 +950,265 @@ class HWPXReader:
         state: Dict[str, Any],
         in_memo_content: bool,
     ) -> None:
-        tag = self._local_name(elem.tag)
+        # 문서 순서(전위 순회)를 명시적 스택으로 따라간다
+        handlers = self._PARA_HANDLERS
+        stack = [iter((elem,))]
+        while stack:
+            for child in stack[-1]:
+                handler = handlers.get(child.tag)
+                if handler is None:
+                    children = child
+                else:
+                    children = handler(self, child, options, state, in_memo_content)
+                if children is not None and len(children):
+                    stack.append(iter(children))
+                    break
+            else:
+                stack.pop()
 
-        if tag == "fieldBegin":
-            field_type = elem.get("type", "")
-            if field_type == "HYPERLINK":
-                state["hyperlink_id"] = elem.get("id")
-                state["hyperlink_url"] = self._extract_hyperlink_url(elem)
-                state["hyperlink_parts"] = []
-            elif field_type == "MEMO":
-                state["memo_id"] = elem.get("id") or elem.get("name")
-                state["memo_content"] = self._extract_memo_content(elem)
-                state["memo_ref_parts"] = []
-            for child in elem:
-                if self._local_name(child.tag) != "subList":
-                    self._process_para_element(child, options, state, in_memo_content)
-            return
+    # 문단 요소 처리기: 이어서 순회할 하위 요소(없으면 None)를 반환한다
 
-        if tag == "fieldEnd":
-            if state["hyperlink_id"] and state["hyperlink_url"]:
-                link_text = "".join(state["hyperlink_parts"])
-                if link_text and state["hyperlink_url"]:
-                    self._hyperlinks.append((link_text, state["hyperlink_url"]))
-            state["hyperlink_id"] = None
+    def _para_field_begin(
+        self,
+        elem: ET.Element,
+        options: ExtractOptions,
+        state: Dict[str, Any],
+        in_memo_content: bool,
+    ) -> Optional[Any]:
+        field_type = elem.get("type", "")
+        if field_type == "HYPERLINK":
+            state["hyperlink_id"] = elem.get("id")
+            state["hyperlink_url"] = self._extract_hyperlink_url(elem)
             state["hyperlink_parts"] = []
-            state["hyperlink_url"] = None
+        elif field_type == "MEMO":
+            state["memo_id"] = elem.get("id") or elem.get("name")
+            state["memo_content"] = self._extract_memo_content(elem)
+            state["memo_ref_parts"] = []
+        return [child for child in elem if child.tag != TAG_SUBLIST]
 
-            if state["memo_id"] and state["memo_content"]:
-                self._memo_counter += 1
-                memo_number = self._memo_counter
-                referenced_text = "".join(state["memo_ref_parts"]).strip()
-                props = self._memo_properties.get(state["memo_id"], {})
-                self._memos.append(
-                    MemoData(
-                        text=state["memo_content"],
-                        number=memo_number,
-                        referenced_text=referenced_text if referenced_text else None,
-                        memo_id=state["memo_id"],
-                        width=int(props.get("width")) if props.get("width") else None,
-                        fill_color=props.get("fillColor"),
-                    )
+    def _para_field_end(
+        self,
+        elem: ET.Element,
+        options: ExtractOptions,
+        state: Dict[str, Any],
+        in_memo_content: bool,
+    ) -> Optional[Any]:
+        if state["hyperlink_id"] and state["hyperlink_url"]:
+            link_text = "".join(state["hyperlink_parts"])
+            if link_text and state["hyperlink_url"]:
+                self._hyperlinks.append((link_text, state["hyperlink_url"]))
+        state["hyperlink_id"] = None
+        state["hyperlink_parts"] = []
+        state["hyperlink_url"] = None
+
+        if state["memo_id"] and state["memo_content"]:
+            self._memo_counter += 1
+            memo_number = self._memo_counter
+            referenced_text = "".join(state["memo_ref_parts"]).strip()
+            props = self.header.memo_properties.get(state["memo_id"], {})
+            self._memos.append(
+                MemoData(
+                    text=state["memo_content"],
+                    number=None if self._deferred else memo_number,
+                    referenced_text=referenced_text if referenced_text else None,
+                    memo_id=state["memo_id"],
+                    width=int(props.get("width")) if props.get("width") else None,
+                    fill_color=props.get("fillColor"),
                 )
-                state["texts"].append(f"[MEMO:{memo_number}]")
-            state["memo_id"] = None
-            state["memo_content"] = None
-            state["memo_ref_parts"] = []
-            return
+            )
+            state["texts"].append(number_marker(MEMO, memo_number, self._deferred))
+        state["memo_id"] = None
+        state["memo_content"] = None
+        state["memo_ref_parts"] = []
+        return None
 
-        if tag == "t" and elem.text and not in_memo_content:
+    def _para_text(
+        self,
+        elem: ET.Element,
+        options: ExtractOptions,
+        state: Dict[str, Any],
+        in_memo_content: bool,
+    ) -> Optional[Any]:
+        if elem.text and not in_memo_content:
             if state["hyperlink_id"]:
                 state["hyperlink_parts"].append(elem.text)
             if state["memo_id"]:
                 state["memo_ref_parts"].append(elem.text)
             state["texts"].append(elem.text)
+        return elem
 
-        elif tag == "tbl":
-            table_data = self._extract_table(elem)
-            if table_data.rows:
-                table_text = table_data.format(
-                    options.table_style, options.table_delimiter
-                )
-                state["texts"].append("\n" + table_text + "\n")
-            return  # 표 내부 텍스트는 이미 처리됨
-
-        elif tag == "pic":
-            marker = self._extract_image_marker(elem, options)
-            if marker:
-                state["texts"].append(marker)
+    def _para_table(
+        self,
+        elem: ET.Element,
+        options: ExtractOptions,
+        state: Dict[str, Any],
+        in_memo_content: bool,
+    ) -> Optional[Any]:
+        table_data = self._extract_table(elem)
+        if table_data.rows:
+            table_text = table_data.format(options.table_style, options.table_delimiter)
+            state["texts"].append("\n" + table_text + "\n")
+        return None  # 표 내부 텍스트는 이미 처리됨
+
+    def _para_picture(
+        self,
+        elem: ET.Element,
+        options: ExtractOptions,
+        state: Dict[str, Any],
+        in_memo_content: bool,
+    ) -> Optional[Any]:
+        marker = self._extract_image_marker(elem, options)
+        if marker:
+            state["texts"].append(marker)
+        return elem
 
-        elif tag == "footNote":
-            note_number = self._process_footnote(elem)
-            state["texts"].append(f"[^{note_number}]")
-            return
+    def _para_footnote(
+        self,
+        elem: ET.Element,
+        options: ExtractOptions,
+        state: Dict[str, Any],
+        in_memo_content: bool,
+    ) -> Optional[Any]:
+        state["texts"].append(self._footnote_marker(elem))
+        return None
 
-        elif tag == "endNote":
-            note_number = self._process_endnote(elem)
-            state["texts"].append(f"[^e{note_number}]")
-            return
+    def _para_endnote(
+        self,
+        elem: ET.Element,
+        options: ExtractOptions,
+        state: Dict[str, Any],
+        in_memo_content: bool,
+    ) -> Optional[Any]:
+        state["texts"].append(self._endnote_marker(elem))
+        return None
 
-        for child in elem:
-            self._process_para_element(child, options, state, in_memo_content)
+    _PARA_HANDLERS = {
+        TAG_FIELD_BEGIN: _para_field_begin,
+        TAG_FIELD_END: _para_field_end,
+        TAG_T: _para_text,
+        TAG_TBL: _para_table,
+        TAG_PIC: _para_picture,
+        TAG_FOOTNOTE: _para_footnote,
+        TAG_ENDNOTE: _para_endnote,
+    }
 
     def _extract_table(self, tbl_elem: ET.Element) -> TableData:
-        rows = []
-        self._find_direct_rows(tbl_elem, rows)
-        return TableData(rows=rows)
-
-    def _find_direct_rows(self, elem: ET.Element, rows: List[List[str]]) -> None:
-        for child in elem:
-            tag = self._local_name(child.tag)
-            if tag == "tr":
-                row_cells = self._extract_table_row_direct(child)
-                if row_cells:
-                    rows.append(row_cells)
-            elif tag != "tbl":
-                self._find_direct_rows(child, rows)
+        return TableData(rows=self._walk_table(tbl_elem, _ROWS))
 
     def _extract_table_row_direct(self, tr_elem: ET.Element) -> List[str]:
-        cells = []
-        self._find_direct_cells(tr_elem, cells)
-        return cells
-
-    def _find_direct_cells(self, elem: ET.Element, cells: List[str]) -> None:
-        for child in elem:
-            tag = self._local_name(child.tag)
-            if tag == "tc":
-                cell_text = self._extract_cell_text_direct(child)
-                cells.append(cell_text)
-            elif tag != "tbl":
-                self._find_direct_cells(child, cells)
-
-    def _extract_cell_text_direct(self, tc_elem: ET.Element) -> str:
-        texts: List[str] = []
-        self._collect_cell_text_with_notes(tc_elem, texts)
-        return "".join(texts).strip()
-
-    def _collect_cell_text_with_notes(self, elem: ET.Element, texts: List[str]) -> None:
-        tag = self._local_name(elem.tag)
-
-        if tag == "tbl":
-            nested_table = self._extract_table(elem)
-            if nested_table.rows:
-                texts.append(nested_table.to_inline())
-            return
-
-        if tag == "footNote":
-            note_number = self._process_footnote(elem)
-            texts.append(f"[^{note_number}]")
-            return
+        return self._walk_table(tr_elem, _CELLS)
 
-        if tag == "endNote":
-            note_number = self._process_endnote(elem)
-            texts.append(f"[^e{note_number}]")
-            return
-
-        if tag == "pic":
-            # Handle images inside table cells
-            if hasattr(self, "_current_options"):
-                marker = self._extract_image_marker(elem, self._current_options)
-                if marker:
-                    texts.append(marker)
-            return
-
-        if tag == "t" and elem.text:
-            texts.append(elem.text)
-
-        for child in elem:
-            self._collect_cell_text_with_notes(child, texts)
+    def _walk_table(
+        self, elem: ET.Element, kind: int, tables: Optional[List[Any]] = None
+    ) -> List[Any]:
+        """
+        표(``_ROWS``)의 행 목록 또는 행(``_CELLS``)의 셀 텍스트 목록
 
-    def _collect_text_excluding_nested_tables(
-        self, elem: ET.Element, texts: List[str]
-    ) -> None:
-        for child in elem:
-            tag = self._local_name(child.tag)
-            if tag in ("tbl", "footNote", "endNote"):
-                continue
-            if tag == "t" and child.text:
-                texts.append(child.text)
-            self._collect_text_excluding_nested_tables(child, texts)
-
-    def _collect_paragraphs_excluding_nested_tables(
-        self, elem: ET.Element, paragraphs: List[str]
-    ) -> None:
-        for child in elem:
-            tag = self._local_name(child.tag)
-            if tag in ("footNote", "endNote"):
-                continue
-            if tag == "tbl":
-                nested_table = self._extract_table(child)
-                if nested_table.rows:
-                    paragraphs.append(nested_table.to_markdown())
-            elif tag == "p":
-                self._process_paragraph_with_nested_tables(child, paragraphs)
-            else:
-                self._collect_paragraphs_excluding_nested_tables(child, paragraphs)
+        행 밖이나 셀 밖에 직접 놓인 표는 건너뛰고, 셀 안의 표는 인라인 형식으로
+        셀 텍스트에 넣는다. 중첩 표가 아무리 깊어도 재귀하지 않도록 명시적
+        스택으로 순회한다. 프레임은 (자식 반복자, 종류, 모으는 목록, 결과를 넣을
+        목록, ``tables``의 자리)이고, 결과를 넣을 목록이 None이면 부모와 목록을
+        함께 쓰는 중간 요소다.
 
-    def _process_paragraph_with_nested_tables(
-        self, p_elem: ET.Element, paragraphs: List[str]
-    ) -> None:
-        """문단 내 중첩 테이블을 포함하여 처리"""
-        para_texts: List[str] = []
-        nested_tables: List[ET.Element] = []
-
-        # 문단 내 모든 중첩 테이블 찾기
-        self._find_nested_tables(p_elem, nested_tables)
-
-        if nested_tables:
-            # 먼저 텍스트 수집 (테이블 제외)
-            self._collect_text_from_element(p_elem, para_texts)
-            if para_texts:
-                para_text = "".join(para_texts).strip()
-                if para_text:
-                    paragraphs.append(para_text)
-            # 중첩 테이블들 추가 (인라인 형식 - 외부 테이블 셀 안에서 마크다운 충돌 방지)
-            for tbl_elem in nested_tables:
-                nested_table = self._extract_table(tbl_elem)
-                if nested_table.rows:
-                    # 중첩 테이블은 인라인 형식으로 변환
-                    paragraphs.append(nested_table.to_inline())
-        else:
-            # 중첩 테이블이 없으면 일반 텍스트 수집
-            self._collect_text_from_element(p_elem, para_texts)
-            if para_texts:
-                para_text = "".join(para_texts).strip()
-                if para_text:
-                    paragraphs.append(para_text)
-
-    def _find_nested_tables(self, elem: ET.Element, tables: List[ET.Element]) -> None:
-        """요소 내 모든 중첩 테이블 찾기"""
-        for child in elem:
-            tag = self._local_name(child.tag)
-            if tag == "tbl":
-                tables.append(child)
+        ``tables``를 주면 ``elem`` 아래의 모든 표(건너뛰는 표와 각주 안의 표
+        포함)의 ``TableData``를 문서 순서로 넣는다. 표마다 한 번만 순회하며,
+        셀 안 표는 인라인 텍스트를 만든 그 행 목록을 그대로 쓴다.
+        """
+        handlers = self._CELL_HANDLERS
+        result: List[Any] = []
+        stack = [(iter(elem), kind, result, None, None)]
+
+        while stack:
+            children, kind, items, target, slot = stack[-1]
+            for child in children:
+                tag = child.tag
+                if tag == TAG_TBL and (kind == _TEXT or tables is not None):
+                    new_slot = None
+                    if tables is not None:
+                        new_slot = len(tables)
+                        tables.append(None)
+                    table_target = items if kind == _TEXT else None
+                    stack.append((iter(child), _ROWS, [], table_target, new_slot))
+                    break
+                if kind == _TEXT:
+                    handler = handlers.get(tag)
+                    descend = child if handler is None else handler(self, child, items)
+                    if descend is not None:
+                        if len(descend):
+                            stack.append((iter(descend), _TEXT, items, None, None))
+                            break
+                    elif tables is not None and len(child):
+                        # 각주 등 셀 텍스트로 읽지 않는 요소 안의 표를 찾는다
+                        stack.append((iter(child), _SEARCH, None, None, None))
+                        break
+                elif kind == _SEARCH:
+                    if len(child):
+                        stack.append((iter(child), _SEARCH, None, None, None))
+                        break
+                elif tag == TAG_TBL:
+                    continue
+                elif kind == _ROWS:
+                    if tag == TAG_TR:
+                        stack.append((iter(child), _CELLS, [], items, None))
+                    else:
+                        stack.append((iter(child), _ROWS, items, None, None))
+                    break
+                else:
+                    if tag == TAG_TC:
+                        stack.append((iter(child), _TEXT, [], items, None))
+                    else:
+                        stack.append((iter(child), _CELLS, items, None, None))
+                    break
             else:
-                self._find_nested_tables(child, tables)
-
-    def _collect_text_from_element(self, elem: ET.Element, texts: List[str]) -> None:
-        """요소에서 텍스트만 수집 (중첩 테이블, 각주/미주 제외)"""
-        tag = self._local_name(elem.tag)
-        if tag in ("tbl", "footNote", "endNote"):
-            return
-        if tag == "t" and elem.text:
-            texts.append(elem.text)
-        for child in elem:
-            self._collect_text_from_element(child, texts)
-
-    def _collect_text_from_paragraph(self, elem: ET.Element, texts: List[str]) -> None:
-        """문단 내 텍스트 수집"""
-        for child in elem:
-            tag = self._local_name(child.tag)
-            if tag == "tbl":
-                continue
-            if tag == "t" and child.text:
-                texts.append(child.text)
-            self._collect_text_from_paragraph(child, texts)
+                stack.pop()
+                table = None
+                if slot is not None:
+                    table = tables[slot] = TableData(rows=items)
+                if target is None:
+                    continue
+                if kind == _TEXT:
+                    target.append("".join(items).strip())
+                elif items:
+                    # 행의 셀 목록, 또는 셀 안에 중첩된 표
+                    if kind == _CELLS:
+                        target.append(items)
+                    else:
+                        if table is None:
+                            table = TableData(rows=items)
+                        target.append(table.to_inline())
 
-    def _extract_table_row(self, tr_elem: ET.Element) -> List[str]:
-        cells = []
+        return result
 
-        for elem in tr_elem.iter():
-            tag = self._local_name(elem.tag)
+    # 셀 요소 처리기: 이어서 순회할 하위 요소(없으면 None)를 반환한다.
+    # 셀 안의 표는 _walk_table이 직접 처리한다.
 
-            if tag == "tc":
-                cell_text = self._extract_cell_text(elem)
-                cells.append(cell_text)
+    def _cell_footnote(self, elem: ET.Element, texts: List[str]) -> Optional[Any]:
+        texts.append(self._footnote_marker(elem))
+        return None
 
-        return cells
+    def _cell_endnote(self, elem: ET.Element, texts: List[str]) -> Optional[Any]:
+        texts.append(self._endnote_marker(elem))
+        return None
 
-    def _extract_cell_text(self, tc_elem: ET.Element) -> str:
-        texts = []
+    def _cell_picture(self, elem: ET.Element, texts: List[str]) -> Optional[Any]:
+        # Handle images inside table cells
+        if hasattr(self, "_current_options"):
+            marker = self._extract_image_marker(elem, self._current_options)
+            if marker:
+                texts.append(marker)
+        return None
 
-        for elem in tc_elem.iter():
-            tag = self._local_name(elem.tag)
-            if tag == "t" and elem.text:
-                texts.append(elem.text)
+    def _cell_text(self, elem: ET.Element, texts: List[str]) -> Optional[Any]:
+        if elem.text:
+            texts.append(elem.text)
+        return elem
 
-        return " ".join(texts).strip()
+    _CELL_HANDLERS = {
+        TAG_FOOTNOTE: _cell_footnote,
+        TAG_ENDNOTE: _cell_endnote,
+        TAG_PIC: _cell_picture,
+        TAG_T: _cell_text,
+    }
 
     def _extract_image_marker(
         self, pic_elem: ET.Element, options: ExtractOptions
@@ -718,59 +1216,78 @@ class HWPXReader:
         self._image_index += 1
 
         ref_id = None
-        for elem in pic_elem.iter():
-            tag = self._local_name(elem.tag)
-            if tag == "img":
-                ref_id = elem.get("binaryItemIDRef")
-                break
+        for elem in pic_elem.iter(TAG_IMG):
+            ref_id = elem.get("binaryItemIDRef")
+            break
 
         filename = None
         if ref_id:
             filename = self._get_image_filename(ref_id)
 
+        if self._deferred and options.image_marker != ImageMarkerStyle.NONE:
+            # 이름 없는 그림의 번호는 앞 섹션의 그림 수에 따라 병합할 때 정한다
+            self._image_names.append(filename)
+            return placeholder(IMAGE, len(self._image_names))
         return format_image_marker(options.image_marker, filename, self._image_index)
 
-    def _process_footnote(self, footnote_elem: ET.Element) -> int:
+    def _footnote_marker(self, footnote_elem: ET.Element) -> str:
+        number = self._process_footnote(footnote_elem)
+        if number is None:
+            return number_marker(FOOTNOTE, self._footnote_counter, deferred=True)
+        return number_marker(FOOTNOTE, number)
+
+    def _endnote_marker(self, endnote_elem: ET.Element) -> str:
+        number = self._process_endnote(endnote_elem)
+        if number is None:
+            return number_marker(ENDNOTE, self._endnote_counter, deferred=True)
+        return number_marker(ENDNOTE, number)
+
+    def _process_footnote(self, footnote_elem: ET.Element) -> Optional[int]:
+        """각주를 기록하고 번호를 반환 (워커에서 순번으로 매기는 번호는 None)"""
         self._footnote_counter += 1
-        number = int(footnote_elem.get("number", self._footnote_counter))
+        number = self._note_number(footnote_elem, self._footnote_counter)
         text = self._extract_sublist_text(footnote_elem)
         self._footnotes.append(NoteData(note_type="footnote", number=number, text=text))
         return number
 
-    def _process_endnote(self, endnote_elem: ET.Element) -> int:
+    def _process_endnote(self, endnote_elem: ET.Element) -> Optional[int]:
+        """미주를 기록하고 번호를 반환 (워커에서 순번으로 매기는 번호는 None)"""
         self._endnote_counter += 1
-        number = int(endnote_elem.get("number", self._endnote_counter))
+        number = self._note_number(endnote_elem, self._endnote_counter)
         text = self._extract_sublist_text(endnote_elem)
         self._endnotes.append(NoteData(note_type="endnote", number=number, text=text))
         return number
 
+    def _note_number(self, note_elem: ET.Element, counter: int) -> Optional[int]:
+        number = note_elem.get("number")
+        if number is not None:
+            return int(number)
+        return None if self._deferred else counter
+
     def _extract_sublist_text(self, parent_elem: ET.Element) -> str:
         texts = []
-        for elem in parent_elem.iter():
-            tag = self._local_name(elem.tag)
-            if tag == "t" and elem.text:
+        for elem in parent_elem.iter(TAG_T):
+            if elem.text:
                 texts.append(elem.text)
         return " ".join(texts).strip()
 
     def _extract_memo_content(self, field_begin_elem: ET.Element) -> Optional[str]:
         texts = []
-        for elem in field_begin_elem.iter():
-            tag = self._local_name(elem.tag)
-            if tag == "subList":
-                for sub_elem in elem.iter():
-                    if self._local_name(sub_elem.tag) == "t" and sub_elem.text:
-                        texts.append(sub_elem.text)
-                break
+        for elem in field_begin_elem.iter(TAG_SUBLIST):
+            for sub_elem in elem.iter(TAG_T):
+                if sub_elem.text:
+                    texts.append(sub_elem.text)
+            break
         content = " ".join(texts).strip()
         return content if content else None
 
     def _extract_hyperlink_url(self, field_begin_elem: ET.Element) -> Optional[str]:
         for elem in field_begin_elem.iter():
-            tag = self._local_name(elem.tag)
-            if tag == "stringParam":
+            tag = elem.tag
+            if tag == TAG_STRING_PARAM:
                 raw_url = elem.text or elem.get("value", "")
                 return self._clean_hyperlink_url(raw_url)
-            elif tag == "param":
+            elif tag == TAG_PARAM:
                 value = elem.get("value", "")
                 if value.startswith("http") or value.startswith("www"):
                     return self._clean_hyperlink_url(value)
@@ -786,19 +1303,33 @@ class HWPXReader:
 
 
 def extract_hwpx(
-    filepath: Union[str, Path], options: Optional[ExtractOptions] = None
+    filepath: Source,
+    options: Optional[ExtractOptions] = None,
+    cache: Optional[ExtractionCache] = None,
 ) -> Tuple[str, Optional[str]]:
     """
     Extract text from HWPX file.
 
+    With ``cache``, a result stored for the same file content and options
+    is returned without parsing the file.
+
     Returns:
         tuple: (text, error_message) - error is None on success
     """
     try:
-        with HWPXReader(str(filepath)) as reader:
+        source = InputSource(filepath)
+        digest = cache.file_digest(source) if cache is not None else None
+        if digest is not None:
+            cached = cache.get_result(digest, options)
+            if cached is not None:
+                return cached.text, None
+
+        with HWPXReader(source) as reader:
             if reader.is_encrypted():
                 return "", "Password protected file"
-            text = reader.extract_text(options)
-            return text, None
+            result = reader.extract_text_with_notes(options)
+            if digest is not None:
+                cache.put_result(digest, options, result)
+            return result.text, None
     except Exception as e:
         return "", f"Extraction failed: {e}"
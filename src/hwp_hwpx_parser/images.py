@@ -0,0 +1,161 @@
+"""Streaming access to embedded image (BinData) payloads
+
+이미지 데이터를 한 번에 메모리에 올리지 않고 청크 단위로 압축을 풀어
+파일로 바로 쓰기 위한 도우미입니다. ``iter_images()``가 돌려주는 지연 로딩
+``ImageData``의 ``save()``/``data``가 이 함수들을 사용하며, 크기 조회
+(``list_images(probe=True)``)는 앞부분 몇 KB만 풀어 헤더에서 읽습니다.
+"""
+
+import shutil
+import struct
+import zlib
+from typing import BinaryIO, Callable, Optional, Tuple
+
+from .models import detect_image_format
+
+COPY_CHUNK_SIZE = 64 * 1024
+# detect_image_format()에 필요한 앞부분 크기
+FORMAT_HEAD_SIZE = 16
+# 크기 조회(probe)에 읽는 앞부분 크기; JPEG는 EXIF 등 앞쪽 세그먼트가 길 수 있다
+PROBE_HEAD_SIZE = 4 * 1024
+JPEG_PROBE_LIMIT = COPY_CHUNK_SIZE
+
+# SOF0-SOF15 (DHT 0xC4, JPG 0xC8, DAC 0xCC 제외)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def copy_stream(source: BinaryIO, out: BinaryIO) -> None:
+    """Copy ``source`` into ``out`` in fixed-size chunks."""
+    shutil.copyfileobj(source, out, COPY_CHUNK_SIZE)
+
+
+def inflate_stream(source: BinaryIO, out: BinaryIO) -> None:
+    """
+    Raw-deflate decompress ``source`` into ``out`` in fixed-size chunks.
+
+    Matches ``zlib.decompress(data, -15)`` with a fallback to the original
+    bytes: if the stream is not valid deflate data (or is truncated),
+    whatever was written is discarded and ``source`` is copied unchanged.
+    Both ``source`` and ``out`` must be seekable.
+    """
+    start = out.tell()
+    decompressor = zlib.decompressobj(-15)
+    try:
+        while not decompressor.eof:
+            data = source.read(COPY_CHUNK_SIZE)
+            if not data:
+                break
+            # 압축 폭탄에도 한 번에 COPY_CHUNK_SIZE 이상 풀지 않는다
+            while data and not decompressor.eof:
+                out.write(decompressor.decompress(data, COPY_CHUNK_SIZE))
+                data = decompressor.unconsumed_tail
+        if not decompressor.eof:
+            raise zlib.error("incomplete or truncated stream")
+    except zlib.error:
+        out.seek(start)
+        out.truncate()
+        source.seek(0)
+        copy_stream(source, out)
+
+
+def inflate_head(source: BinaryIO, size: int) -> bytes:
+    """First ``size`` decompressed bytes of a raw-deflate ``source``
+    (the raw bytes if it does not start with valid deflate data)."""
+    raw = source.read(COPY_CHUNK_SIZE)
+    try:
+        head = zlib.decompressobj(-15).decompress(raw, size)
+    except zlib.error:
+        head = b""
+    return head if head else raw[:size]
+
+
+def head_reader(source: BinaryIO) -> Callable[[int], bytes]:
+    """``read_head(size)`` for a seekable stream."""
+
+    def read_head(size: int) -> bytes:
+        source.seek(0)
+        return source.read(size)
+
+    return read_head
+
+
+def inflated_head_reader(source: BinaryIO) -> Callable[[int], bytes]:
+    """``read_head(size)`` returning decompressed bytes (see ``inflate_head``)."""
+
+    def read_head(size: int) -> bytes:
+        source.seek(0)
+        return inflate_head(source, size)
+
+    return read_head
+
+
+def read_image_header(
+    read_head: Callable[[int], bytes], probe: bool = False
+) -> Tuple[str, Optional[int], Optional[int]]:
+    """
+    (format, width, height) of an image from its leading bytes.
+
+    Without ``probe`` only the format is detected. With ``probe`` the
+    pixel size is parsed from the PNG IHDR, GIF screen descriptor, BMP DIB
+    header, JPEG SOF segment or EMF/WMF bounds; at most ``PROBE_HEAD_SIZE``
+    bytes are read (``JPEG_PROBE_LIMIT`` when a JPEG's metadata pushes the
+    SOF segment further). Unknown sizes are ``None``.
+    """
+    if not probe:
+        return detect_image_format(read_head(FORMAT_HEAD_SIZE)), None, None
+
+    head = read_head(PROBE_HEAD_SIZE)
+    fmt = detect_image_format(head)
+    size = _image_size(head, fmt)
+    if size is None and fmt == "jpg" and len(head) == PROBE_HEAD_SIZE:
+        size = _image_size(read_head(JPEG_PROBE_LIMIT), fmt)
+    width, height = size if size is not None else (None, None)
+    return fmt, width, height
+
+
+def _image_size(head: bytes, fmt: str) -> Optional[Tuple[int, int]]:
+    try:
+        if fmt == "png":
+            if head[12:16] == b"IHDR":
+                return struct.unpack_from(">II", head, 16)
+        elif fmt == "gif":
+            return struct.unpack_from("<HH", head, 6)
+        elif fmt == "bmp":
+            header_size = struct.unpack_from("<I", head, 14)[0]
+            if header_size == 12:  # BITMAPCOREHEADER
+                return struct.unpack_from("<HH", head, 18)
+            width, height = struct.unpack_from("<ii", head, 18)
+            return width, abs(height)  # 음수 높이는 위에서 아래로 저장된 비트맵
+        elif fmt == "jpg":
+            return _jpeg_size(head)
+        elif fmt == "emf":
+            # ENHMETAHEADER.rclBounds (장치 단위 = 픽셀)
+            left, top, right, bottom = struct.unpack_from("<iiii", head, 8)
+            return right - left, bottom - top
+        elif fmt == "wmf":
+            # Placeable WMF: 논리 단위 경계 + 인치당 단위 수 -> 96 DPI 기준 픽셀
+            left, top, right, bottom, inch = struct.unpack_from("<hhhhH", head, 6)
+            if inch:
+                return (right - left) * 96 // inch, (bottom - top) * 96 // inch
+    except struct.error:
+        pass
+    return None
+
+
+def _jpeg_size(head: bytes) -> Optional[Tuple[int, int]]:
+    pos = 2
+    while pos + 4 <= len(head):
+        if head[pos] != 0xFF:
+            return None
+        marker = head[pos + 1]
+        if marker == 0xFF:  # 채움 바이트
+            pos += 1
+            continue
+        if 0xD0 <= marker <= 0xD9 or marker == 0x01:  # 길이 없는 마커
+            pos += 2
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack_from(">HH", head, pos + 5)
+            return width, height
+        pos += 2 + struct.unpack_from(">H", head, pos + 2)[0]
+    return None
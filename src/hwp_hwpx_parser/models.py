@@ -4,9 +4,10 @@ HWP/HWPX Parser Data Models
 Pure Python data models for text extraction results.
 """
 
+import io
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Literal, Tuple, Union
+from typing import BinaryIO, Callable, Optional, List, Literal, Tuple, Union
 from pathlib import Path
 
 
@@ -31,6 +32,20 @@ class ExtractOptions:
     """
     Text extraction options.
 
+    Options compare by value; they are mutable and therefore not hashable
+    (``Reader`` keys its result cache on a snapshot of the values, so
+    changing an options object afterwards does not affect cached results).
+
+    Attributes:
+        allowed_char_ranges: Unicode ranges ``((low, high), ...)`` (inclusive)
+            kept when decoding HWP 5.0 text. ``None`` uses the default block
+            list (``hwp5.DEFAULT_CHAR_RANGES``).
+        parallel_sections: Extract the sections of one document in this many
+            worker processes (``extract_text``/``iter_sections``/
+            ``extract_text_with_notes``). Output is identical to sequential
+            extraction; ``0``/``1`` extract in the calling process. Not part
+            of the option value (cache keys, equality).
+
     Example:
         >>> options = ExtractOptions()
         >>> options.table_style = TableStyle.MARKDOWN
@@ -42,6 +57,20 @@ class ExtractOptions:
     paragraph_separator: str = "\n\n"
     line_separator: str = "\n"
     include_empty_paragraphs: bool = False
+    allowed_char_ranges: Optional[Tuple[Tuple[int, int], ...]] = None
+    parallel_sections: int = field(default=0, compare=False, repr=False)
+
+    def __post_init__(self):
+        if self.parallel_sections < 0:
+            raise ValueError("parallel_sections must be >= 0")
+        if self.allowed_char_ranges is not None:
+            ranges = tuple(
+                (int(low), int(high)) for low, high in self.allowed_char_ranges
+            )
+            for low, high in ranges:
+                if low < 0 or low > high:
+                    raise ValueError(f"Invalid character range: ({low:#x}, {high:#x})")
+            self.allowed_char_ranges = ranges
 
 
 @dataclass
@@ -235,6 +264,27 @@ class ExtractResult:
         return None
 
 
+@dataclass
+class TextChunk:
+    """
+    Text chunk yielded by ``iter_sections()`` / ``iter_paragraphs()``.
+
+    Attributes:
+        section_index: Section index in the document (0-based)
+        paragraph_index: Paragraph index within the section (0-based),
+            ``None`` for a whole section
+        text: Chunk text (note markers numbered as in ``extract_text()``)
+        footnotes: Footnotes whose markers were produced in this chunk
+        endnotes: Endnotes whose markers were produced in this chunk
+    """
+
+    section_index: int
+    paragraph_index: Optional[int]
+    text: str
+    footnotes: List[NoteData] = field(default_factory=list)
+    endnotes: List[NoteData] = field(default_factory=list)
+
+
 def format_image_marker(
     style: ImageMarkerStyle, filename: Optional[str] = None, index: Optional[int] = None
 ) -> str:
@@ -280,7 +330,7 @@ def detect_image_format(data: bytes) -> str:
     return "unknown"
 
 
-@dataclass
+@dataclass(init=False, repr=False, eq=False)
 class ImageData:
     """Image data model.
 
@@ -291,6 +341,15 @@ class ImageData:
         format: Detected format (png, jpg, gif, bmp, emf, wmf, unknown)
         width: Image width in pixels (optional)
         height: Image height in pixels (optional)
+        writer: Streams the image bytes into a binary file. Set on images
+            from ``iter_images()``, whose ``data`` is ``None`` until first
+            accessed and is then read through ``writer``.
+
+    ``writer`` and the loaded payload are plain attributes, not dataclass
+    fields, so ``fields()``/``asdict()`` see the same fields as before
+    (``asdict()`` reads ``data``). ``repr`` leaves ``data`` out, and ``==``
+    compares payloads only when both images are loaded, so printing or
+    comparing lazy images never reads them.
     """
 
     filename: Optional[str]
@@ -300,11 +359,75 @@ class ImageData:
     width: Optional[int] = None
     height: Optional[int] = None
 
+    def __init__(
+        self,
+        filename: Optional[str],
+        data: Optional[bytes],
+        index: int,
+        format: str,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        writer: Optional[Callable[[BinaryIO], None]] = None,
+    ):
+        self.filename = filename
+        self._data = data
+        self.index = index
+        self.format = format
+        self.width = width
+        self.height = height
+        self.writer = writer
+
+    # 필드 선언 뒤에 두어 ``data`` 필드를 지연 로딩 프로퍼티로 읽고 쓴다
+    @property
+    def data(self) -> bytes:
+        if self._data is None and self.writer is not None:
+            buffer = io.BytesIO()
+            self.writer(buffer)
+            self._data = buffer.getvalue()
+        return self._data
+
+    @data.setter
+    def data(self, data: bytes) -> None:
+        self._data = data
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if (self.filename, self.index, self.format, self.width, self.height) != (
+            other.filename,
+            other.index,
+            other.format,
+            other.width,
+            other.height,
+        ):
+            return False
+        if self.is_loaded and other.is_loaded:
+            return self.data == other.data
+        return True
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(filename={self.filename!r}, "
+            f"index={self.index!r}, format={self.format!r}, "
+            f"width={self.width!r}, height={self.height!r})"
+        )
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._data is not None or self.writer is None
+
     def save(self, filepath: Union[str, Path]) -> None:
         """Save image to file.
 
+        Images that are not loaded yet are streamed from the document in
+        chunks without holding the whole payload in memory.
+
         Args:
             filepath: Output file path (str or Path)
         """
         path = Path(filepath)
-        path.write_bytes(self.data)
+        if self.is_loaded:
+            path.write_bytes(self.data)
+            return
+        with open(path, "wb") as f:
+            self.writer(f)
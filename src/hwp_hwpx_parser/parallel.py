@@ -0,0 +1,163 @@
+"""Parallel per-section extraction within one document
+
+섹션이 많은 큰 문서는 ``ExtractOptions(parallel_sections=N)``으로 섹션을 N개
+프로세스에 나눠 압축 해제/파싱합니다. 각주/미주/메모 번호와 그림 번호는 앞
+섹션들에 따라 정해지므로, 워커는 섹션 안에서의 순번으로 자리표시자를 남기고
+호출한 프로세스가 섹션 순서대로 실제 번호를 채웁니다. 결과는 순차 추출과
+바이트 단위로 같습니다.
+
+자리표시자를 바꿔 넣으면 결과가 달라질 수 있는 섹션(그림 이름을 찾지 못해
+마커가 빠지는 경우, 표 서식에서 이스케이프되는 문자가 들어간 마커 등)은
+호출한 프로세스에서 순차 추출로 다시 처리합니다.
+"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+from .models import ExtractOptions, MemoData, NoteData
+from .source import InputSource
+
+FOOTNOTE = "F"
+ENDNOTE = "E"
+MEMO = "M"
+IMAGE = "I"
+
+_MARKER_FORMATS = {FOOTNOTE: "[^{}]", ENDNOTE: "[^e{}]", MEMO: "[MEMO:{}]"}
+
+# 추출된 텍스트에는 나올 수 없는 NUL로 감싼다 (HWP 제어 문자, XML 1.0 금지 문자)
+_PLACEHOLDER_RE = re.compile("\x00([FEMI][0-9]+)\x00")
+# 표 서식(마크다운 이스케이프, CSV 인용, 줄바꿈 치환)에 따라 달라지는 문자
+_FORMAT_SENSITIVE_CHARS = frozenset('|"\r\n')
+
+
+@dataclass
+class SectionResult:
+    """
+    One section extracted in a worker process.
+
+    Numbers that depend on earlier sections are left open: note/memo
+    ``number`` is ``None`` and the text holds placeholders numbered within
+    the section. ``images`` is reader-specific data for resolving image
+    markers; ``memo_texts`` holds the section's memo bodies (HWP 5.0).
+    """
+
+    text: str
+    footnotes: List[NoteData]
+    endnotes: List[NoteData]
+    memos: List[MemoData]
+    hyperlinks: List[tuple]
+    images: Any = None
+    memo_texts: List[str] = field(default_factory=list)
+
+
+def placeholder(kind: str, number: int) -> str:
+    return f"\x00{kind}{number}\x00"
+
+
+def number_marker(kind: str, number: int, deferred: bool = False) -> str:
+    """Footnote/endnote/memo marker (a placeholder in a worker)."""
+    if deferred:
+        return placeholder(kind, number)
+    return _MARKER_FORMATS[kind].format(number)
+
+
+def number_markers(kind: str, base: int, count: int) -> Dict[str, str]:
+    """Markers for the placeholders ``1..count`` of a section starting at ``base``."""
+    return {
+        f"{kind}{local}": _MARKER_FORMATS[kind].format(base + local)
+        for local in range(1, count + 1)
+    }
+
+
+def renumber(items: Sequence[Union[NoteData, MemoData]], base: int) -> None:
+    """Fill the open numbers of a section's notes/memos (counter order)."""
+    for local, item in enumerate(items, 1):
+        if item.number is None:
+            item.number = base + local
+
+
+def fill_placeholders(
+    text: str, markers: Dict[str, str], options: ExtractOptions
+) -> Optional[str]:
+    """
+    Replace the placeholders in ``text`` with ``markers``.
+
+    Returns None when the result could differ from sequential extraction:
+    a marker is empty or formats differently from its placeholder inside a
+    table (see ``_is_plain``), or a placeholder has no marker.
+    """
+    for key, marker in markers.items():
+        if not (_is_plain(marker, options) and _is_plain(f"\x00{key}\x00", options)):
+            return None
+    try:
+        return _PLACEHOLDER_RE.sub(lambda match: markers[match.group(1)], text)
+    except KeyError:
+        return None
+
+
+def _is_plain(text: str, options: ExtractOptions) -> bool:
+    # 비어 있지 않고, 공백으로 시작/끝나지 않으며 표 서식에서 바뀌지 않는 문자열
+    return (
+        bool(text)
+        and text == text.strip()
+        and not any(
+            char in _FORMAT_SENSITIVE_CHARS or char in options.table_delimiter
+            for char in text
+        )
+    )
+
+
+def portable_source(source: InputSource) -> Union[str, bytes]:
+    """Reader input to hand to worker processes (the path or the content)."""
+    if source.path is not None:
+        return str(source.path)
+    stream = source.open_arg()
+    data = stream.read()
+    stream.seek(0)
+    return bytes(data)
+
+
+_worker_reader = None
+
+
+def _init_worker(reader_factory: Callable[[Any], Any], source) -> None:
+    global _worker_reader
+    _worker_reader = reader_factory(source)
+
+
+def _extract_in_worker(section: Any, options: ExtractOptions) -> SectionResult:
+    return _worker_reader._extract_section_deferred(section, options)
+
+
+def map_sections(
+    reader_factory: Callable[[Any], Any],
+    source: InputSource,
+    sections: Sequence[Any],
+    options: ExtractOptions,
+) -> Iterator[SectionResult]:
+    """
+    Extract ``sections`` in ``options.parallel_sections`` worker processes.
+
+    Each worker opens its own reader with ``reader_factory(source)`` and
+    calls ``_extract_section_deferred(section, options)``. Results are
+    yielded in section order.
+    """
+    workers = min(options.parallel_sections, len(sections))
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(reader_factory, portable_source(source)),
+    )
+    futures = [
+        executor.submit(_extract_in_worker, section, options) for section in sections
+    ]
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        # 순회를 중간에 멈추면 아직 시작하지 않은 섹션은 취소한다
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -1,18 +1,27 @@
 """Unified HWP/HWPX Reader"""
 
+import copy
+from collections import OrderedDict
+from dataclasses import fields, replace
 from pathlib import Path
-from typing import Union, Optional, List, Any
-from enum import Enum, auto
+from typing import Union, Optional, List, Any, Iterator, Callable, Tuple
 
-from .models import ExtractOptions, TableData, ExtractResult, ImageData
+from .cache import ExtractionCache
+from .models import ExtractOptions, TableData, ExtractResult, ImageData, TextChunk
 from .hwp5 import HWP5Reader, OLEFILE_AVAILABLE
 from .hwpx import HWPXReader
+from .sniff import SNIFF_SIZE, FileType, classify, suffix_type, unsupported_error
+from .source import InputSource, Source
 
+# Reader당 보관하는 추출 결과 수 (메서드 x 옵션 조합 하나가 결과 하나)
+DEFAULT_RESULT_CACHE_SIZE = 8
 
-class FileType(Enum):
-    HWP5 = auto()
-    HWPX = auto()
-    UNKNOWN = auto()
+
+def _options_key(options: Optional[ExtractOptions]) -> Optional[Tuple[Any, ...]]:
+    """Hashable snapshot of the options value (fields that take part in ``==``)."""
+    if options is None:
+        return None
+    return tuple(getattr(options, f.name) for f in fields(options) if f.compare)
 
 
 class Reader:
@@ -22,6 +31,23 @@ class Reader:
     Handles both HWP 5.0 and HWPX files with the same interface.
     Pure Python implementation, no JVM required.
 
+    Text (with notes), table and memo results are memoized per
+    ``ExtractOptions`` value, so repeated ``r.text`` / ``r.tables`` access
+    parses the file once. At most ``cache_size`` results are kept
+    (least recently used first out); ``cache_size=0`` disables caching.
+    Cached results are dropped by ``invalidate()`` and ``close()``.
+
+    With ``cache=ExtractionCache(...)`` results are also looked up on disk
+    by file content hash before the file is parsed.
+
+    The format is detected from the leading bytes of the file (see
+    ``sniff``), so a mislabeled extension does not matter. The extension is
+    used when the file cannot be read yet, and when the content is not
+    recognized: a ``.hwp``/``.hwpx`` file is then rejected only if that
+    format's reader cannot open it. ``filepath`` may also be the
+    file content (``bytes``, ``memoryview``, ``mmap``) or a binary file
+    object, in which case ``filepath`` is ``None``.
+
     Example:
         >>> with Reader("document.hwp") as r:
         ...     print(r.text)
@@ -29,33 +55,65 @@ class Reader:
         ...         print(table.to_markdown())
     """
 
-    def __init__(self, filepath: Union[str, Path]):
-        self.filepath = Path(filepath)
+    def __init__(
+        self,
+        filepath: Source,
+        cache_size: int = DEFAULT_RESULT_CACHE_SIZE,
+        cache: Optional[ExtractionCache] = None,
+    ):
+        self._input = InputSource(filepath)
+        self.filepath = self._input.path
+        self.cache_size = cache_size
+        self.cache = cache
+        self._digest: Optional[str] = None
         self._reader = None
         self._file_type = self._detect_type()
+        self._results: "OrderedDict[Tuple[str, Any], Any]" = OrderedDict()
 
     def _detect_type(self) -> FileType:
-        suffix = self.filepath.suffix.lower()
-        if suffix == ".hwp":
-            return FileType.HWP5
-        elif suffix == ".hwpx":
-            return FileType.HWPX
-        return FileType.UNKNOWN
+        try:
+            # 암호화 여부는 각 리더의 is_encrypted()가 보고하므로 컨테이너 형식만 사용
+            file_type, _ = classify(
+                self._input.read_head(SNIFF_SIZE), self._input.read_at
+            )
+            return file_type
+        except OSError:
+            # 없는 파일 등: 오류는 파일을 열 때 그대로 보고되도록 확장자로 고른다
+            return self._suffix_type()
+
+    def _suffix_type(self) -> FileType:
+        if self.filepath is None:
+            return FileType.UNKNOWN
+        return suffix_type(self.filepath.name)
 
     def _get_reader(self):
         if self._reader is not None:
             return self._reader
 
-        if self._file_type == FileType.HWP5:
+        if self._file_type == FileType.UNKNOWN:
+            # 내용으로 판별하지 못해도 확장자가 맞으면 그 형식의 리더로 열어 보고,
+            # 열리지 않을 때만 거부한다
+            file_type = self._suffix_type()
+            if file_type != FileType.UNKNOWN:
+                reader = self._new_reader(file_type)
+                if reader.is_valid():
+                    self._file_type = file_type
+                    self._reader = reader
+                    return reader
+                reader.close()
+            raise unsupported_error(FileType.UNKNOWN, self._input.name)
+
+        self._reader = self._new_reader(self._file_type)
+        return self._reader
+
+    def _new_reader(self, file_type: FileType):
+        if file_type == FileType.HWP5:
             if not OLEFILE_AVAILABLE:
                 raise ImportError("olefile package required: pip install olefile")
-            self._reader = HWP5Reader(str(self.filepath))
-        elif self._file_type == FileType.HWPX:
-            self._reader = HWPXReader(str(self.filepath))
-        else:
-            raise ValueError(f"Unsupported file format: {self.filepath.suffix}")
-
-        return self._reader
+            return HWP5Reader(self._input)
+        elif file_type == FileType.HWPX:
+            return HWPXReader(self._input)
+        raise unsupported_error(file_type, self._input.name)
 
     def __enter__(self):
         reader = self._get_reader()
@@ -65,9 +123,69 @@ class Reader:
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self._reader is not None:
             self._reader._close()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop memoized results (e.g. after the file changed on disk)."""
+        self._results.clear()
+        self._digest = None
+
+    def _cached(self, kind: str, options: Any, compute: Callable[[], Any]) -> Any:
+        key = (kind, _options_key(options))
+        if key in self._results:
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        value = compute()
+        if self.cache_size > 0:
+            self._results[key] = value
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        return value
+
+    def _content_digest(self) -> Optional[str]:
+        if self.cache is None:
+            return None
+        if self._digest is None:
+            self._digest = self.cache.file_digest(self._input)
+        return self._digest
+
+    def _result(self, options: Optional[ExtractOptions]) -> ExtractResult:
+        options = copy.copy(options) if options is not None else ExtractOptions()
+        return self._cached("result", options, lambda: self._load_result(options))
+
+    def _load_result(self, options: ExtractOptions) -> ExtractResult:
+        digest = self._content_digest()
+        if digest is not None:
+            result = self.cache.get_result(digest, options)
+            if result is not None:
+                return result
+
+        result = self._get_reader().extract_text_with_notes(options)
+        if digest is not None:
+            self.cache.put_result(digest, options, result)
+        return result
+
+    def _load_tables(self, options: ExtractOptions) -> List[TableData]:
+        digest = self._content_digest()
+        if digest is not None:
+            tables = self.cache.get_tables(digest, options)
+            if tables is not None:
+                return tables
+
+        tables = self._get_reader().get_tables(options)
+        if digest is not None:
+            self.cache.put_tables(digest, options, tables)
+        return tables
 
     @property
     def file_type(self) -> FileType:
+        if self._file_type == FileType.UNKNOWN and self._reader is None:
+            # 확장자로 열리는 파일이면 그 형식으로 보고한다
+            try:
+                self._get_reader()
+            except ValueError:
+                pass
         return self._file_type
 
     @property
@@ -87,14 +205,32 @@ class Reader:
             return False
 
     def extract_text(self, options: Optional[ExtractOptions] = None) -> str:
+        return self._result(options).text
+
+    def iter_sections(
+        self, options: Optional[ExtractOptions] = None
+    ) -> Iterator[TextChunk]:
         reader = self._get_reader()
-        return reader.extract_text(options)
+        return reader.iter_sections(options)
+
+    def iter_paragraphs(
+        self, options: Optional[ExtractOptions] = None
+    ) -> Iterator[TextChunk]:
+        reader = self._get_reader()
+        return reader.iter_paragraphs(options)
 
     def extract_text_with_notes(
         self, options: Optional[ExtractOptions] = None
     ) -> ExtractResult:
-        reader = self._get_reader()
-        return reader.extract_text_with_notes(options)
+        result = self._result(options)
+        # 캐시된 결과를 호출자가 수정해도 영향이 없도록 목록은 복사해서 반환
+        return replace(
+            result,
+            footnotes=list(result.footnotes),
+            endnotes=list(result.endnotes),
+            hyperlinks=list(result.hyperlinks),
+            memos=list(result.memos),
+        )
 
     @property
     def text(self) -> str:
@@ -102,27 +238,38 @@ class Reader:
 
     @property
     def tables(self) -> List[TableData]:
-        reader = self._get_reader()
-        return reader.get_tables()
+        return self.get_tables()
 
     def get_tables(self, options: Optional[ExtractOptions] = None) -> List[TableData]:
-        reader = self._get_reader()
-        return reader.get_tables(options)
+        options = copy.copy(options) if options is not None else ExtractOptions()
+        tables = self._cached("tables", options, lambda: self._load_tables(options))
+        return list(tables)
 
     def get_memos(self) -> List[Any]:
-        reader = self._get_reader()
-        return reader.get_memos()
+        memos = self._cached("memos", None, lambda: self._get_reader().get_memos())
+        return list(memos)
 
     def get_images(self) -> List[ImageData]:
         reader = self._get_reader()
         return reader.get_images()
 
+    def iter_images(self, probe: bool = False) -> Iterator[ImageData]:
+        """Images with lazily loaded ``data`` (see ``HWP5Reader.iter_images``)."""
+        reader = self._get_reader()
+        return reader.iter_images(probe)
+
+    def list_images(self, probe: bool = False) -> List[ImageData]:
+        """Image handles; ``probe=True`` fills ``width``/``height`` from headers."""
+        reader = self._get_reader()
+        return reader.list_images(probe)
+
     def save_images(self, output_dir: Union[str, Path]) -> List[Path]:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
+        # 이미지를 하나씩 청크 단위로 디스크에 써서 메모리 사용량을 일정하게 유지
         saved_paths = []
-        for img in self.get_images():
+        for img in self.iter_images():
             filename = img.filename or f"image_{img.index:03d}.{img.format}"
             filepath = output_path / filename
             img.save(filepath)
@@ -148,9 +295,10 @@ class Reader:
         if self._reader is not None:
             self._reader.close()
             self._reader = None
+        self.invalidate()
 
 
-def read(filepath: Union[str, Path]) -> Reader:
+def read(filepath: Source, cache: Optional[ExtractionCache] = None) -> Reader:
     """
     Open HWP/HWPX file and return a Reader.
 
@@ -159,4 +307,4 @@ def read(filepath: Union[str, Path]) -> Reader:
         >>> print(reader.text)
         >>> reader.close()
     """
-    return Reader(filepath)
+    return Reader(filepath, cache=cache)
@@ -0,0 +1,226 @@
+"""File format detection from leading bytes
+
+확장자는 믿을 수 없으므로(HWPX를 .hwp로 저장한 파일, .hwp로 이름만 바꾼
+.doc/.zip 등) 파일 앞부분 최대 ``SNIFF_SIZE`` 바이트만 읽어 형식을 판별합니다.
+OLE 파일은 디렉터리가 그보다 뒤에 있으면 디렉터리 섹터만 더 읽습니다.
+``olefile``/``zipfile``로 여는 것보다 훨씬 싸므로 대량 처리 전 분류/거부에 씁니다.
+
+Example:
+    >>> from hwp_hwpx_parser import FileType, sniff
+    >>> if sniff(path) in (FileType.HWP5, FileType.HWPX):
+    ...     queue.append(path)
+"""
+
+import struct
+from enum import Enum, auto
+from typing import Callable, Optional, Tuple
+
+from .source import InputSource, Source
+
+SNIFF_SIZE = 4096
+
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ZIP_MAGIC = b"PK\x03\x04"
+HWP3_SIGNATURE = b"HWP Document File V3"
+
+# HWP 5.0 FileHeader 스트림 (32바이트 시그니처 + 버전 + 속성)
+_HWP5_SIGNATURE = b"HWP Document File\x00"
+_HWP5_FLAG_ENCRYPTED = 0x02
+_MINI_SECTOR_SIZE = 64
+
+# OLE 헤더: 섹터 크기(2의 지수), 첫 디렉터리 섹터, 헤더의 FAT 섹터 목록(DIFAT)
+_OLE_SECTOR_SHIFT = struct.Struct("<H")
+_OLE_SECTOR_SHIFT_OFFSET = 0x1E
+_OLE_DIR_START_OFFSET = 0x30
+_OLE_HEADER_DIFAT_OFFSET = 0x4C
+_OLE_HEADER_DIFAT_SLOTS = 109
+_OLE_MAX_SECTOR = 0xFFFFFFFA
+# 디렉터리 항목: UTF-16 이름(최대 64바이트), 이름 길이(널 포함), 항목 종류
+_OLE_DIR_ENTRY_SIZE = 128
+_OLE_NAME_LENGTH_OFFSET = 0x40
+_OLE_ENTRY_TYPE_OFFSET = 0x42
+_OLE_STREAM = 2
+# HWP 문서의 디렉터리는 몇 섹터뿐이라 이보다 길면 더 읽지 않는다
+_OLE_MAX_DIR_SECTORS = 64
+_UINT32 = struct.Struct("<I")
+
+_HWP5_FILE_HEADER_ENTRY = "FileHeader".encode("utf-16-le")
+# 다른 OLE 문서(Word/Excel/PowerPoint)의 디렉터리 항목 이름
+_FOREIGN_OLE_STREAMS = tuple(
+    name.encode("utf-16-le")
+    for name in ("WordDocument", "Workbook", "PowerPoint Document")
+)
+
+# (offset, size) -> 그 위치의 바이트 (파일 끝이면 짧을 수 있다)
+ReadAt = Callable[[int, int], bytes]
+
+_HWPX_MIMETYPE = b"application/hwp+zip"
+# mimetype 없이 만들어진 HWPX도 있어 첫 항목 이름으로도 판별
+_HWPX_MEMBER_PREFIXES = (
+    "Contents/",
+    "META-INF/",
+    "BinData/",
+    "Preview/",
+    "version.xml",
+    "settings.xml",
+)
+# signature, version, flags, method, time, date, crc, sizes, name/extra length
+_ZIP_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+
+
+class FileType(Enum):
+    HWP5 = auto()
+    HWPX = auto()
+    UNKNOWN = auto()
+    HWP3 = auto()
+    ENCRYPTED = auto()
+
+
+def sniff(source: Source) -> FileType:
+    """
+    Detect the format of a file from its first ``SNIFF_SIZE`` bytes.
+
+    For OLE files the directory decides between HWP 5.0 and other OLE
+    documents; when it lies past the head, only its sectors are read.
+
+    Args:
+        source: Path, file content (``bytes``/``memoryview``/``mmap``) or
+            binary file object
+
+    Returns:
+        ``HWP5``/``HWPX`` for supported documents, ``HWP3`` for HWP 3.x,
+        ``ENCRYPTED`` for password-protected documents recognizable from the
+        leading bytes, otherwise ``UNKNOWN``.
+
+    Encryption that is only visible deeper in the file is not detected
+    here (``Reader.is_encrypted`` reads the document header).
+
+    Raises:
+        OSError: If the path cannot be read
+    """
+    source = InputSource(source)
+    file_type, encrypted = classify(source.read_head(SNIFF_SIZE), source.read_at)
+    return FileType.ENCRYPTED if encrypted else file_type
+
+
+def classify(head: bytes, read_at: Optional[ReadAt] = None) -> Tuple[FileType, bool]:
+    """
+    (container format, encrypted) for the leading bytes of a file.
+
+    ``read_at`` reads the rest of the file where the head is not enough (the
+    OLE directory); without it only ``head`` is looked at.
+    """
+    if head.startswith(OLE_MAGIC):
+        return _classify_ole(head, read_at)
+    if head.startswith(ZIP_MAGIC):
+        return _classify_zip(head)
+    if head.startswith(HWP3_SIGNATURE):
+        return FileType.HWP3, False
+    return FileType.UNKNOWN, False
+
+
+def suffix_type(name: str) -> FileType:
+    """Format implied by a file name's extension (``UNKNOWN`` if none)."""
+    suffix = name.rsplit(".", 1)[-1].lower() if "." in name else ""
+    if suffix == "hwp":
+        return FileType.HWP5
+    if suffix == "hwpx":
+        return FileType.HWPX
+    return FileType.UNKNOWN
+
+
+def unsupported_error(file_type: FileType, name: str) -> ValueError:
+    """Error raised for files that cannot be extracted."""
+    if file_type == FileType.HWP3:
+        return ValueError("HWP 3.x files are not supported")
+    if file_type == FileType.ENCRYPTED:
+        return ValueError("Encrypted files are not supported")
+    return ValueError(f"Unsupported file format: {name}")
+
+
+def _classify_ole(head: bytes, read_at: Optional[ReadAt]) -> Tuple[FileType, bool]:
+    # 앞부분에는 스트림 내용(미니 스트림)도 있으므로 디렉터리 항목만 본다
+    if not _has_hwp5_file_header(head, read_at):
+        return FileType.UNKNOWN, False
+
+    # FileHeader는 작은 스트림이라 보통 앞쪽 미니 섹터에 있다
+    pos = head.find(_HWP5_SIGNATURE)
+    while pos != -1:
+        if pos % _MINI_SECTOR_SIZE == 0 and pos + 40 <= len(head):
+            properties = struct.unpack_from("<I", head, pos + 36)[0]
+            return FileType.HWP5, bool(properties & _HWP5_FLAG_ENCRYPTED)
+        pos = head.find(_HWP5_SIGNATURE, pos + 1)
+    return FileType.HWP5, False
+
+
+def _has_hwp5_file_header(head: bytes, read_at: Optional[ReadAt]) -> bool:
+    """디렉터리 섹터를 차례로 읽어 FileHeader 스트림 항목이 있는지 확인"""
+    if len(head) < _OLE_HEADER_DIFAT_OFFSET + 4 * _OLE_HEADER_DIFAT_SLOTS:
+        return False
+    shift = _OLE_SECTOR_SHIFT.unpack_from(head, _OLE_SECTOR_SHIFT_OFFSET)[0]
+    if shift not in (9, 12):
+        return False
+    sector_size = 1 << shift
+
+    def read(offset: int, size: int) -> bytes:
+        if offset + size <= len(head) or read_at is None:
+            return head[offset : offset + size]
+        return read_at(offset, size)
+
+    sector = _UINT32.unpack_from(head, _OLE_DIR_START_OFFSET)[0]
+    for _ in range(_OLE_MAX_DIR_SECTORS):
+        if sector >= _OLE_MAX_SECTOR:
+            break
+        directory = read((sector + 1) << shift, sector_size)
+        end = len(directory) - _OLE_DIR_ENTRY_SIZE + 1
+        for pos in range(0, end, _OLE_DIR_ENTRY_SIZE):
+            name_length = min(directory[pos + _OLE_NAME_LENGTH_OFFSET], 64)
+            name = directory[pos : pos + max(0, name_length - 2)]
+            if name in _FOREIGN_OLE_STREAMS:
+                return False
+            if (
+                name == _HWP5_FILE_HEADER_ENTRY
+                and directory[pos + _OLE_ENTRY_TYPE_OFFSET] == _OLE_STREAM
+            ):
+                return True
+
+        # 다음 디렉터리 섹터: FAT에서 이 섹터의 항목을 읽는다
+        per_fat_sector = sector_size // 4
+        fat_index = sector // per_fat_sector
+        if fat_index >= _OLE_HEADER_DIFAT_SLOTS:
+            break
+        fat_sector = _UINT32.unpack_from(
+            head, _OLE_HEADER_DIFAT_OFFSET + 4 * fat_index
+        )[0]
+        if fat_sector >= _OLE_MAX_SECTOR:
+            break
+        offset = ((fat_sector + 1) << shift) + 4 * (sector % per_fat_sector)
+        data = read(offset, 4)
+        if len(data) < 4:
+            break
+        sector = _UINT32.unpack(data)[0]
+    return False
+
+
+def _classify_zip(head: bytes) -> Tuple[FileType, bool]:
+    if len(head) < _ZIP_LOCAL_HEADER.size:
+        return FileType.UNKNOWN, False
+
+    fields = _ZIP_LOCAL_HEADER.unpack_from(head)
+    method, name_len, extra_len = fields[3], fields[9], fields[10]
+    name_end = _ZIP_LOCAL_HEADER.size + name_len
+    name = head[_ZIP_LOCAL_HEADER.size : name_end].decode("utf-8", errors="replace")
+    data_start = name_end + extra_len
+
+    if name == "mimetype":
+        # 규격상 mimetype은 압축하지 않는다; 압축되어 있으면 이름만 믿는다.
+        # 데이터 디스크립터를 쓰는 ZIP은 로컬 헤더 크기가 0이라 내용으로 비교
+        mimetype = head[data_start : data_start + len(_HWPX_MIMETYPE)]
+        if method == 0 and mimetype != _HWPX_MIMETYPE:
+            return FileType.UNKNOWN, False
+    elif not name.startswith(_HWPX_MEMBER_PREFIXES):
+        return FileType.UNKNOWN, False
+
+    # 암호화 정보는 META-INF/manifest.xml에 있으며, 앞부분에 압축되지 않은
+    # 채로 있을 때만 여기서 보인다
+    return FileType.HWPX, b"encryption-data" in head.lower()
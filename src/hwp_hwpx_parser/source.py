@@ -0,0 +1,115 @@
+"""Reader input sources (paths, in-memory buffers, binary streams)"""
+
+import io
+import mmap
+import os
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+# 경로(str/PathLike) 또는 메모리/스트림 입력. bytes는 경로가 아니라 파일 내용으로 본다.
+Source = Union[
+    str, "os.PathLike[str]", bytes, bytearray, memoryview, mmap.mmap, BinaryIO
+]
+
+
+def is_path(source: Source) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+class InputSource:
+    """
+    A reader input: either a filesystem path or a seekable binary stream.
+
+    ``bytes``/``bytearray``/``memoryview`` are wrapped in ``io.BytesIO``;
+    ``mmap`` objects (read without copying) and seekable file objects are
+    used as-is (the caller keeps ownership and they are never closed here);
+    non-seekable streams (e.g. HTTP response bodies) are read into memory
+    once.
+    """
+
+    def __init__(self, source: Source):
+        self.path: Optional[Path] = None
+        self.stream: Optional[BinaryIO] = None
+
+        if isinstance(source, InputSource):
+            self.path, self.stream = source.path, source.stream
+        elif is_path(source):
+            self.path = Path(source)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            self.stream = io.BytesIO(source)
+        elif isinstance(source, mmap.mmap):
+            self.stream = _MappedStream(source)
+        elif hasattr(source, "read"):
+            self.stream = source if _seekable(source) else io.BytesIO(source.read())
+        else:
+            raise TypeError(f"Unsupported input type: {type(source).__name__}")
+
+    @property
+    def name(self) -> str:
+        """Path for messages (``<stream>`` for in-memory input)"""
+        return str(self.path) if self.path is not None else "<stream>"
+
+    def open_arg(self) -> Union[str, BinaryIO]:
+        """Argument for ``olefile``/``zipfile``: the path or the rewound stream"""
+        if self.path is not None:
+            return str(self.path)
+        self.stream.seek(0)
+        return self.stream
+
+    def read_head(self, size: int) -> bytes:
+        """First ``size`` bytes of the input"""
+        return self.read_at(0, size)
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        """Up to ``size`` bytes at ``offset`` (the stream is left rewound)"""
+        if self.path is not None:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                return f.read(size)
+        self.stream.seek(offset)
+        data = self.stream.read(size)
+        self.stream.seek(0)
+        return bytes(data)
+
+
+def _seekable(stream) -> bool:
+    try:
+        return bool(stream.seekable())
+    except Exception:
+        return hasattr(stream, "seek") and hasattr(stream, "tell")
+
+
+class _MappedStream(io.RawIOBase):
+    """Seekable file view of an ``mmap`` (``mmap`` has no ``seekable()``
+    before Python 3.13, which ``zipfile`` needs); the map is not closed."""
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._mapped)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._pos = offset
+        return offset
+
+    def readinto(self, buffer) -> int:
+        # 위치는 따로 들고 있어 호출자의 mmap 위치를 건드리지 않는다
+        data = self._mapped[self._pos : self._pos + len(buffer)]
+        size = len(data)
+        memoryview(buffer).cast("B")[:size] = data
+        self._pos += size
+        return size
@@ -0,0 +1,70 @@
+"""
+XML parser backends for HWPX (``xml.etree.ElementTree`` or ``lxml``)
+
+``HWPXReader(path, xml_backend=...)`` 또는 환경 변수
+``HWP_HWPX_PARSER_XML_BACKEND``로 고릅니다. ``"etree"``(기본)는 표준
+라이브러리, ``"lxml"``은 lxml, ``"auto"``는 lxml이 설치되어 있으면 lxml을
+사용합니다. 어느 쪽이든 추출 결과는 같습니다.
+
+lxml은 파싱 자체는 빠르지만 요소의 ``tag``/``text``를 파이썬에서 읽을 때마다
+객체를 새로 만들어, 요소를 하나씩 훑는 이 패키지의 추출에서는 대체로
+ElementTree보다 느립니다 (``benchmarks/bench_xml_backend.py``).
+"""
+
+import os
+import xml.etree.ElementTree as ET
+from typing import Iterator, Optional, Sequence, Tuple
+
+try:
+    from lxml import etree as lxml_etree
+
+    LXML_AVAILABLE = True
+    LXML_PARSE_ERRORS: Tuple[type, ...] = (lxml_etree.XMLSyntaxError,)
+except ImportError:
+    LXML_AVAILABLE = False
+    LXML_PARSE_ERRORS = ()
+    lxml_etree = None
+
+AUTO = "auto"
+ETREE = "etree"
+LXML = "lxml"
+XML_BACKENDS = (AUTO, ETREE, LXML)
+XML_BACKEND_ENV = "HWP_HWPX_PARSER_XML_BACKEND"
+
+
+def resolve_xml_backend(name: Optional[str] = None) -> str:
+    """
+    사용할 백엔드 이름(``"etree"`` 또는 ``"lxml"``)을 정한다.
+
+    ``name``이 None이면 환경 변수를, 환경 변수도 없으면 ``"etree"``를 쓴다.
+    """
+    if name is None:
+        name = os.environ.get(XML_BACKEND_ENV) or ETREE
+    name = name.strip().lower()
+    if name not in XML_BACKENDS:
+        raise ValueError(
+            f"Unknown XML backend: {name!r} (expected one of {', '.join(XML_BACKENDS)})"
+        )
+    if name == AUTO:
+        return LXML if LXML_AVAILABLE else ETREE
+    if name == LXML and not LXML_AVAILABLE:
+        raise ImportError("lxml package required: pip install lxml")
+    return name
+
+
+def iterparse(
+    source, events: Sequence[str], backend: str = ETREE
+) -> Iterator[Tuple[str, ET.Element]]:
+    """``backend``의 ``iterparse`` (요소 이벤트만, 두 백엔드가 같은 트리를 만든다)"""
+    if backend == LXML:
+        # ElementTree처럼 주석/처리 지시는 버린다. 엔티티는 풀지 않고(외부
+        # 파일 접근 방지) 깊은 중첩과 큰 텍스트 노드도 받아들인다
+        return lxml_etree.iterparse(
+            source,
+            events=events,
+            remove_comments=True,
+            remove_pis=True,
+            resolve_entities=False,
+            huge_tree=True,
+        )
+    return ET.iterparse(source, events=events)
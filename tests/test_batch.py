@@ -0,0 +1,121 @@
+"""
+배치 추출 (extract_many) 테스트
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+
+import pytest
+from pathlib import Path
+
+from hwp_hwpx_parser import ExtractResult, Reader
+from hwp_hwpx_parser import batch
+from hwp_hwpx_parser.batch import extract_many
+
+TESTS_DATA_DIR = Path(__file__).parent / "data"
+SAMPLE_FILES = [
+    TESTS_DATA_DIR / "sample_notes.hwp",
+    TESTS_DATA_DIR / "sample_notes.hwpx",
+    TESTS_DATA_DIR / "표.hwp",
+    TESTS_DATA_DIR / "Table.hwpx",
+]
+
+requires_fork = pytest.mark.skipif(
+    sys.platform == "win32" or "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork start method required to patch workers",
+)
+
+
+class _FaultyReader(Reader):
+    """워커 안에서 죽거나 멈추는 파일을 흉내 낸다"""
+
+    def __enter__(self):
+        if self.filepath.name == "crash.hwp":
+            os._exit(1)
+        if self.filepath.name == "slow.hwp":
+            time.sleep(10)
+        return super().__enter__()
+
+
+@pytest.mark.skipif(
+    not all(path.exists() for path in SAMPLE_FILES), reason="Sample files not available"
+)
+class TestExtractMany:
+    def test_results_match_reader(self):
+        results = dict(extract_many(SAMPLE_FILES, workers=2, chunksize=2))
+
+        assert set(results) == set(SAMPLE_FILES)
+        for path in SAMPLE_FILES:
+            with Reader(path) as reader:
+                expected = reader.extract_text_with_notes()
+            assert isinstance(results[path], ExtractResult)
+            assert results[path].text == expected.text
+            assert results[path].footnotes == expected.footnotes
+
+    def test_ordered_output(self):
+        paths = SAMPLE_FILES * 3
+        results = list(extract_many(paths, workers=2, ordered=True))
+
+        assert [path for path, _ in results] == paths
+
+    def test_errors_are_yielded_per_file(self, tmp_path):
+        missing = tmp_path / "missing.hwp"
+        unsupported = tmp_path / "notes.txt"
+        unsupported.write_text("plain text")
+        paths = [SAMPLE_FILES[0], missing, unsupported]
+
+        results = list(extract_many(paths, workers=0, ordered=True))
+
+        assert isinstance(results[0][1], ExtractResult)
+        assert isinstance(results[1][1], Exception)
+        assert isinstance(results[2][1], ValueError)
+
+    def test_invalid_chunksize(self):
+        with pytest.raises(ValueError):
+            list(extract_many(SAMPLE_FILES, chunksize=0))
+
+    @requires_fork
+    def test_worker_crash_is_isolated(self, monkeypatch):
+        monkeypatch.setattr(batch, "Reader", _FaultyReader)
+        paths = SAMPLE_FILES[:2] + [Path("crash.hwp")] + SAMPLE_FILES[2:]
+
+        results = list(
+            extract_many(
+                paths,
+                workers=2,
+                chunksize=2,
+                ordered=True,
+                mp_context=multiprocessing.get_context("fork"),
+            )
+        )
+
+        assert [path for path, _ in results] == paths
+        outcomes = [result for _, result in results]
+        assert isinstance(outcomes[2], batch.BrokenProcessPool)
+        assert all(
+            isinstance(result, ExtractResult)
+            for index, result in enumerate(outcomes)
+            if index != 2
+        )
+
+    @requires_fork
+    def test_timeout_per_file(self, monkeypatch):
+        monkeypatch.setattr(batch, "Reader", _FaultyReader)
+        paths = [Path("slow.hwp"), SAMPLE_FILES[0]]
+
+        start = time.perf_counter()
+        results = list(
+            extract_many(
+                paths,
+                workers=1,
+                timeout=0.5,
+                ordered=True,
+                mp_context=multiprocessing.get_context("fork"),
+            )
+        )
+
+        assert time.perf_counter() - start < 5
+        assert isinstance(results[0][1], TimeoutError)
+        assert isinstance(results[1][1], ExtractResult)
@@ -0,0 +1,167 @@
+"""
+디스크 추출 캐시 (ExtractionCache) 테스트
+"""
+
+import os
+import shutil
+
+import pytest
+from pathlib import Path
+
+from hwp_hwpx_parser import (
+    ExtractionCache,
+    ExtractOptions,
+    ExtractResult,
+    HWP5Reader,
+    HWPXReader,
+    NoteData,
+    Reader,
+    TableData,
+    TableStyle,
+    extract_hwp5,
+    extract_hwpx,
+)
+from hwp_hwpx_parser import cache as cache_module
+from hwp_hwpx_parser.batch import extract_many
+
+TESTS_DATA_DIR = Path(__file__).parent / "data"
+SAMPLE_HWP = TESTS_DATA_DIR / "sample_notes.hwp"
+SAMPLE_HWPX = TESTS_DATA_DIR / "sample_notes.hwpx"
+
+pytestmark = pytest.mark.skipif(
+    not (SAMPLE_HWP.exists() and SAMPLE_HWPX.exists()),
+    reason="Sample files not available",
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExtractionCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def no_parsing(monkeypatch):
+    """캐시 적중 시 파서가 호출되지 않는지 확인"""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file was parsed")
+
+    def disable():
+        for cls in (HWP5Reader, HWPXReader):
+            monkeypatch.setattr(cls, "extract_text_with_notes", fail)
+            monkeypatch.setattr(cls, "get_tables", fail)
+
+    return disable
+
+
+class TestExtractionCache:
+    def test_result_round_trip(self, cache):
+        result = ExtractResult(
+            text="본문[^1]",
+            footnotes=[NoteData(note_type="footnote", number=1, text="각주")],
+            hyperlinks=[("링크", "https://example.com")],
+        )
+        cache.put_result("abc", None, result)
+
+        assert cache.get_result("abc") == result
+        assert cache.get_result("abc", ExtractOptions(line_separator="\r\n")) is None
+        assert cache.get_result("other") is None
+
+    def test_parser_source_is_part_of_the_key(self, cache, monkeypatch):
+        # 버전을 알 수 없는 소스 체크아웃에서도 코드가 바뀌면 키가 바뀐다
+        assert cache_module.parser_fingerprint().startswith(
+            cache_module.PARSER_VERSION + "+"
+        )
+        result = ExtractResult(text="본문")
+        cache.put_result("abc", None, result)
+        assert cache.get_result("abc") == result
+
+        monkeypatch.setattr(cache_module, "_fingerprint", "0.0.0+changed")
+        assert cache.get_result("abc") is None
+
+    def test_tables_round_trip(self, cache):
+        tables = [TableData(rows=[["a", "b"], ["c", "d"]])]
+        cache.put_tables("abc", ExtractOptions(), tables)
+
+        assert cache.get_tables("abc") == tables
+
+    def test_unreadable_entry_is_a_miss(self, cache):
+        cache.put_result("abc", None, ExtractResult(text="x"))
+        entry = next(cache.directory.rglob("*.cache"))
+        entry.write_bytes(b"garbage")
+
+        assert cache.get_result("abc") is None
+        assert not entry.exists()
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache", max_bytes=2000)
+        for index in range(20):
+            text = os.urandom(200).hex()
+            cache.put_result(f"file{index}", None, ExtractResult(text=text))
+            # 방금 쓴 항목이 가장 최근이 되도록 mtime을 벌려 둔다
+            for entry in cache.directory.rglob("*.cache"):
+                stat = entry.stat()
+                os.utime(entry, (stat.st_atime, stat.st_mtime - 1))
+
+        assert cache.size <= 2000
+        assert cache.get_result("file19") is not None
+        assert cache.get_result("file0") is None
+
+    def test_clear(self, cache):
+        cache.put_result("abc", None, ExtractResult(text="x"))
+        cache.clear()
+
+        assert cache.size == 0
+        assert cache.get_result("abc") is None
+
+
+class TestCacheIntegration:
+    @pytest.mark.parametrize("path", [SAMPLE_HWP, SAMPLE_HWPX], ids=lambda p: p.name)
+    def test_reader_hit_skips_parsing(self, path, cache, no_parsing):
+        with Reader(path, cache=cache) as reader:
+            expected = reader.extract_text_with_notes()
+            expected_tables = reader.tables
+
+        no_parsing()
+        with Reader(path, cache=cache) as reader:
+            assert reader.extract_text_with_notes() == expected
+            assert reader.tables == expected_tables
+
+    def test_key_is_file_content(self, tmp_path, cache, no_parsing):
+        with Reader(SAMPLE_HWP, cache=cache) as reader:
+            text = reader.text
+
+        copy = tmp_path / "renamed.hwp"
+        shutil.copy(SAMPLE_HWP, copy)
+        no_parsing()
+        with Reader(copy, cache=cache) as reader:
+            assert reader.text == text
+
+    def test_options_are_part_of_the_key(self, cache):
+        options = ExtractOptions(table_style=TableStyle.CSV)
+        with Reader(SAMPLE_HWP, cache=cache) as reader:
+            default_text = reader.text
+            csv_text = reader.extract_text(options)
+
+        with Reader(SAMPLE_HWP, cache=cache) as reader:
+            assert reader.extract_text(options) == csv_text
+            assert reader.text == default_text
+
+    def test_extract_functions(self, cache, no_parsing):
+        hwp_text, hwp_error = extract_hwp5(SAMPLE_HWP, cache=cache)
+        hwpx_text, hwpx_error = extract_hwpx(SAMPLE_HWPX, cache=cache)
+        assert hwp_error is None and hwpx_error is None
+
+        no_parsing()
+        assert extract_hwp5(SAMPLE_HWP, cache=cache) == (hwp_text, None)
+        assert extract_hwpx(SAMPLE_HWPX, cache=cache) == (hwpx_text, None)
+        with Reader(SAMPLE_HWP, cache=cache) as reader:
+            assert reader.text == hwp_text
+
+    def test_batch(self, cache, no_parsing):
+        paths = [SAMPLE_HWP, SAMPLE_HWPX]
+        first = dict(extract_many(paths, workers=0, cache=cache))
+
+        no_parsing()
+        second = dict(extract_many(paths, workers=0, cache=cache))
+        assert second == first
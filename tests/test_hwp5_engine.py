@@ -0,0 +1,441 @@
+"""
+HWP5 섹션 엔진 테스트 (섹션 캐시, 레코드 인덱스)
+"""
+
+import struct
+
+import pytest
+from pathlib import Path
+
+from hwp_hwpx_parser import HWP5Reader, FileHeaderInfo, ExtractOptions
+from hwp_hwpx_parser.hwp5 import (
+    DEFAULT_CHAR_RANGES,
+    ParagraphTokens,
+    RecordTable,
+    HWPTAG_PARA_TEXT,
+    HWPTAG_CTRL_HEADER,
+    HWPTAG_LIST_HEADER,
+    HWPTAG_TABLE,
+    CTRL_ID_FOOTNOTE,
+    CTRL_ID_ENDNOTE,
+    CTRL_ID_HYPERLINK,
+    CTRL_ID_MEMO,
+)
+
+TESTS_DATA_DIR = Path(__file__).parent / "data"
+SAMPLE_NOTES_HWP = TESTS_DATA_DIR / "sample_notes.hwp"
+
+
+@pytest.mark.skipif(not SAMPLE_NOTES_HWP.exists(), reason="Sample file not available")
+class TestSectionCache:
+    """BodyText 섹션은 리더당 한 번만 디코딩되어야 한다"""
+
+    def _count_section_reads(self, reader, monkeypatch):
+        calls = []
+        original = reader._read_section
+
+        def counting_read(section_idx):
+            calls.append(section_idx)
+            return original(section_idx)
+
+        monkeypatch.setattr(reader, "_read_section", counting_read)
+        return calls
+
+    def test_extraction_methods_share_parsed_sections(self, monkeypatch):
+        with HWP5Reader(SAMPLE_NOTES_HWP) as reader:
+            calls = self._count_section_reads(reader, monkeypatch)
+
+            reader.extract_text(ExtractOptions())
+            reader.get_tables()
+            reader.get_memos()
+            reader.extract_text_with_notes()
+
+        assert calls == [0]
+
+    def test_parse_warms_cache(self, monkeypatch):
+        with HWP5Reader(SAMPLE_NOTES_HWP) as reader:
+            calls = self._count_section_reads(reader, monkeypatch)
+            reader.parse()
+            assert calls == [0]
+
+            reader.extract_text()
+            assert calls == [0]
+
+    def test_cached_output_matches_fresh_reader(self):
+        with HWP5Reader(SAMPLE_NOTES_HWP) as reader:
+            reader.parse()
+            reader.get_tables()
+            cached = reader.extract_text_with_notes()
+
+        with HWP5Reader(SAMPLE_NOTES_HWP) as reader:
+            fresh = reader.extract_text_with_notes()
+
+        assert cached.text == fresh.text
+        assert cached.footnotes == fresh.footnotes
+        assert cached.endnotes == fresh.endnotes
+
+    def test_memory_cap_evicts_sections(self, monkeypatch):
+        with HWP5Reader(SAMPLE_NOTES_HWP, max_section_cache_bytes=0) as reader:
+            calls = self._count_section_reads(reader, monkeypatch)
+            reader.extract_text()
+            reader.get_tables()
+
+            # 가장 최근에 사용한 섹션은 상한과 관계없이 유지된다
+            assert calls == [0]
+            assert list(reader._sections) == [0]
+
+    def test_close_releases_cache(self):
+        reader = HWP5Reader(SAMPLE_NOTES_HWP)
+        reader.parse()
+        assert reader._sections
+
+        reader.close()
+        assert not reader._sections
+
+
+@pytest.mark.skipif(not SAMPLE_NOTES_HWP.exists(), reason="Sample file not available")
+class TestFileHeader:
+    """FileHeader는 한 번만 읽어 FileHeaderInfo로 제공한다"""
+
+    def test_header_properties(self):
+        with HWP5Reader(SAMPLE_NOTES_HWP) as reader:
+            header = reader.header
+
+            assert isinstance(header, FileHeaderInfo)
+            assert header.signature == "HWP Document File"
+            assert header.version[0] == 5
+            assert header.compressed is True
+            assert header.encrypted is False
+            assert reader.is_compressed() is header.compressed
+            assert reader.is_encrypted() is header.encrypted
+
+    def test_header_is_immutable(self):
+        with HWP5Reader(SAMPLE_NOTES_HWP) as reader:
+            with pytest.raises(Exception):
+                reader.header.properties = 0
+
+    def test_header_stream_read_once(self, monkeypatch):
+        with HWP5Reader(SAMPLE_NOTES_HWP) as reader:
+            ole = reader._open()
+            opened = []
+            original = ole.openstream
+
+            def counting_openstream(name):
+                opened.append(name)
+                return original(name)
+
+            monkeypatch.setattr(ole, "openstream", counting_openstream)
+
+            reader.extract_text()
+            reader.get_tables()
+            reader.get_images()
+
+        assert opened.count("FileHeader") == 1
+
+    def test_from_bytes_flags(self):
+        data = b"HWP Document File".ljust(32, b"\x00")
+        data += bytes([0, 3, 0, 5]) + (0x02 | 0x04).to_bytes(4, "little")
+        header = FileHeaderInfo.from_bytes(data)
+
+        assert header.version == (5, 0, 3, 0)
+        assert header.version_string == "5.0.3.0"
+        assert header.encrypted and header.distribution
+        assert not header.compressed
+
+
+def _record(tag_id, level, payload):
+    return struct.pack("<I", tag_id | (level << 10) | (len(payload) << 20)) + payload
+
+
+def _note_ctrl(ctrl_id):
+    return struct.pack("<HI", 17, ctrl_id) + b"\x00" * 8 + struct.pack("<H", 17)
+
+
+def _note_section(count, prefix, ctrl_id=CTRL_ID_FOOTNOTE):
+    """문단마다 각주 하나와 그 본문을 가진 합성 섹션"""
+    data = b""
+    for n in range(1, count + 1):
+        para = f"{prefix} {n}".encode("utf-16-le") + _note_ctrl(ctrl_id)
+        data += _record(HWPTAG_PARA_TEXT, 1, para)
+        data += _record(HWPTAG_CTRL_HEADER, 1, struct.pack("<I", ctrl_id))
+        data += _record(HWPTAG_LIST_HEADER, 2, b"\x00" * 8)
+        data += _record(HWPTAG_PARA_TEXT, 3, f"note {prefix} {n}".encode("utf-16-le"))
+    return data
+
+
+class TestNoteIndex:
+    """각주/미주 본문은 섹션 파싱 시 만든 인덱스로 찾는다"""
+
+    def _extract(self, reader, data):
+        records = reader._parse_records(data)
+        return reader._extract_section_text(records, ExtractOptions())
+
+    def test_ctrl_index_built_with_records(self):
+        reader = HWP5Reader("synthetic.hwp")
+        records = reader._parse_records(_note_section(3, "a"))
+
+        assert records.ctrl_index[CTRL_ID_FOOTNOTE] == [1, 5, 9]
+        assert CTRL_ID_ENDNOTE not in records.ctrl_index
+
+    def test_note_heavy_section(self):
+        reader = HWP5Reader("synthetic.hwp")
+        reader._reset_counters()
+        text = self._extract(reader, _note_section(400, "p"))
+
+        assert len(reader._footnotes) == 400
+        assert reader._footnotes[0].text == "note p 1"
+        assert reader._footnotes[-1].number == 400
+        assert reader._footnotes[-1].text == "note p 400"
+        assert "p 400[^400]" in text
+
+    def test_note_occurrence_is_per_section(self):
+        reader = HWP5Reader("synthetic.hwp")
+        reader._reset_counters()
+        self._extract(reader, _note_section(2, "a"))
+        text = self._extract(reader, _note_section(2, "b"))
+
+        assert [note.number for note in reader._footnotes] == [1, 2, 3, 4]
+        assert reader._footnotes[2].text == "note b 1"
+        assert "b 1[^3]" in text
+
+
+class TestRecordTable:
+    """레코드 페이로드는 섹션 버퍼의 view로 제공된다"""
+
+    def test_records_are_views_into_section(self):
+        data = _record(HWPTAG_PARA_TEXT, 1, "abc".encode("utf-16-le"))
+        records = RecordTable(data)
+
+        assert len(records) == 1
+        tag_id, level, payload = records[0]
+        assert (tag_id, level) == (HWPTAG_PARA_TEXT, 1)
+        assert isinstance(payload, memoryview)
+        assert payload.obj is records.buffer.obj
+        assert bytes(payload) == "abc".encode("utf-16-le")
+
+    def test_extended_size_record(self):
+        payload = b"x" * 5000
+        header = HWPTAG_PARA_TEXT | (2 << 10) | (0xFFF << 20)
+        data = struct.pack("<II", header, len(payload)) + payload
+        data += _record(HWPTAG_LIST_HEADER, 0, b"\x00" * 4)
+        records = RecordTable(data)
+
+        assert list(records.tags) == [HWPTAG_PARA_TEXT, HWPTAG_LIST_HEADER]
+        assert records.sizes[0] == 5000
+        assert bytes(records.data(0)) == payload
+
+    def test_truncated_and_empty_records_skipped(self):
+        data = _record(HWPTAG_LIST_HEADER, 0, b"")
+        data += _record(HWPTAG_PARA_TEXT, 0, b"a\x00")
+        data += struct.pack("<I", HWPTAG_PARA_TEXT | (10 << 20)) + b"ab"
+        records = RecordTable(data)
+
+        assert len(records) == 1
+        assert bytes(records.data(0)) == b"a\x00"
+
+    def test_subtree_end(self):
+        levels = [0, 1, 2, 1, 0, 1, 3, 2]
+        data = b"".join(_record(HWPTAG_PARA_TEXT, level, b"a\x00") for level in levels)
+        records = RecordTable(data)
+
+        assert list(records.subtree_end) == [4, 3, 3, 4, 8, 8, 7, 8]
+        assert records.level_end(1) == 4
+        assert records.level_end(6) == 7
+        assert records.level_end(0) == 8
+
+
+def _table(level, size, cells):
+    """표 컨트롤 아래 ``size`` x ``size`` 표; 셀은 문자열 또는 중첩 표 레코드"""
+    payload = struct.pack("<IHH", 0, size, size) + b"\x00" * 10
+    payload += struct.pack(f"<{size}H", *([size] * size))
+    data = _record(HWPTAG_CTRL_HEADER, level, b" lbt")
+    data += _record(HWPTAG_TABLE, level + 1, payload)
+    for cell in cells:
+        data += _record(HWPTAG_LIST_HEADER, level + 1, b"\x00" * 8)
+        if isinstance(cell, bytes):
+            data += cell
+        else:
+            data += _record(HWPTAG_PARA_TEXT, level + 2, cell.encode("utf-16-le"))
+    return data
+
+
+class TestTableTree:
+    """표 구조는 섹션마다 한 번 만들어 extract_text와 get_tables가 공유한다"""
+
+    def _nested(self, depth):
+        table = _table(5 + 2 * depth, 2, ["a", "b", "c", "d"])
+        for level in range(depth, 0, -1):
+            table = _table(1 + 2 * level, 2, [table, "x", "y", "z"])
+        return _table(1, 2, [table, "p", "q", "r"])
+
+    def test_nested_table_in_first_cell(self):
+        reader = HWP5Reader("synthetic.hwp")
+        records = reader._parse_records(_table(1, 2, [_table(3, 2, "abcd"), *"xyz"]))
+        tables = reader._extract_tables_from_section(records, ExtractOptions())
+
+        assert [table.rows for table in tables] == [
+            [["a b c d", "x"], ["y", "z"]],
+            [["a", "b"], ["c", "d"]],
+        ]
+        assert list(records.tables) == [1]
+        assert records.tables[1].end == len(records) - 1
+
+    def test_tree_is_memoized(self):
+        records = RecordTable(self._nested(3))
+        assert records.tables is records.tables
+
+    def test_each_cell_paragraph_decoded_once(self, monkeypatch):
+        reader = HWP5Reader("synthetic.hwp")
+        records = reader._parse_records(self._nested(6))
+        decoded = []
+        decode = reader._decode_cell_paragraph_with_markers
+
+        def counting_decode(data, *args):
+            decoded.append(bytes(data))
+            return decode(data, *args)
+
+        monkeypatch.setattr(
+            reader, "_decode_cell_paragraph_with_markers", counting_decode
+        )
+        reader._reset_counters()
+        text = reader._extract_section_text(records, ExtractOptions())
+        tables = reader._extract_tables_from_section(records, ExtractOptions())
+
+        paragraphs = records.tags.tolist().count(HWPTAG_PARA_TEXT)
+        assert len(decoded) == 2 * paragraphs
+        assert len(tables) == 8
+        assert tables[0].rows == [["a b c d" + " x y z" * 6, "p"], ["q", "r"]]
+        assert tables[-1].rows == [["a", "b"], ["c", "d"]]
+        assert "a b c d" + " x y z" * 6 in text
+
+    def test_footnote_in_cell_is_not_a_cell(self):
+        para = "a".encode("utf-16-le") + _note_ctrl(CTRL_ID_FOOTNOTE)
+        cell = _record(HWPTAG_PARA_TEXT, 3, para)
+        cell += _record(HWPTAG_CTRL_HEADER, 3, struct.pack("<I", CTRL_ID_FOOTNOTE))
+        cell += _record(HWPTAG_LIST_HEADER, 4, b"\x00" * 8)
+        cell += _record(HWPTAG_PARA_TEXT, 5, "note".encode("utf-16-le"))
+        reader = HWP5Reader("synthetic.hwp")
+        reader._reset_counters()
+        records = reader._parse_records(_table(1, 2, [cell, *"xyz"]))
+        tables = reader._extract_tables_from_section(records, ExtractOptions())
+
+        assert [table.rows for table in tables] == [[["a[^1]", "x"], ["y", "z"]]]
+        assert [note.text for note in reader._footnotes] == ["note"]
+
+
+class TestParagraphDecoder:
+    """PARA_TEXT 디코더는 일반 문자 구간을 한 번에 처리한다"""
+
+    def _decode(self, data):
+        return HWP5Reader("synthetic.hwp")._decode_paragraph_plain(memoryview(data))
+
+    def test_text_runs_and_controls(self):
+        data = "가나".encode("utf-16-le") + struct.pack("<H", 9)
+        data += "abc".encode("utf-16-le") + _note_ctrl(CTRL_ID_FOOTNOTE)
+        data += "끝".encode("utf-16-le") + struct.pack("<H", 13)
+
+        assert self._decode(data) == "가나 abc끝"
+
+    def test_invalid_and_surrogate_units_dropped(self):
+        data = "a".encode("utf-16-le") + struct.pack("<HHH", 0xD83D, 0xDE00, 0x007F)
+        data += "b\U0001f600c".encode("utf-16-le") + b"\x00"
+
+        assert self._decode(data) == "abc"
+
+    def test_marker_numbers_follow_counters(self):
+        reader = HWP5Reader("synthetic.hwp")
+        reader._reset_counters()
+        reader._footnote_counter = 7
+        data = "x".encode("utf-16-le") + _note_ctrl(CTRL_ID_FOOTNOTE)
+        tokens = ParagraphTokens(data)
+
+        text = reader._decode_paragraph_text_with_markers(
+            tokens, ExtractOptions(), tokens.footnotes, []
+        )
+        assert tokens.footnotes == [2]
+        assert text == "x[^7]"
+
+
+class TestCharFilter:
+    """유효 문자 판정은 import 시 만든 테이블을 쓴다"""
+
+    def test_table_matches_block_list(self):
+        reader = HWP5Reader("synthetic.hwp")
+
+        for low, high in DEFAULT_CHAR_RANGES:
+            assert reader._is_valid_char(low) and reader._is_valid_char(high)
+        assert not reader._is_valid_char(0x1F)
+        assert not reader._is_valid_char(0x007F)
+        assert not reader._is_valid_char(0xD800)
+        assert not reader._is_valid_char(0xE000)
+        assert not reader._is_valid_char(0x1F600)
+
+    def test_run_filter_matches_table(self):
+        reader = HWP5Reader("synthetic.hwp")
+        units = "".join(chr(code) for code in range(0x20, 0x10000))
+        data = units.encode("utf-16-le", "surrogatepass")
+        expected = "".join(ch for ch in units if reader._is_valid_char(ord(ch)))
+
+        assert reader._decode_paragraph_plain(data) == expected
+
+    def test_custom_char_ranges(self):
+        reader = HWP5Reader("synthetic.hwp")
+        data = "a가".encode("utf-16-le")
+
+        reader._use_char_ranges(ExtractOptions())
+        assert reader._decode_paragraph_plain(data) == "a가"
+
+        options = ExtractOptions(allowed_char_ranges=[(0x61, 0x7A), (0xE000, 0xF8FF)])
+        reader._use_char_ranges(options)
+        assert options.allowed_char_ranges == ((0x61, 0x7A), (0xE000, 0xF8FF))
+        assert reader._decode_paragraph_plain(data) == "a"
+        assert not reader._is_valid_char(0xAC00)
+
+    def test_invalid_char_range_rejected(self):
+        with pytest.raises(ValueError):
+            ExtractOptions(allowed_char_ranges=[(0x7A, 0x61)])
+
+
+class TestParagraphTokens:
+    """문단은 한 번 스캔해 제어 문자 이벤트로 분류한다"""
+
+    def _field(self, ctrl_id, value):
+        return (
+            struct.pack("<HI", 3, ctrl_id)
+            + b"\x00" * 8
+            + struct.pack("<H", 3)
+            + value.encode("utf-16-le")
+            + struct.pack("<HI", 4, ctrl_id)
+            + b"\x00" * 8
+            + struct.pack("<H", 4)
+        )
+
+    def test_control_events(self):
+        data = "a".encode("utf-16-le") + _note_ctrl(CTRL_ID_FOOTNOTE)
+        data += self._field(CTRL_ID_HYPERLINK, "link")
+        data += _note_ctrl(CTRL_ID_ENDNOTE) + self._field(CTRL_ID_MEMO, "ref")
+        data += struct.pack("<HI", 11, 0) + b"\x00" * 8 + struct.pack("<H", 11)
+        tokens = ParagraphTokens(data)
+
+        assert tokens.footnotes == [2]
+        assert tokens.hyperlinks == [18]
+        assert tokens.endnotes == [58]
+        assert tokens.memos == [74]
+        assert tokens.has_object
+        assert all(tokens.units[index] < " " for index in tokens.controls)
+
+    def test_hyperlink_and_memo_text(self):
+        reader = HWP5Reader("synthetic.hwp")
+        data = self._field(CTRL_ID_HYPERLINK, "홈페이지") + self._field(
+            CTRL_ID_MEMO, "참조"
+        )
+        tokens = ParagraphTokens(data)
+
+        assert reader._extract_hyperlink_texts_from_para(tokens) == ["홈페이지"]
+        assert reader._extract_memo_ref_text(tokens, tokens.memos[0] + 14) == "참조"
+
+    def test_truncated_field_start_terminates(self):
+        reader = HWP5Reader("synthetic.hwp")
+        data = self._field(CTRL_ID_HYPERLINK, "x") + struct.pack("<HH", 3, 0)
+
+        assert reader._extract_hyperlink_texts_from_para(ParagraphTokens(data)) == ["x"]
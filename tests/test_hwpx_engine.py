@@ -0,0 +1,152 @@
+"""
+HWPX 엔진 테스트 (header.xml 모델, ZIP 멤버 색인)
+"""
+
+import io
+import zipfile
+
+import pytest
+
+from hwp_hwpx_parser import HeaderInfo, HWPXReader
+from hwp_hwpx_parser import hwpx
+
+HEADER_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<hh:head xmlns:hh="http://www.hancom.co.kr/hwpml/2011/head">
+  <hh:refList>
+    <hh:binDataList>
+      <hh:binItem id="image1" src="BinData/image1.png"/>
+      <hh:binItem id="image2" src="image2.jpg"/>
+      <hh:binItem id="" src="BinData/ignored.png"/>
+    </hh:binDataList>
+    <hh:memoProperties>
+      <hh:memoPr id="m1" width="15591" fillColor="#CCFF99" lineColor="#000000"/>
+    </hh:memoProperties>
+  </hh:refList>
+</hh:head>
+"""
+
+SECTION_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<hs:sec xmlns:hs="s" xmlns:hp="p">
+  <hp:p><hp:run>
+    <hp:ctrl><hp:fieldBegin type="MEMO" id="m1">
+      <hp:subList><hp:p><hp:run><hp:t>메모</hp:t></hp:run></hp:p></hp:subList>
+    </hp:fieldBegin></hp:ctrl>
+    <hp:t>본문</hp:t>
+    <hp:ctrl><hp:fieldEnd/></hp:ctrl>
+  </hp:run></hp:p>
+</hs:sec>
+"""
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+
+
+@pytest.fixture
+def hwpx_path(tmp_path):
+    path = tmp_path / "doc.hwpx"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("Contents/header.xml", HEADER_XML)
+        zf.writestr("Contents/section0.xml", SECTION_XML)
+        zf.writestr("Contents/BinData/image1.png", PNG)
+    return path
+
+
+class TestHeaderInfo:
+    def test_from_xml(self):
+        info = HeaderInfo.from_xml(io.BytesIO(HEADER_XML.encode()))
+
+        assert info.bin_items == {
+            "image1": ("image1.png", "BinData/image1.png"),
+            "image2": ("image2.jpg", "image2.jpg"),
+        }
+        assert info.memo_properties["m1"]["width"] == "15591"
+        assert info.memo_properties["m1"]["fillColor"] == "#CCFF99"
+
+    def test_parsed_once_per_open_reader(self, hwpx_path, monkeypatch):
+        calls = []
+        original = HeaderInfo.from_xml
+
+        def counting_from_xml(source):
+            calls.append(source)
+            return original(source)
+
+        monkeypatch.setattr(hwpx.HeaderInfo, "from_xml", counting_from_xml)
+
+        with HWPXReader(hwpx_path) as reader:
+            first = reader.extract_text_with_notes()
+            reader.get_memos()
+            reader.get_images()
+            second = reader.extract_text_with_notes()
+
+        assert len(calls) == 1
+        assert first.memos == second.memos
+        assert first.memos[0].width == 15591
+        assert first.memos[0].fill_color == "#CCFF99"
+
+    def test_reparsed_after_close(self, hwpx_path):
+        reader = HWPXReader(hwpx_path)
+        header = reader.header
+        reader.close()
+
+        assert reader.header is not header
+        assert reader.header == header
+        reader.close()
+
+    def test_missing_header(self, tmp_path):
+        path = tmp_path / "no_header.hwpx"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("Contents/section0.xml", SECTION_XML)
+
+        with HWPXReader(path) as reader:
+            assert reader.header == HeaderInfo()
+            assert reader.extract_text() == "본문[MEMO:1]"
+
+
+class TestZipIndex:
+    def test_sections_sorted_numerically(self, tmp_path):
+        path = tmp_path / "many.hwpx"
+        with zipfile.ZipFile(path, "w") as zf:
+            for index in (10, 2, 0, 1, 11):
+                zf.writestr(
+                    f"Contents/section{index}.xml",
+                    SECTION_XML.replace("본문", f"섹션{index}"),
+                )
+
+        with HWPXReader(path) as reader:
+            assert reader._get_section_files() == [
+                f"Contents/section{index}.xml" for index in (0, 1, 2, 10, 11)
+            ]
+            chunks = list(reader.iter_sections())
+
+        assert [chunk.text for chunk in chunks] == [
+            f"섹션{index}[MEMO:{number}]"
+            for number, index in enumerate((0, 1, 2, 10, 11), start=1)
+        ]
+
+    def test_namelist_read_once(self, hwpx_path, monkeypatch):
+        calls = []
+        original = zipfile.ZipFile.namelist
+
+        def counting_namelist(self):
+            calls.append(self)
+            return original(self)
+
+        monkeypatch.setattr(zipfile.ZipFile, "namelist", counting_namelist)
+
+        with HWPXReader(hwpx_path) as reader:
+            assert reader.is_valid()
+            assert not reader.is_encrypted()
+            reader.extract_text()
+            reader.get_images()
+            reader.get_memos()
+
+        assert len(calls) == 1
+
+    def test_image_filename_fallback_by_stem(self, tmp_path):
+        path = tmp_path / "images.hwpx"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("Contents/section0.xml", SECTION_XML)
+            zf.writestr("BinData/image7.bmp", b"BM")
+
+        with HWPXReader(path) as reader:
+            assert reader._get_image_filename("image7") == "image7.bmp"
+            assert reader._get_image_filename("image8") is None
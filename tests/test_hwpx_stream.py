@@ -0,0 +1,181 @@
+"""
+HWPX 섹션 스트리밍 파서 테스트
+"""
+
+import io
+import zipfile
+
+import pytest
+
+from hwp_hwpx_parser import ExtractOptions, HWPXReader
+from hwp_hwpx_parser.hwpx import _ElementStream
+
+NS = 'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph"'
+
+
+def para(*parts: str) -> str:
+    return "<hp:p><hp:run>" + "".join(parts) + "</hp:run></hp:p>"
+
+
+def text(value: str) -> str:
+    return f"<hp:t>{value}</hp:t>"
+
+
+def footnote(value: str) -> str:
+    return f"<hp:ctrl><hp:footNote><hp:subList>{para(text(value))}</hp:subList></hp:footNote></hp:ctrl>"
+
+
+def table(*rows) -> str:
+    body = "".join(
+        "<hp:tr>"
+        + "".join(
+            f"<hp:tc><hp:subList>{para(cell)}</hp:subList></hp:tc>" for cell in row
+        )
+        + "</hp:tr>"
+        for row in rows
+    )
+    return f"<hp:tbl>{body}</hp:tbl>"
+
+
+@pytest.fixture
+def make_hwpx(tmp_path):
+    def make(*sections: str):
+        path = tmp_path / "doc.hwpx"
+        with zipfile.ZipFile(path, "w") as zf:
+            for index, body in enumerate(sections):
+                zf.writestr(
+                    f"Contents/section{index}.xml",
+                    f'<?xml version="1.0" encoding="UTF-8"?><hs:sec {NS} xmlns:hs="s">{body}</hs:sec>',
+                )
+        return path
+
+    return make
+
+
+class TestElementStream:
+    def test_processed_elements_are_released(self):
+        body = "".join(para(text(f"문단 {i}")) for i in range(5000))
+        source = io.BytesIO(f"<root {NS}>{body}</root>".encode())
+        stream = _ElementStream(source)
+        root = None
+        max_children = 0
+
+        for event, elem in stream:
+            if root is None:
+                root = elem
+            if event == "start" and elem.tag.endswith("}t"):
+                stream.capture()
+            elif event == "subtree":
+                assert elem.text.startswith("문단")
+                max_children = max(max_children, len(root))
+
+        # 파서가 한 번에 읽는 분량만큼만 트리에 남는다
+        assert max_children < 1000
+        assert len(root) == 0
+
+    def test_subtree_is_complete(self):
+        source = io.BytesIO(f"<root {NS}>{table(['a', 'b'])}</root>".encode())
+        stream = _ElementStream(source)
+        subtrees = []
+
+        for event, elem in stream:
+            if event == "start" and elem.tag.endswith("}tbl"):
+                stream.capture()
+            elif event == "subtree":
+                subtrees.append(elem)
+
+        assert len(subtrees) == 1
+        cells = [e for e in subtrees[0].iter() if e.tag.endswith("}tc")]
+        assert len(cells) == 2
+
+
+class TestStreamingExtraction:
+    def test_table_inside_paragraph_keeps_note_order(self, make_hwpx):
+        body = para(
+            text("앞"),
+            footnote("첫째"),
+            table([text("셀") + footnote("둘째"), text("x")]),
+            text("뒤"),
+            footnote("셋째"),
+        )
+        with HWPXReader(make_hwpx(body)) as reader:
+            result = reader.extract_text_with_notes(ExtractOptions())
+
+        assert result.text == "앞[^1]\n| 셀[^2] | x |\n| --- | --- |\n뒤[^3]"
+        assert [note.text for note in result.footnotes] == ["첫째", "둘째", "셋째"]
+
+    def test_large_table_rows(self, make_hwpx):
+        rows = [[text(f"r{i}c{j}") for j in range(3)] for i in range(500)]
+        body = para(text("제목")) + para(table(*rows))
+        with HWPXReader(make_hwpx(body)) as reader:
+            tables = reader.get_tables()
+            extracted = reader.extract_text()
+
+        assert len(tables) == 1
+        assert tables[0].rows[499] == ["r499c0", "r499c1", "r499c2"]
+        assert extracted.startswith("제목\n\n| r0c0 | r0c1 | r0c2 |")
+
+    def test_get_tables_lists_outer_before_nested(self, make_hwpx):
+        inner = table([text("안")])
+        body = para(table([text("밖") + inner, text("b")])) + para(
+            table([text("다음")])
+        )
+        with HWPXReader(make_hwpx(body)) as reader:
+            tables = reader.get_tables()
+
+        assert [table.rows[0][0] for table in tables] == ["밖안", "안", "다음"]
+
+    def test_memo_spanning_paragraphs(self, make_hwpx):
+        memo = (
+            '<hp:ctrl><hp:fieldBegin type="MEMO" id="m1">'
+            f"<hp:subList>{para(text('메모 내용'))}</hp:subList>"
+            "</hp:fieldBegin></hp:ctrl>"
+        )
+        body = para(memo, text("참조")) + para(
+            text("텍스트"), "<hp:ctrl><hp:fieldEnd/></hp:ctrl>"
+        )
+        with HWPXReader(make_hwpx(body)) as reader:
+            memos = reader.get_memos()
+
+        assert len(memos) == 1
+        assert memos[0].text == "메모 내용"
+        assert memos[0].referenced_text == "참조텍스트"
+
+    def test_other_paragraph_namespace(self, tmp_path):
+        # 처리하는 요소는 네임스페이스 URI와 관계없이 TAG_* 상수로 맞춘다
+        path = tmp_path / "doc.hwpx"
+        body = para(text("앞"), footnote("각주")) + para(table([text("셀")]))
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr(
+                "Contents/section0.xml",
+                '<hs:sec xmlns:hp="urn:other" xmlns:hs="s">' + body + "</hs:sec>",
+            )
+        with HWPXReader(path) as reader:
+            result = reader.extract_text_with_notes(ExtractOptions())
+            tables = reader.get_tables()
+
+        assert result.text == "앞[^1]\n\n| 셀 |\n| --- |\n"
+        assert [note.text for note in result.footnotes] == ["각주"]
+        assert tables[0].rows == [["셀"]]
+
+    def test_deeply_nested_tables(self, make_hwpx):
+        # 재귀 한도보다 훨씬 깊게 중첩해도 순회가 끝난다
+        depth = 5000
+        body = text("끝")
+        for level in reversed(range(depth)):
+            body = table([text(f"c{level}") + footnote(f"n{level}") + body])
+        with HWPXReader(make_hwpx(para(body))) as reader:
+            result = reader.extract_text_with_notes(ExtractOptions())
+
+        assert [note.text for note in result.footnotes][:3] == ["n0", "n1", "n2"]
+        assert len(result.footnotes) == depth
+        assert result.text.startswith("\n| c0[^1]c1[^2]c2[^3]")
+        assert "c4999[^5000]끝" in result.text
+
+        # 중첩 표는 한 번씩만 순회하며, 바깥 셀에 인라인으로 들어간 것과 같다
+        with HWPXReader(make_hwpx(para(body))) as reader:
+            tables = reader.get_tables()
+        assert len(tables) == depth
+        assert tables[1].rows[0][0].startswith("c1[^2]c2[^3]")
+        assert tables[0].rows[0][0] == "c0[^1]" + tables[1].to_inline()
+        assert tables[-1].rows == [["c4999[^5000]끝"]]
@@ -4,13 +4,25 @@ Tests for image extraction functionality.
 TDD approach: RED -> GREEN -> REFACTOR
 """
 
+import io
+import struct
+from dataclasses import asdict, fields
+import zipfile
+import zlib
+
 import pytest
 from pathlib import Path
+from hwp_hwpx_parser.images import (
+    FORMAT_HEAD_SIZE,
+    head_reader,
+    inflate_stream,
+    inflated_head_reader,
+    read_image_header,
+)
 from hwp_hwpx_parser.models import ImageData, detect_image_format
 from hwp_hwpx_parser import HWP5Reader, HWPXReader, Reader
 import tempfile
 
-
 TESTS_DATA_DIR = Path(__file__).parent / "data"
 
 # Test file availability flags
@@ -70,6 +82,40 @@ class TestImageData:
         assert Path(output_file).exists()
         assert Path(output_file).read_bytes() == data
 
+    def test_equality_compares_payloads(self):
+        png = b"\x89PNG\r\n\x1a\n"
+        img = ImageData(filename="a.png", data=png + b"1", index=0, format="png")
+        assert img == ImageData(
+            filename="a.png", data=png + b"1", index=0, format="png"
+        )
+        assert img != ImageData(
+            filename="a.png", data=png + b"2", index=0, format="png"
+        )
+        assert img != ImageData(
+            filename="b.png", data=png + b"1", index=0, format="png"
+        )
+
+    def test_public_fields(self):
+        img = ImageData(
+            filename="a.png", data=b"png", index=0, format="png", writer=print
+        )
+        assert [f.name for f in fields(ImageData)] == [
+            "filename",
+            "data",
+            "index",
+            "format",
+            "width",
+            "height",
+        ]
+        assert asdict(img) == {
+            "filename": "a.png",
+            "data": b"png",
+            "index": 0,
+            "format": "png",
+            "width": None,
+            "height": None,
+        }
+
 
 class TestDetectImageFormat:
     """Test detect_image_format function."""
@@ -342,3 +388,187 @@ class TestReaderImages:
 
                 assert output_dir.exists()
                 assert len(saved_paths) > 0
+
+
+class TestLazyImages:
+    """Test iter_images() lazy payloads and streaming save."""
+
+    @pytest.fixture(params=["hwp", "hwpx"])
+    def image_file(self, request, tmp_path):
+        if request.param == "hwp":
+            if not HAS_HWP5_IMAGES:
+                pytest.skip("No HWP5 test files with images available")
+            return TESTS_DATA_DIR / "글상자.hwp"
+
+        path = tmp_path / "images.hwpx"
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("Contents/section0.xml", "<sec/>")
+            zf.writestr("BinData/image1.png", b"\x89PNG\r\n\x1a\n" + bytes(300000))
+            zf.writestr("BinData/image2.jpg", b"\xff\xd8\xff" + b"jpeg" * 1000)
+            zf.writestr("BinData/notes.txt", b"not an image")
+        return path
+
+    def test_matches_get_images(self, image_file):
+        with Reader(image_file) as reader:
+            expected = reader.get_images()
+            lazy = list(reader.iter_images())
+
+            assert expected
+            assert not any(img.is_loaded for img in lazy)
+            assert [(img.filename, img.index, img.format) for img in lazy] == [
+                (img.filename, img.index, img.format) for img in expected
+            ]
+            assert [img.data for img in lazy] == [img.data for img in expected]
+            assert all(img.is_loaded for img in lazy)
+
+    def test_compare_and_repr_do_not_load(self, image_file):
+        with Reader(image_file) as reader:
+            lazy = list(reader.iter_images())
+            again = list(reader.iter_images())
+
+            assert lazy == again
+            repr(lazy)
+            assert not any(img.is_loaded for img in lazy + again)
+
+    def test_save_streams_to_disk(self, image_file, tmp_path):
+        with Reader(image_file) as reader:
+            expected = {img.filename: img.data for img in reader.get_images()}
+            for img in reader.iter_images():
+                img.save(tmp_path / img.filename)
+                assert not img.is_loaded
+
+        for filename, data in expected.items():
+            assert (tmp_path / filename).read_bytes() == data
+
+    def test_readable_after_close(self, image_file):
+        reader = Reader(image_file)
+        with reader:
+            images = list(reader.iter_images())
+        expected = Reader(image_file).get_images()
+
+        assert [img.data for img in images] == [img.data for img in expected]
+
+    def test_access_after_close_keeps_reader_closed(self, image_file, tmp_path):
+        reader = Reader(image_file)
+        with reader:
+            images = list(reader.iter_images())
+        inner = reader._reader
+
+        images[0].save(tmp_path / "first")
+        assert images[-1].data
+        assert getattr(inner, "_ole", None) is None
+        assert getattr(inner, "_zipfile", None) is None
+
+
+class TestInflateStream:
+    """Test chunked raw-deflate decompression used by lazy images."""
+
+    def _deflate(self, data):
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+        return compressor.compress(data) + compressor.flush()
+
+    def test_large_payload(self):
+        data = bytes(range(256)) * 8192 + b"\x00" * (4 << 20)
+        out = io.BytesIO()
+        inflate_stream(io.BytesIO(self._deflate(data)), out)
+        assert out.getvalue() == data
+
+    @pytest.mark.parametrize(
+        "raw",
+        [b"\x89PNG\r\n\x1a\n" + b"stored image", b""],
+    )
+    def test_undecodable_data_is_copied(self, raw):
+        out = io.BytesIO()
+        inflate_stream(io.BytesIO(raw), out)
+        assert out.getvalue() == raw
+
+    def test_truncated_stream_is_copied(self):
+        raw = self._deflate(b"abc" * 100000)[:-10]
+        out = io.BytesIO()
+        inflate_stream(io.BytesIO(raw), out)
+        assert out.getvalue() == raw
+
+
+def _png(width, height):
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sII", 13, b"IHDR", width, height)
+
+
+def _jpeg(width, height, app_size=100):
+    app1 = b"\xff\xe1" + struct.pack(">H", app_size + 2) + bytes(app_size)
+    sof0 = b"\xff\xc0" + struct.pack(">HBHHB", 11, 8, height, width, 1) + bytes(3)
+    return b"\xff\xd8" + app1 + b"\xff\xdb\x00\x04\x00\x00" + sof0 + b"\xff\xd9"
+
+
+class TestImageProbe:
+    """Test header-only image size probing."""
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            (_png(640, 480), ("png", 640, 480)),
+            (b"GIF89a" + struct.pack("<HH", 32, 16), ("gif", 32, 16)),
+            (
+                b"BM" + bytes(12) + struct.pack("<Iii", 40, 100, -50),
+                ("bmp", 100, 50),
+            ),
+            (b"BM" + bytes(12) + struct.pack("<IHH", 12, 7, 9), ("bmp", 7, 9)),
+            (_jpeg(1024, 768), ("jpg", 1024, 768)),
+            (_jpeg(300, 200, app_size=20000), ("jpg", 300, 200)),
+            (
+                struct.pack("<II4i", 1, 108, 10, 20, 210, 120),
+                ("emf", 200, 100),
+            ),
+            (
+                b"\xd7\xcd\xc6\x9a\x00\x00"
+                + struct.pack("<hhhhH", 0, 0, 1440, 720, 1440),
+                ("wmf", 96, 48),
+            ),
+            (b"\xff\xd8\xff\xe0", ("jpg", None, None)),
+            (b"unknown data", ("unknown", None, None)),
+        ],
+    )
+    def test_read_image_header(self, data, expected):
+        assert read_image_header(head_reader(io.BytesIO(data)), probe=True) == expected
+
+    def test_without_probe_reads_format_only(self):
+        stream = io.BytesIO(_png(640, 480))
+        assert read_image_header(head_reader(stream)) == ("png", None, None)
+        assert stream.tell() == FORMAT_HEAD_SIZE
+
+    def test_compressed_stream(self):
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+        payload = _png(12, 34) + bytes(1 << 20)
+        raw = compressor.compress(payload) + compressor.flush()
+        reader = inflated_head_reader(io.BytesIO(raw))
+
+        assert read_image_header(reader, probe=True) == ("png", 12, 34)
+
+    def test_list_images_probe(self, tmp_path):
+        path = tmp_path / "images.hwpx"
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("Contents/section0.xml", "<sec/>")
+            zf.writestr("BinData/image1.png", _png(320, 240) + bytes(100000))
+            zf.writestr("BinData/image2.jpg", _jpeg(64, 48))
+
+        with Reader(path) as reader:
+            images = reader.list_images(probe=True)
+            assert [(img.width, img.height) for img in images] == [
+                (320, 240),
+                (64, 48),
+            ]
+            assert not any(img.is_loaded for img in images)
+            assert all(img.width is None for img in reader.list_images())
+
+    @pytest.mark.skipif(
+        not HAS_HWP5_IMAGES, reason="No HWP5 test files with images available"
+    )
+    def test_list_images_probe_hwp5(self):
+        with Reader(TESTS_DATA_DIR / "글상자.hwp") as reader:
+            images = reader.list_images(probe=True)
+            assert images
+            for img in images:
+                fmt, width, height = read_image_header(
+                    head_reader(io.BytesIO(img.data)), probe=True
+                )
+                assert (img.format, img.width, img.height) == (fmt, width, height)
+                assert img.width and img.height
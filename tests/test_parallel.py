@@ -0,0 +1,126 @@
+"""
+섹션 병렬 추출 (ExtractOptions.parallel_sections) 테스트
+"""
+
+import multiprocessing
+import zipfile
+from dataclasses import replace
+
+import pytest
+from pathlib import Path
+
+from hwp_hwpx_parser import (
+    ExtractOptions,
+    HWP5Reader,
+    HWPXReader,
+    ImageMarkerStyle,
+    Reader,
+    TableStyle,
+)
+
+TESTS_DATA_DIR = Path(__file__).parent / "data"
+SAMPLE_HWP = TESTS_DATA_DIR / "sample_notes.hwp"
+SAMPLE_HWPX = TESTS_DATA_DIR / "sample_notes.hwpx"
+
+pytestmark = pytest.mark.skipif(
+    not (SAMPLE_HWP.exists() and SAMPLE_HWPX.exists()),
+    reason="Sample files not available",
+)
+
+# 워커가 부모에서 바꾼 클래스를 물려받아야 하는 테스트 (fork)
+requires_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method(allow_none=False) != "fork",
+    reason="needs the fork start method",
+)
+
+OPTION_VARIANTS = [
+    ExtractOptions(),
+    ExtractOptions(table_style=TableStyle.CSV, image_marker=ImageMarkerStyle.WITH_NAME),
+    ExtractOptions(
+        table_style=TableStyle.INLINE,
+        image_marker=ImageMarkerStyle.NONE,
+        include_empty_paragraphs=True,
+    ),
+]
+
+
+def _extract(reader_cls, source, options):
+    with reader_cls(source) as reader:
+        result = reader.extract_text_with_notes(options)
+        chunks = list(reader.iter_sections(options))
+    return result, chunks
+
+
+def _assert_same_as_sequential(reader_cls, source, options):
+    expected = _extract(reader_cls, source, options)
+    actual = _extract(reader_cls, source, replace(options, parallel_sections=2))
+    assert actual == expected
+    return expected
+
+
+def _hwpx_with_sections(tmp_path: Path, count: int) -> Path:
+    """sample_notes.hwpx의 본문을 섹션 ``count``개로 복제한 문서"""
+    path = tmp_path / "sections.hwpx"
+    with zipfile.ZipFile(SAMPLE_HWPX) as src, zipfile.ZipFile(path, "w") as dst:
+        for info in src.infolist():
+            data = src.read(info.filename)
+            if info.filename == "Contents/section0.xml":
+                for idx in range(1, count):
+                    dst.writestr(f"Contents/section{idx}.xml", data)
+            dst.writestr(info, data)
+    return path
+
+
+@pytest.fixture
+def duplicated_hwp_sections(monkeypatch):
+    """HWP 5.0 샘플의 섹션 0을 세 번 읽게 한다 (여러 섹션 문서 대용)"""
+    read_section = HWP5Reader._read_section
+    monkeypatch.setattr(
+        HWP5Reader, "_read_section", lambda self, idx: read_section(self, 0)
+    )
+    monkeypatch.setattr(HWP5Reader, "_iter_sections", lambda self: iter(range(3)))
+
+
+class TestParallelSections:
+    @pytest.mark.parametrize("options", OPTION_VARIANTS)
+    def test_hwpx_matches_sequential(self, tmp_path, options):
+        path = _hwpx_with_sections(tmp_path, 4)
+        result, chunks = _assert_same_as_sequential(HWPXReader, path, options)
+        assert len(chunks) == 4
+        assert len(result.footnotes) == 4 * len(chunks[0].footnotes)
+
+    @requires_fork
+    @pytest.mark.parametrize("options", OPTION_VARIANTS)
+    def test_hwp_matches_sequential(self, duplicated_hwp_sections, options):
+        result, chunks = _assert_same_as_sequential(HWP5Reader, SAMPLE_HWP, options)
+        assert len(chunks) == 3
+        numbers = [note.number for note in result.footnotes]
+        assert numbers == list(range(1, len(numbers) + 1))
+        assert f"[^{numbers[-1]}]" in chunks[-1].text
+
+    def test_in_memory_input(self, tmp_path):
+        data = _hwpx_with_sections(tmp_path, 3).read_bytes()
+        _assert_same_as_sequential(HWPXReader, data, ExtractOptions())
+
+    def test_reader_facade(self, tmp_path):
+        path = _hwpx_with_sections(tmp_path, 3)
+        with Reader(path) as reader:
+            expected = reader.extract_text()
+        with Reader(path) as reader:
+            assert reader.extract_text(ExtractOptions(parallel_sections=2)) == expected
+
+    def test_option_is_not_part_of_the_value(self):
+        assert ExtractOptions(parallel_sections=4) == ExtractOptions()
+        assert "parallel_sections" not in repr(ExtractOptions(parallel_sections=4))
+        with pytest.raises(ValueError):
+            ExtractOptions(parallel_sections=-1)
+
+
+@requires_fork
+def test_hwp_hyperlinks_in_every_section(duplicated_hwp_sections):
+    # 처리한 하이퍼링크는 섹션별 레코드 번호라 섹션마다 다시 세야 한다
+    with HWP5Reader(SAMPLE_HWP) as reader:
+        links = reader.extract_text_with_notes().hyperlinks
+    assert links
+    assert len(links) % 3 == 0
+    assert links[: len(links) // 3] * 3 == links
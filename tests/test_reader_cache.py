@@ -0,0 +1,141 @@
+"""
+Reader 결과 캐시 테스트
+"""
+
+import pytest
+from pathlib import Path
+
+from hwp_hwpx_parser import ExtractOptions, Reader, TableStyle
+from hwp_hwpx_parser.reader import _options_key
+
+TESTS_DATA_DIR = Path(__file__).parent / "data"
+SAMPLE_FILES = [
+    TESTS_DATA_DIR / "sample_notes.hwp",
+    TESTS_DATA_DIR / "Table.hwpx",
+]
+
+
+@pytest.fixture(params=SAMPLE_FILES, ids=lambda path: path.name)
+def sample_path(request):
+    if not request.param.exists():
+        pytest.skip("Sample file not available")
+    return request.param
+
+
+def count_calls(reader, name, monkeypatch):
+    calls = []
+    inner = reader._get_reader()
+    original = getattr(inner, name)
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(inner, name, counting)
+    return calls
+
+
+class TestExtractOptionsKey:
+    def test_equal_options_share_a_key(self):
+        assert _options_key(ExtractOptions()) == _options_key(ExtractOptions())
+        assert ExtractOptions(allowed_char_ranges=[(0x20, 0x7E)]) == ExtractOptions(
+            allowed_char_ranges=((0x20, 0x7E),)
+        )
+        assert (
+            len(
+                {
+                    _options_key(ExtractOptions()),
+                    _options_key(ExtractOptions(line_separator="\n")),
+                    _options_key(ExtractOptions(parallel_sections=2)),
+                }
+            )
+            == 1
+        )
+        assert _options_key(ExtractOptions()) != _options_key(
+            ExtractOptions(table_style=TableStyle.CSV)
+        )
+
+    def test_options_are_not_hashable(self):
+        # 변경 가능한 공개 dataclass에는 값 기반 해시를 두지 않는다
+        with pytest.raises(TypeError):
+            hash(ExtractOptions())
+
+
+class TestReaderCache:
+    def test_text_parsed_once(self, sample_path, monkeypatch):
+        with Reader(sample_path) as reader:
+            calls = count_calls(reader, "extract_text_with_notes", monkeypatch)
+
+            text = reader.text
+            assert reader.text == text
+            assert reader.extract_text(ExtractOptions()) == text
+            assert reader.extract_text_with_notes().text == text
+            reader.find_all("paragraph")
+
+        assert len(calls) == 1
+
+    def test_tables_parsed_once(self, sample_path, monkeypatch):
+        with Reader(sample_path) as reader:
+            calls = count_calls(reader, "get_tables", monkeypatch)
+
+            tables = reader.tables
+            reader.get_tables_as_markdown()
+            reader.get_tables_as_csv()
+            assert reader.find_all("table") == tables
+
+        assert len(calls) == 1
+
+    def test_options_are_part_of_the_key(self, sample_path, monkeypatch):
+        with Reader(sample_path) as reader:
+            calls = count_calls(reader, "extract_text_with_notes", monkeypatch)
+            options = ExtractOptions(table_style=TableStyle.CSV)
+
+            csv_text = reader.extract_text(options)
+            markdown_text = reader.text
+            options.table_style = TableStyle.INLINE  # 키는 호출 시점의 값
+            assert reader.extract_text(ExtractOptions(table_style=TableStyle.CSV)) == (
+                csv_text
+            )
+
+        assert len(calls) == 2
+        assert csv_text != markdown_text
+
+    def test_invalidate(self, sample_path, monkeypatch):
+        with Reader(sample_path) as reader:
+            calls = count_calls(reader, "extract_text_with_notes", monkeypatch)
+            reader.text
+            reader.invalidate()
+            reader.text
+
+        assert len(calls) == 2
+
+    def test_cache_size_bound(self, sample_path, monkeypatch):
+        with Reader(sample_path, cache_size=2) as reader:
+            calls = count_calls(reader, "extract_text_with_notes", monkeypatch)
+            for separator in ("\n", "\n\n", "\n\n\n"):
+                reader.extract_text(ExtractOptions(paragraph_separator=separator))
+            assert len(reader._results) == 2
+
+            reader.extract_text(ExtractOptions(paragraph_separator="\n\n\n"))
+            reader.extract_text(ExtractOptions(paragraph_separator="\n"))
+
+        assert len(calls) == 4
+
+    def test_cache_disabled(self, sample_path, monkeypatch):
+        with Reader(sample_path, cache_size=0) as reader:
+            calls = count_calls(reader, "extract_text_with_notes", monkeypatch)
+            reader.text
+            reader.text
+
+        assert len(calls) == 2
+
+    def test_returned_lists_are_copies(self, sample_path):
+        with Reader(sample_path) as reader:
+            reader.tables.clear()
+            reader.extract_text_with_notes().footnotes.clear()
+
+            assert reader.tables == reader.get_tables()
+            assert reader.extract_text_with_notes().footnotes == (
+                reader.extract_text_with_notes().footnotes
+            )
+            assert len(reader.tables) > 0
@@ -0,0 +1,264 @@
+"""
+파일 형식 판별 (sniff) 테스트
+"""
+
+import io
+import shutil
+import struct
+import zipfile
+
+import pytest
+from pathlib import Path
+
+from hwp_hwpx_parser import FileType, Reader, sniff
+from hwp_hwpx_parser.batch import extract_many
+from hwp_hwpx_parser.sniff import OLE_MAGIC, SNIFF_SIZE
+
+TESTS_DATA_DIR = Path(__file__).parent / "data"
+SAMPLE_HWP = TESTS_DATA_DIR / "blank.hwp"
+SAMPLE_HWPX = TESTS_DATA_DIR / "sample_notes.hwpx"
+
+pytestmark = pytest.mark.skipif(
+    not (SAMPLE_HWP.exists() and SAMPLE_HWPX.exists()),
+    reason="Sample files not available",
+)
+
+HWP3_HEAD = b"HWP Document File V3.00 \x1a\x01\x02\x03\x04\x05" + bytes(128)
+
+
+class _CountingStream(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def _zip_bytes(members, stream=None) -> bytes:
+    buffer = stream or io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, data in members:
+            zf.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _ole_bytes(stream_names, dir_sector: int) -> bytes:
+    """512바이트 섹터 OLE: FAT은 섹터 0, 디렉터리는 ``dir_sector`` 한 섹터"""
+    header = bytearray(512)
+    header[:8] = OLE_MAGIC
+    struct.pack_into("<HH", header, 0x1A, 3, 0xFFFE)
+    struct.pack_into("<HH", header, 0x1E, 9, 6)
+    struct.pack_into("<II", header, 0x2C, 1, dir_sector)
+    struct.pack_into("<109I", header, 0x4C, 0, *[0xFFFFFFFF] * 108)
+
+    fat = [0xFFFFFFFF] * 128
+    fat[0] = 0xFFFFFFFD
+    fat[dir_sector] = 0xFFFFFFFE
+    directory = bytearray()
+    for kind, name in [(5, "Root Entry")] + [(2, name) for name in stream_names]:
+        encoded = name.encode("utf-16-le")
+        entry = bytearray(128)
+        entry[: len(encoded)] = encoded
+        struct.pack_into("<HB", entry, 0x40, len(encoded) + 2, kind)
+        directory += entry
+    filler = bytes(512 * (dir_sector - 1))
+    return bytes(header) + struct.pack("<128I", *fat) + filler + directory.ljust(512)
+
+
+def _hwp_mentioning(*names: str) -> bytes:
+    """FileHeader의 예약 영역에 다른 OLE 스트림 이름을 적은 정상 HWP"""
+    data = bytearray(SAMPLE_HWP.read_bytes())
+    pos = data.find(b"HWP Document File\x00") + 128
+    text = " ".join(names).encode("utf-16-le")
+    data[pos : pos + len(text)] = text
+    return bytes(data)
+
+
+def _unusual_hwpx() -> bytes:
+    """HWPX 항목 앞에 다른 항목이 있어 앞부분으로는 알아볼 수 없는 HWPX"""
+    with zipfile.ZipFile(SAMPLE_HWPX) as zf:
+        members = [(name, zf.read(name)) for name in zf.namelist()]
+    return _zip_bytes([("readme.txt", b"hello")] + members)
+
+
+def _encrypted_hwp() -> bytes:
+    data = bytearray(SAMPLE_HWP.read_bytes())
+    pos = data.find(b"HWP Document File\x00")
+    data[pos + 36] |= 0x02
+    return bytes(data)
+
+
+class TestSniff:
+    def test_samples(self):
+        for path in TESTS_DATA_DIR.glob("*.hwp"):
+            assert sniff(path) == FileType.HWP5, path
+        for path in TESTS_DATA_DIR.glob("*.hwpx"):
+            assert sniff(path) == FileType.HWPX, path
+
+    def test_in_memory_input(self):
+        assert sniff(SAMPLE_HWP.read_bytes()) == FileType.HWP5
+        assert sniff(io.BytesIO(SAMPLE_HWPX.read_bytes())) == FileType.HWPX
+
+    def test_reads_only_the_head(self):
+        stream = _CountingStream(SAMPLE_HWPX.read_bytes() + bytes(1 << 20))
+        sniff(stream)
+        assert stream.bytes_read <= SNIFF_SIZE
+
+    def test_hwp3(self):
+        assert sniff(HWP3_HEAD) == FileType.HWP3
+
+    def test_encrypted_hwp5(self):
+        assert sniff(_encrypted_hwp()) == FileType.ENCRYPTED
+
+    def test_foreign_ole(self):
+        head = OLE_MAGIC + bytes(1016) + "WordDocument".encode("utf-16-le")
+        assert sniff(head) == FileType.UNKNOWN
+
+    def test_hwp_content_naming_other_ole_streams(self):
+        # 스트림 내용에 나오는 이름은 디렉터리 항목이 아니다
+        data = _hwp_mentioning("Workbook", "PowerPoint Document")
+        assert "Workbook".encode("utf-16-le") in data[:SNIFF_SIZE]
+        assert sniff(data) == FileType.HWP5
+        with Reader(data) as reader:
+            assert reader.text == Reader(SAMPLE_HWP).text
+
+    def test_ole_directory_past_head(self):
+        # 디렉터리가 앞 4KB 뒤에 있어도 디렉터리 항목으로 판별한다
+        word = _ole_bytes(["WordDocument", "1Table"], dir_sector=14)
+        other = _ole_bytes(["Contents", "Data"], dir_sector=14)
+        hwp = _ole_bytes(["FileHeader", "DocInfo"], dir_sector=14)
+        assert len(word) > SNIFF_SIZE
+        assert sniff(word) == FileType.UNKNOWN
+        assert sniff(other) == FileType.UNKNOWN
+        assert sniff(hwp) == FileType.HWP5
+
+    def test_zip_members(self):
+        assert sniff(_zip_bytes([("Contents/section0.xml", b"<sec/>")])) == (
+            FileType.HWPX
+        )
+        assert sniff(_zip_bytes([("[Content_Types].xml", b"<Types/>")])) == (
+            FileType.UNKNOWN
+        )
+        assert sniff(_zip_bytes([("mimetype", b"application/epub+zip")])) == (
+            FileType.UNKNOWN
+        )
+
+    def test_zip_with_data_descriptor(self):
+        # 앞으로만 쓸 수 있는 스트림에 쓰면 로컬 헤더의 크기가 0으로 남는다
+        class _Unseekable(io.BytesIO):
+            def seekable(self):
+                return False
+
+        data = _zip_bytes(
+            [("mimetype", b"application/hwp+zip"), ("Contents/section0.xml", b"")],
+            stream=_Unseekable(),
+        )
+        assert sniff(data) == FileType.HWPX
+
+    @pytest.mark.parametrize("data", [b"", b"plain text", b"PK\x03\x04"])
+    def test_garbage(self, data):
+        assert sniff(data) == FileType.UNKNOWN
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(OSError):
+            sniff(tmp_path / "missing.hwp")
+
+
+class TestReaderDetection:
+    def test_mislabeled_extension(self, tmp_path):
+        mislabeled = tmp_path / "document.hwp"
+        shutil.copy(SAMPLE_HWPX, mislabeled)
+
+        with Reader(SAMPLE_HWPX) as reader:
+            expected = reader.text
+        with Reader(mislabeled) as reader:
+            assert reader.file_type == FileType.HWPX
+            assert reader.text == expected
+
+    def test_renamed_garbage_is_rejected(self, tmp_path):
+        path = tmp_path / "document.hwp"
+        path.write_bytes(b"not a document")
+
+        reader = Reader(path)
+        assert reader.file_type == FileType.UNKNOWN
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            reader.extract_text()
+
+    def test_foreign_ole_is_rejected(self):
+        reader = Reader(_ole_bytes(["Contents"], dir_sector=14))
+        assert reader.file_type == FileType.UNKNOWN
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            reader.extract_text()
+
+    def test_hwp3_is_rejected(self, tmp_path):
+        path = tmp_path / "old.hwp"
+        path.write_bytes(HWP3_HEAD)
+
+        reader = Reader(path)
+        assert reader.file_type == FileType.HWP3
+        with pytest.raises(ValueError, match="HWP 3.x"):
+            reader.extract_text()
+
+    def test_encrypted_keeps_container_type(self):
+        reader = Reader(_encrypted_hwp())
+        assert reader.file_type == FileType.HWP5
+        assert reader.is_encrypted
+
+    def test_unrecognized_content_falls_back_to_extension(self, tmp_path):
+        # 내용으로 판별하지 못해도 확장자의 형식 리더가 열 수 있으면 읽는다
+        path = tmp_path / "document.hwpx"
+        path.write_bytes(_unusual_hwpx())
+        assert sniff(path) == FileType.UNKNOWN
+
+        reader = Reader(path)
+        assert reader.file_type == FileType.HWPX
+        assert reader.text == Reader(SAMPLE_HWPX).text
+
+        renamed = tmp_path / "document.bin"
+        renamed.write_bytes(path.read_bytes())
+        assert Reader(renamed).file_type == FileType.UNKNOWN
+
+    def test_missing_file_falls_back_to_extension(self, tmp_path):
+        assert Reader(tmp_path / "missing.hwpx").file_type == FileType.HWPX
+
+
+def test_batch_rejects_before_dispatch(tmp_path):
+    garbage = tmp_path / "garbage.hwp"
+    garbage.write_bytes(b"not a document")
+    old = tmp_path / "old.hwp"
+    old.write_bytes(HWP3_HEAD)
+    paths = [SAMPLE_HWPX, garbage, old, SAMPLE_HWP]
+
+    results = list(extract_many(paths, workers=1, ordered=True))
+
+    assert [path for path, _ in results] == paths
+    assert not isinstance(results[0][1], Exception)
+    assert "Unsupported file format" in str(results[1][1])
+    assert "HWP 3.x" in str(results[2][1])
+    assert not isinstance(results[3][1], Exception)
+
+
+def test_batch_sends_unrecognized_documents_to_workers(tmp_path):
+    unusual = tmp_path / "unusual.hwpx"
+    unusual.write_bytes(_unusual_hwpx())
+    garbage = tmp_path / "garbage.hwpx"
+    garbage.write_bytes(b"not a document")
+
+    results = dict(extract_many([unusual, garbage], workers=1))
+
+    assert results[unusual].text == Reader(SAMPLE_HWPX).text
+    assert "Unsupported file format" in str(results[garbage])
+
+
+def test_batch_accepts_hwp_naming_other_ole_streams(tmp_path):
+    path = tmp_path / "mentions.hwp"
+    path.write_bytes(_hwp_mentioning("Workbook", "PowerPoint Document"))
+
+    [(result_path, result)] = list(extract_many([path], workers=1))
+
+    assert result_path == path
+    assert not isinstance(result, Exception)
+    assert result.text == Reader(SAMPLE_HWP).text
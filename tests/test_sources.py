@@ -0,0 +1,136 @@
+"""
+메모리 버퍼 / 파일 객체 입력 테스트
+"""
+
+import io
+import mmap
+
+import pytest
+from pathlib import Path
+
+from hwp_hwpx_parser import (
+    ExtractionCache,
+    FileType,
+    HWP5Reader,
+    HWPXReader,
+    Reader,
+    extract_hwp5,
+    extract_hwpx,
+)
+
+TESTS_DATA_DIR = Path(__file__).parent / "data"
+SAMPLE_HWP = TESTS_DATA_DIR / "sample_notes.hwp"
+SAMPLE_HWPX = TESTS_DATA_DIR / "sample_notes.hwpx"
+
+pytestmark = pytest.mark.skipif(
+    not (SAMPLE_HWP.exists() and SAMPLE_HWPX.exists()),
+    reason="Sample files not available",
+)
+
+
+class _Unseekable(io.RawIOBase):
+    """HTTP 응답처럼 앞으로만 읽을 수 있는 스트림"""
+
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readinto(self, buffer):
+        data = self._stream.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _sources(path: Path):
+    data = path.read_bytes()
+    yield data
+    yield bytearray(data)
+    yield memoryview(data)
+    yield io.BytesIO(data)
+    yield _Unseekable(data)
+
+
+@pytest.mark.parametrize(
+    "path, reader_cls, file_type",
+    [
+        (SAMPLE_HWP, HWP5Reader, FileType.HWP5),
+        (SAMPLE_HWPX, HWPXReader, FileType.HWPX),
+    ],
+)
+class TestInMemorySources:
+    def test_reader_matches_path(self, path, reader_cls, file_type):
+        with Reader(path) as reader:
+            expected = reader.extract_text_with_notes()
+            expected_tables = reader.get_tables()
+
+        for source in _sources(path):
+            with Reader(source) as reader:
+                assert reader.filepath is None
+                assert reader.file_type == file_type
+                result = reader.extract_text_with_notes()
+                assert result.text == expected.text
+                assert result.footnotes == expected.footnotes
+                assert reader.get_tables() == expected_tables
+
+    def test_format_reader_matches_path(self, path, reader_cls, file_type):
+        with reader_cls(path) as reader:
+            expected = reader.extract_text()
+
+        for source in _sources(path):
+            with reader_cls(source) as reader:
+                assert reader.extract_text() == expected
+
+    def test_mmap(self, path, reader_cls, file_type):
+        with Reader(path) as reader:
+            expected = reader.text
+
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            with Reader(mapped) as reader:
+                assert reader.text == expected
+            assert not mapped.closed
+
+    def test_caller_stream_stays_open(self, path, reader_cls, file_type):
+        stream = io.BytesIO(path.read_bytes())
+        reader = reader_cls(stream)
+        with reader:
+            first = reader.extract_text()
+        assert not stream.closed
+
+        # 닫은 뒤 다시 열어도 처음부터 읽는다
+        with reader:
+            assert reader.extract_text() == first
+
+    def test_cache_with_bytes(self, path, reader_cls, file_type, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache")
+        data = path.read_bytes()
+
+        assert cache.file_digest(data) == cache.file_digest(path)
+        with Reader(data, cache=cache) as reader:
+            text = reader.text
+        with Reader(path, cache=cache) as reader:
+            assert reader.text == text
+
+
+def test_extract_functions_accept_bytes():
+    assert extract_hwp5(SAMPLE_HWP.read_bytes()) == extract_hwp5(SAMPLE_HWP)
+    assert extract_hwpx(SAMPLE_HWPX.read_bytes()) == extract_hwpx(SAMPLE_HWPX)
+
+
+def test_unrecognized_content():
+    reader = Reader(b"plain text")
+    assert reader.file_type == FileType.UNKNOWN
+    assert not reader.is_valid
+    with pytest.raises(ValueError):
+        reader.extract_text()
+
+
+def test_unsupported_input_type():
+    with pytest.raises(TypeError):
+        Reader(12345)
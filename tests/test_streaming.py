@@ -0,0 +1,98 @@
+"""
+섹션/문단 단위 스트리밍 (iter_sections / iter_paragraphs) 테스트
+"""
+
+import pytest
+from pathlib import Path
+
+from hwp_hwpx_parser import ExtractOptions, Reader, TextChunk
+
+TESTS_DATA_DIR = Path(__file__).parent / "data"
+SAMPLE_FILES = [
+    TESTS_DATA_DIR / "sample_notes.hwp",
+    TESTS_DATA_DIR / "sample_notes.hwpx",
+    TESTS_DATA_DIR / "표.hwp",
+    TESTS_DATA_DIR / "Table.hwpx",
+]
+
+
+@pytest.fixture(params=SAMPLE_FILES, ids=lambda path: path.name)
+def sample_path(request):
+    if not request.param.exists():
+        pytest.skip("Sample file not available")
+    return request.param
+
+
+class TestIterSections:
+    def test_joined_sections_match_extract_text(self, sample_path):
+        options = ExtractOptions()
+        with Reader(sample_path) as reader:
+            chunks = list(reader.iter_sections(options))
+            expected = reader.extract_text(options)
+
+        assert chunks
+        assert all(isinstance(chunk, TextChunk) for chunk in chunks)
+        assert all(chunk.paragraph_index is None for chunk in chunks)
+        joined = options.paragraph_separator.join(chunk.text for chunk in chunks)
+        assert joined == expected
+
+    def test_notes_match_extract_text_with_notes(self, sample_path):
+        with Reader(sample_path) as reader:
+            chunks = list(reader.iter_sections())
+            expected = reader.extract_text_with_notes()
+
+        footnotes = [note for chunk in chunks for note in chunk.footnotes]
+        endnotes = [note for chunk in chunks for note in chunk.endnotes]
+        assert footnotes == expected.footnotes
+        assert endnotes == expected.endnotes
+
+    def test_section_indices_increase(self, sample_path):
+        with Reader(sample_path) as reader:
+            indices = [chunk.section_index for chunk in reader.iter_sections()]
+
+        assert indices == sorted(set(indices))
+
+
+class TestIterParagraphs:
+    def test_paragraphs_rebuild_sections(self, sample_path):
+        options = ExtractOptions()
+        with Reader(sample_path) as reader:
+            sections = {
+                chunk.section_index: chunk.text
+                for chunk in reader.iter_sections(options)
+            }
+            paragraphs = list(reader.iter_paragraphs(options))
+
+        by_section = {}
+        for chunk in paragraphs:
+            by_section.setdefault(chunk.section_index, []).append(chunk)
+
+        for section_idx, text in sections.items():
+            chunks = by_section[section_idx]
+            assert [c.paragraph_index for c in chunks] == list(range(len(chunks)))
+            # HWP5는 표 앞뒤에 빈 줄을 넣으므로 순서대로 포함되는지만 확인
+            position = 0
+            for chunk in chunks:
+                position = text.index(chunk.text, position) + len(chunk.text)
+
+    def test_note_markers_numbered_consistently(self, sample_path):
+        with Reader(sample_path) as reader:
+            paragraphs = list(reader.iter_paragraphs())
+            expected = reader.extract_text_with_notes()
+
+        footnotes = [note for chunk in paragraphs for note in chunk.footnotes]
+        assert [note.number for note in footnotes] == [
+            note.number for note in expected.footnotes
+        ]
+        for chunk in paragraphs:
+            for note in chunk.footnotes:
+                assert f"[^{note.number}]" in chunk.text
+            for note in chunk.endnotes:
+                assert f"[^e{note.number}]" in chunk.text
+
+    def test_generator_is_lazy(self, sample_path):
+        with Reader(sample_path) as reader:
+            first = next(iter(reader.iter_paragraphs()))
+
+        assert first.section_index == 0
+        assert first.paragraph_index == 0
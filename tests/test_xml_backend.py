@@ -0,0 +1,104 @@
+"""
+HWPX XML 파서 백엔드(ElementTree / lxml) 테스트
+"""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from hwp_hwpx_parser import ExtractOptions, HWPXReader, ImageMarkerStyle, TableStyle
+from hwp_hwpx_parser import xmlbackend
+from hwp_hwpx_parser.xmlbackend import XML_BACKEND_ENV, resolve_xml_backend
+
+TESTS_DATA_DIR = Path(__file__).parent / "data"
+HWPX_FILES = sorted(TESTS_DATA_DIR.glob("*.hwpx"))
+
+requires_lxml = pytest.mark.skipif(
+    not xmlbackend.LXML_AVAILABLE, reason="lxml not installed"
+)
+
+OPTION_VARIANTS = [
+    ExtractOptions(),
+    ExtractOptions(table_style=TableStyle.CSV, image_marker=ImageMarkerStyle.WITH_NAME),
+    ExtractOptions(table_style=TableStyle.INLINE, include_empty_paragraphs=True),
+]
+
+
+def _everything(path, backend):
+    with HWPXReader(path, xml_backend=backend) as reader:
+        assert reader.xml_backend == backend
+        return {
+            "results": [reader.extract_text_with_notes(o) for o in OPTION_VARIANTS],
+            "tables": reader.get_tables(),
+            "memos": reader.get_memos(),
+            "images": [image.filename for image in reader.get_images()],
+        }
+
+
+@requires_lxml
+@pytest.mark.parametrize("path", HWPX_FILES, ids=lambda p: p.name)
+def test_lxml_matches_etree(path):
+    assert _everything(path, "lxml") == _everything(path, "etree")
+
+
+@requires_lxml
+def test_lxml_falls_back_past_parser_limits(tmp_path):
+    # libxml2는 깊은 중첩을 거부하므로 같은 위치부터 ElementTree로 이어 읽는다
+    depth = 3000
+    cell = "<hp:t>끝</hp:t>"
+    for level in reversed(range(depth)):
+        cell = (
+            f"<hp:tbl><hp:tr><hp:tc><hp:subList><hp:p><hp:run><hp:t>c{level}</hp:t>"
+            f"{cell}</hp:run></hp:p></hp:subList></hp:tc></hp:tr></hp:tbl>"
+        )
+    body = (
+        "<hp:p><hp:run><hp:t>앞</hp:t></hp:run></hp:p>"
+        f"<hp:p><hp:run>{cell}</hp:run></hp:p>"
+        "<hp:p><hp:run><hp:t>뒤</hp:t></hp:run></hp:p>"
+    )
+    path = tmp_path / "deep.hwpx"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(
+            "Contents/section0.xml",
+            '<hs:sec xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph" '
+            f'xmlns:hs="s">{body}</hs:sec>',
+        )
+
+    with HWPXReader(path, xml_backend="lxml") as reader:
+        text = reader.extract_text()
+    with HWPXReader(path, xml_backend="etree") as reader:
+        assert text == reader.extract_text()
+    assert text.startswith("앞\n\n| c0c1c2")
+    assert text.endswith("뒤")
+
+
+class TestResolveBackend:
+    def test_default_is_etree(self, monkeypatch):
+        monkeypatch.delenv(XML_BACKEND_ENV, raising=False)
+        assert resolve_xml_backend() == "etree"
+        assert HWPXReader(b"").xml_backend == "etree"
+
+    def test_environment_variable(self, monkeypatch):
+        monkeypatch.setenv(XML_BACKEND_ENV, "etree")
+        assert resolve_xml_backend() == "etree"
+        # 인자가 환경 변수보다 우선한다
+        monkeypatch.setenv(XML_BACKEND_ENV, "bogus")
+        assert resolve_xml_backend("etree") == "etree"
+
+    def test_auto(self, monkeypatch):
+        monkeypatch.setattr(xmlbackend, "LXML_AVAILABLE", False)
+        assert resolve_xml_backend("auto") == "etree"
+        monkeypatch.setattr(xmlbackend, "LXML_AVAILABLE", True)
+        assert resolve_xml_backend("AUTO") == "lxml"
+
+    def test_lxml_not_installed(self, monkeypatch):
+        monkeypatch.setattr(xmlbackend, "LXML_AVAILABLE", False)
+        with pytest.raises(ImportError):
+            resolve_xml_backend("lxml")
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            resolve_xml_backend("sax")
+        with pytest.raises(ValueError):
+            HWPXReader(b"", xml_backend="sax")